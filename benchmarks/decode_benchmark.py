@@ -0,0 +1,135 @@
+"""
+Benchmark de la decodificación de listados de pendientes.
+
+Compara la ruta anterior (json.loads -> lista de dict, con las fechas
+parseadas al usarlas) con la actual (clients.models.loads -> Event con
+__slots__ y fechas ya parseadas) y emite en JSON el tiempo de decodificación
+y la memoria retenida por cada 10k eventos.
+
+Uso:
+    python -m benchmarks.decode_benchmark --events 10000 --repeat 5
+    python -m benchmarks.decode_benchmark --extra-fields 12
+"""
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+from clients.models import JSON_DECODER, loads, parse_datetime, parse_events
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark de decodificación de eventos")
+    parser.add_argument("--events", type=int, default=10000, help="Eventos por respuesta")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones por ruta")
+    parser.add_argument(
+        "--extra-fields",
+        type=int,
+        default=8,
+        help="Campos adicionales por evento que el servicio no usa (nombre, sede, ...)",
+    )
+    parser.add_argument("--output", help="Archivo donde escribir el JSON (por defecto stdout)")
+    return parser.parse_args(argv)
+
+
+def build_payload(events: int, extra_fields: int) -> bytes:
+    """Cuerpo de una página de pendientes con `events` eventos."""
+    now = datetime.now(timezone.utc)
+    results = []
+    for event_id in range(1, events + 1):
+        event: Dict[str, Any] = {
+            "id": event_id,
+            "status": "programado",
+            "start_date": (now - timedelta(seconds=event_id)).isoformat(),
+            "end_date": (now + timedelta(hours=1, seconds=event_id)).isoformat(),
+        }
+        for field in range(extra_fields):
+            event[f"field_{field}"] = f"valor {field} del evento {event_id}"
+        results.append(event)
+    return json.dumps({"count": events, "next": None, "results": results}).encode()
+
+
+def decode_dicts(content: bytes) -> List[Dict[str, Any]]:
+    """Ruta anterior: dict completos; las fechas se parsean al usarlas."""
+    events = json.loads(content).get("results", [])
+    for event in events:
+        parse_datetime(event.get("start_date"))
+        parse_datetime(event.get("end_date"))
+    return events
+
+
+def decode_events(content: bytes) -> List[Any]:
+    """Ruta actual: decodificador rápido y Event con fechas ya parseadas."""
+    return parse_events(loads(content).get("results", []))
+
+
+def measure(decode: Callable[[bytes], List[Any]], content: bytes, repeat: int) -> Dict[str, Any]:
+    """Tiempo de decodificación (sin tracemalloc) y memoria retenida por el resultado."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        decode(content)
+        timings.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    result = decode(content)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        "decode_seconds": {
+            "min": round(min(timings), 4),
+            "median": round(statistics.median(timings), 4),
+        },
+        "retained_bytes": retained,
+        "peak_bytes": peak,
+    }
+
+
+def per_10k(value: float, events: int) -> float:
+    return round(value * 10000 / max(1, events), 4)
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    content = build_payload(args.events, args.extra_fields)
+
+    paths = {"dict": decode_dicts, "event": decode_events}
+    results = {name: measure(decode, content, args.repeat) for name, decode in paths.items()}
+    for stats in results.values():
+        stats["per_10k_events"] = {
+            "decode_seconds": per_10k(stats["decode_seconds"]["median"], args.events),
+            "retained_mb": per_10k(stats["retained_bytes"] / 2**20, args.events),
+        }
+
+    dict_stats, event_stats = results["dict"], results["event"]
+    output = json.dumps(
+        {
+            "config": {**vars(args), "json_decoder": JSON_DECODER, "payload_bytes": len(content)},
+            "paths": results,
+            "speedup": round(
+                dict_stats["decode_seconds"]["median"] / event_stats["decode_seconds"]["median"], 2
+            ),
+            "memory_ratio": round(event_stats["retained_bytes"] / dict_stats["retained_bytes"], 3),
+        },
+        indent=2,
+        ensure_ascii=False,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Backend Django simulado para los benchmarks.
+
+Expone los endpoints que consume BackendAPIClient (pending-start,
+pending-finish, upcoming, start, finish, batch-* y process-event-completion)
+con latencia y tasa de error configurables, además de endpoints de control
+bajo /_bench/ para reiniciar los eventos y consultar los contadores.
+
+Uso:
+    python -m benchmarks.fake_backend --port 8001 --events 1000 --latency-ms 20
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from fastapi import FastAPI, Request, Response
+
+
+@dataclass
+class FakeBackendConfig:
+    """Parámetros del backend simulado."""
+
+    events: int = 500
+    latency_ms: float = 20.0
+    latency_jitter_ms: float = 5.0
+    error_rate: float = 0.0
+    completion_latency_ms: float = 50.0
+    batch_enabled: bool = True
+    page_size: int = 500
+
+
+class FakeBackend:
+    """
+    Sustituto en memoria de los endpoints del backend Django que consume
+    BackendAPIClient, con latencia y tasa de error configurables.
+    """
+
+    def __init__(self, config: FakeBackendConfig):
+        self.config = config
+        self.status: Dict[int, str] = {}
+        self.dates: Dict[int, Dict[str, str]] = {}
+        self.requests: Counter = Counter()
+        self._next_id = 1
+        self.reset()
+
+    def reset(self, events: Optional[int] = None):
+        """
+        Crea `events` eventos programados con start_date y end_date vencidos.
+        Cada reinicio usa IDs nuevos, como eventos distintos en producción, para
+        que la deduplicación del cliente no descarte las transiciones.
+        """
+        count = self.config.events if events is None else events
+        now = datetime.now(timezone.utc)
+        first = self._next_id
+        self._next_id += count
+        self.status = {event_id: "programado" for event_id in range(first, first + count)}
+        self.dates = {
+            event_id: {
+                "start_date": (now - timedelta(minutes=2)).isoformat(),
+                "end_date": (now - timedelta(minutes=1)).isoformat(),
+            }
+            for event_id in self.status
+        }
+
+    def event(self, event_id: int) -> Dict[str, Any]:
+        return {"id": event_id, "status": self.status[event_id], **self.dates[event_id]}
+
+    async def simulate(self, endpoint: str, latency_ms: Optional[float] = None) -> Optional[Response]:
+        """Aplica la latencia configurada y, según la tasa de error, responde 503."""
+        self.requests[endpoint] += 1
+        base = self.config.latency_ms if latency_ms is None else latency_ms
+        delay = max(0.0, base + random.uniform(-1, 1) * self.config.latency_jitter_ms)
+        await asyncio.sleep(delay / 1000)
+        if self.config.error_rate and random.random() < self.config.error_rate:
+            self.requests[f"{endpoint}:error"] += 1
+            return Response(status_code=503)
+        return None
+
+    def page(self, request: Request, status: str, page: int, page_size: int) -> Response:
+        ids = [event_id for event_id, current in self.status.items() if current == status]
+        chunk = ids[(page - 1) * page_size:page * page_size]
+        next_url = None
+        if page * page_size < len(ids):
+            next_url = str(request.url.include_query_params(page=page + 1, page_size=page_size))
+        body = json.dumps(
+            {"count": len(ids), "next": next_url, "results": [self.event(i) for i in chunk]}
+        )
+        etag = '"' + hashlib.md5(body.encode()).hexdigest() + '"'
+        if request.headers.get("if-none-match") == etag:
+            self.requests["not_modified"] += 1
+            return Response(status_code=304)
+        return Response(body, media_type="application/json", headers={"ETag": etag})
+
+    def transition(self, event_id: int, source: str, target: str) -> Dict[str, Any]:
+        if self.status.get(event_id) != source:
+            return {
+                "id": event_id,
+                "success": False,
+                "status": self.status.get(event_id),
+                "error": f"Estado inválido: {self.status.get(event_id)}",
+            }
+        self.status[event_id] = target
+        return {"id": event_id, "success": True, "status": target}
+
+
+def create_app(backend: FakeBackend) -> FastAPI:
+    """Crea la aplicación FastAPI del backend simulado."""
+    app = FastAPI()
+    prefix = "/events/api/events-status"
+
+    @app.get(f"{prefix}/pending-start/")
+    async def pending_start(request: Request, page: int = 1, page_size: int = 0):
+        error = await backend.simulate("pending_start")
+        return error or backend.page(request, "programado", page, page_size or backend.config.page_size)
+
+    @app.get(f"{prefix}/pending-finish/")
+    async def pending_finish(request: Request, page: int = 1, page_size: int = 0):
+        error = await backend.simulate("pending_finish")
+        return error or backend.page(request, "en_progreso", page, page_size or backend.config.page_size)
+
+    @app.get(f"{prefix}/upcoming/")
+    async def upcoming(window_seconds: int = 900):
+        error = await backend.simulate("upcoming")
+        if error:
+            return error
+        return {
+            "results": [
+                backend.event(event_id)
+                for event_id, status in backend.status.items()
+                if status in ("programado", "en_progreso")
+            ]
+        }
+
+    @app.middleware("http")
+    async def count_idempotency_keys(request: Request, call_next):
+        if request.headers.get("idempotency-key"):
+            backend.requests["idempotency_keyed"] += 1
+        return await call_next(request)
+
+    @app.post(prefix + "/{event_id}/start/")
+    async def start(event_id: int):
+        error = await backend.simulate("start")
+        if error:
+            return error
+        result = backend.transition(event_id, "programado", "en_progreso")
+        return result if result["success"] else Response(json.dumps(result), status_code=400)
+
+    @app.post(prefix + "/{event_id}/finish/")
+    async def finish(event_id: int):
+        error = await backend.simulate("finish")
+        if error:
+            return error
+        result = backend.transition(event_id, "en_progreso", "completado")
+        return result if result["success"] else Response(json.dumps(result), status_code=400)
+
+    @app.post(f"{prefix}/batch-start/")
+    async def batch_start(request: Request):
+        if not backend.config.batch_enabled:
+            return Response(status_code=404)
+        error = await backend.simulate("batch_start")
+        if error:
+            return error
+        ids: List[int] = (await request.json()).get("event_ids", [])
+        return {"results": [backend.transition(i, "programado", "en_progreso") for i in ids]}
+
+    @app.post(f"{prefix}/batch-finish/")
+    async def batch_finish(request: Request):
+        if not backend.config.batch_enabled:
+            return Response(status_code=404)
+        error = await backend.simulate("batch_finish")
+        if error:
+            return error
+        ids: List[int] = (await request.json()).get("event_ids", [])
+        return {"results": [backend.transition(i, "en_progreso", "completado") for i in ids]}
+
+    @app.post("/analysis/process-event-completion/")
+    async def completion(request: Request):
+        error = await backend.simulate("completion", backend.config.completion_latency_ms)
+        if error:
+            return error
+        payload = await request.json()
+        return {
+            "message": f"Procesamiento iniciado para evento {payload.get('event_id')}",
+            "total_participants": 1,
+            "successful": 1,
+            "failed": 0,
+            "results": [],
+        }
+
+    @app.post("/_bench/reset")
+    async def bench_reset(events: Optional[int] = None, clear_stats: bool = False):
+        backend.reset(events)
+        if clear_stats:
+            backend.requests.clear()
+        return {"events": len(backend.status)}
+
+    @app.get("/_bench/stats")
+    async def bench_stats():
+        return {"requests": dict(sorted(backend.requests.items()))}
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Backend Django simulado")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--completion-latency-ms", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--no-batch", action="store_true")
+    args = parser.parse_args()
+
+    backend = FakeBackend(
+        FakeBackendConfig(
+            events=args.events,
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            completion_latency_ms=args.completion_latency_ms,
+            batch_enabled=not args.no_batch,
+        )
+    )
+    uvicorn.run(
+        create_app(backend), host=args.host, port=args.port, log_level="warning", access_log=False
+    )
+
+
+if __name__ == "__main__":
+    main()
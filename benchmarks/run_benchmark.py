@@ -0,0 +1,224 @@
+"""
+Benchmark de process_events contra un backend simulado local.
+
+Levanta benchmarks.fake_backend en un proceso aparte (para no compartir el
+GIL con el servicio medido), ejecuta N ticks de process_events
+y emite en JSON el throughput, la latencia p50/p99 por tick, las peticiones
+recibidas por endpoint y el uso de memoria.
+
+Uso:
+    python -m benchmarks.run_benchmark --events 1000 --ticks 5 --latency-ms 20
+    python -m benchmarks.run_benchmark --set PROCESS_EVENTS_CONCURRENT=true
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark de process_events")
+    parser.add_argument("--events", type=int, default=500, help="Eventos vencidos por tick")
+    parser.add_argument("--ticks", type=int, default=5, help="Ticks a medir")
+    parser.add_argument("--warmup", type=int, default=1, help="Ticks de calentamiento")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Latencia del backend")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="Variación de la latencia")
+    parser.add_argument("--completion-latency-ms", type=float, default=50.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fracción de respuestas 503")
+    parser.add_argument("--no-batch", action="store_true", help="El backend no expone batch-*")
+    parser.add_argument("--port", type=int, default=0, help="Puerto del backend (0 = libre)")
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="CLAVE=VALOR",
+        help="Sobrescribe una variable de settings (repetible)",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Mide el pico de memoria con tracemalloc (ralentiza los ticks)",
+    )
+    parser.add_argument("--output", help="Archivo donde escribir el JSON (por defecto stdout)")
+    return parser.parse_args(argv)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def start_backend(args: argparse.Namespace, port: int) -> subprocess.Popen:
+    """Arranca el backend simulado en un subproceso y espera a que responda."""
+    import httpx
+
+    command = [
+        sys.executable, "-m", "benchmarks.fake_backend",
+        "--port", str(port),
+        "--events", str(args.events),
+        "--latency-ms", str(args.latency_ms),
+        "--jitter-ms", str(args.jitter_ms),
+        "--completion-latency-ms", str(args.completion_latency_ms),
+        "--error-rate", str(args.error_rate),
+    ]
+    if args.no_batch:
+        command.append("--no-batch")
+    process = subprocess.Popen(command)
+
+    deadline = time.monotonic() + 15
+    while True:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/_bench/stats", timeout=1)
+            return process
+        except httpx.HTTPError:
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                raise RuntimeError("El backend simulado no arrancó")
+            time.sleep(0.1)
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    # Los módulos del servicio leen settings al importarse
+    from clients.backend_api import backend_client
+    from settings import settings
+    from scheduler.completion_queue import completion_queue
+    from scheduler.jobs.process_events import process_events
+    from scheduler.journal import journal
+    from scheduler.runner import bind_event_loop
+    from scheduler.timing import event_timings
+    import httpx
+
+    bind_event_loop(asyncio.get_running_loop())
+    control = httpx.AsyncClient(base_url=settings.BACKEND_URL)
+    await backend_client.open()
+    if settings.COMPLETION_QUEUE_ENABLED:
+        await completion_queue.start()
+    journal.open()
+
+    durations: List[float] = []
+    summaries: List[Dict[str, Any]] = []
+    peak = None
+    if args.trace_memory:
+        tracemalloc.start()
+    try:
+        for tick in range(args.warmup + args.ticks):
+            await control.post(
+                "/_bench/reset",
+                params={"events": args.events, "clear_stats": tick == args.warmup},
+            )
+            if tick == args.warmup and args.trace_memory:
+                tracemalloc.reset_peak()
+            started = time.perf_counter()
+            summary = await process_events()
+            elapsed = time.perf_counter() - started
+            if tick >= args.warmup:
+                durations.append(elapsed)
+                summaries.append(
+                    {
+                        key: len(value) if isinstance(value, list) else value
+                        for key, value in summary.as_dict().items()
+                    }
+                )
+        if args.trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+
+        # Espera a que la cola de finalización procese todo lo encolado
+        drain_started = time.perf_counter()
+        if settings.COMPLETION_QUEUE_ENABLED:
+            await completion_queue.stop()
+        drain = time.perf_counter() - drain_started
+        completions = completion_queue.stats()
+        requests = (await control.get("/_bench/stats")).json()["requests"]
+    finally:
+        await control.aclose()
+        if args.trace_memory:
+            tracemalloc.stop()
+        journal.close()
+        await backend_client.close()
+
+    transitions = sum(s["started"] + s["finished"] for s in summaries)
+    total = sum(durations)
+    return {
+        "config": {
+            "events": args.events,
+            "ticks": args.ticks,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "completion_latency_ms": args.completion_latency_ms,
+            "error_rate": args.error_rate,
+            "backend_batch": not args.no_batch,
+            "overrides": dict(item.split("=", 1) for item in args.set),
+        },
+        "throughput_transitions_per_second": round(transitions / total, 2) if total else 0.0,
+        "tick_latency_seconds": {
+            "p50": round(percentile(durations, 50), 4),
+            "p99": round(percentile(durations, 99), 4),
+            "mean": round(statistics.fmean(durations), 4) if durations else 0.0,
+            "max": round(max(durations), 4) if durations else 0.0,
+        },
+        "completion_drain_seconds": round(drain, 4),
+        "completion_queue": completions,
+        "timings": event_timings.stats(),
+        "requests": requests,
+        "memory": {
+            "tracemalloc_peak_bytes": peak,
+            "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        },
+        "ticks": summaries,
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    port = args.port or free_port()
+    workdir = tempfile.mkdtemp(prefix="bench-estado-eventos-")
+
+    os.environ["BACKEND_URL"] = f"http://127.0.0.1:{port}"
+    os.environ.setdefault("JOURNAL_PATH", os.path.join(workdir, "journal.db"))
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    # Cada tick reinicia el backend: una precarga del tick anterior quedaría obsoleta
+    os.environ.setdefault("PROCESS_EVENTS_PREFETCH_ENABLED", "false")
+    for item in args.set:
+        key, _, value = item.partition("=")
+        os.environ[key.strip()] = value.strip()
+
+    from logging_config import configure_logging, stop_logging
+
+    configure_logging()
+    process = start_backend(args, port)
+    try:
+        result = asyncio.run(run(args))
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+        stop_logging()
+
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
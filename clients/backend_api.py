@@ -1,10 +1,76 @@
+import asyncio
 import httpx
 import logging
-from typing import List, Dict, Any
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Any, Optional, Tuple
+from clients.models import Event, loads, parse_events
+from clients.idempotency import IdempotencyGuard, idempotency_key
+from clients.resilience import (
+    OPEN,
+    AdaptiveLimiter,
+    CircuitBreaker,
+    CircuitOpenError,
+    TokenBucket,
+    backoff_delay,
+)
+from metrics import (
+    BACKEND_CIRCUIT_STATE,
+    BACKEND_CONCURRENCY_LIMIT,
+    BACKEND_IN_FLIGHT,
+    BACKEND_THROTTLED,
+    BACKEND_REQUEST_LATENCY,
+    BACKEND_RETRIES,
+    BACKEND_SHORT_CIRCUITED,
+    PENDING_FETCHES,
+)
 from settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Respuestas que indican un fallo transitorio del backend
+RETRYABLE_STATUS = {429, 502, 503, 504}
+# Respuestas y errores que garantizan que el backend no procesó la petición
+UNPROCESSED_STATUS = {429, 503}
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Endpoints de escritura sujetos al límite adaptativo y al token bucket
+LIMITED_ENDPOINTS = ("start", "finish", "completion", "batch_start", "batch_finish")
+
+
+def _maybe_processed(error: httpx.HTTPError) -> bool:
+    """Indica si una petición fallida pudo haber sido procesada por el backend."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in (502, 504)
+    return isinstance(error, httpx.TransportError) and not isinstance(error, UNSENT_ERRORS)
+
+
+def _reported_status(data: Any) -> Optional[str]:
+    """Estado del evento incluido en una respuesta de transición, si lo hay."""
+    if not isinstance(data, dict):
+        return None
+    return data.get("status") or data.get("current_status")
+
+
+def _cursor_paginated(url: str) -> bool:
+    """Indica si un enlace `next` usa paginación por cursor (CursorPagination)."""
+    return "cursor" in httpx.URL(url).params
+
+
+@dataclass
+class PendingCache:
+    """Último listado conocido de un endpoint de eventos pendientes."""
+
+    events: Dict[int, Event] = field(default_factory=dict)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    cursor: Optional[str] = None
+    last_from_cache: bool = False
+    requests: int = 0
+    not_modified: int = 0
+    delta: int = 0
+    full: int = 0
+
 
 class BackendAPIClient:
     """Cliente para consumir los endpoints del backend Django."""
@@ -13,6 +79,53 @@ class BackendAPIClient:
         self.base_url = settings.BACKEND_URL
         self.timeout = settings.HTTP_TIMEOUT
         self.headers = self._get_headers()
+        # Cliente HTTP compartido (pool de conexiones keep-alive)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Circuit breaker compartido por todas las peticiones al backend
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.BACKEND_BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=settings.BACKEND_BREAKER_RESET_SECONDS,
+            half_open_max_calls=settings.BACKEND_BREAKER_HALF_OPEN_CALLS,
+        )
+        BACKEND_CIRCUIT_STATE.set_function(
+            lambda: {"closed": 0, "half_open": 1, "open": 2}[self.breaker.state]
+        )
+        # Límite de concurrencia adaptativo por endpoint y tasa máxima opcional
+        self.limiters: Dict[str, AdaptiveLimiter] = {}
+        if settings.BACKEND_ADAPTIVE_LIMIT_ENABLED:
+            for endpoint in LIMITED_ENDPOINTS:
+                limiter = AdaptiveLimiter(
+                    initial=settings.BACKEND_LIMIT_INITIAL,
+                    minimum=settings.BACKEND_LIMIT_MIN,
+                    maximum=settings.BACKEND_LIMIT_MAX,
+                    latency_tolerance=settings.BACKEND_LIMIT_LATENCY_TOLERANCE,
+                    backoff_ratio=settings.BACKEND_LIMIT_BACKOFF_RATIO,
+                )
+                self.limiters[endpoint] = limiter
+                BACKEND_CONCURRENCY_LIMIT.labels(endpoint=endpoint).set_function(
+                    lambda limiter=limiter: limiter.limit
+                )
+                BACKEND_IN_FLIGHT.labels(endpoint=endpoint).set_function(
+                    lambda limiter=limiter: limiter.in_flight
+                )
+        self.rate_limiter: Optional[TokenBucket] = None
+        if settings.BACKEND_RATE_LIMIT_PER_SECOND > 0:
+            self.rate_limiter = TokenBucket(
+                settings.BACKEND_RATE_LIMIT_PER_SECOND, settings.BACKEND_RATE_LIMIT_BURST
+            )
+        # Deduplicación de transiciones por clave de idempotencia
+        self.idempotency = IdempotencyGuard(
+            ttl=settings.IDEMPOTENCY_TTL_SECONDS,
+            max_entries=settings.IDEMPOTENCY_CACHE_MAX_ENTRIES,
+        )
+        # Momento en que el backend rechazó el endpoint batch por transición
+        self._batch_unsupported_at: Dict[str, float] = {}
+        # Caché de los listados pendientes para peticiones condicionales
+        self._pending_cache: Dict[str, PendingCache] = {
+            "start": PendingCache(),
+            "finish": PendingCache(),
+        }
 
     def _get_headers(self) -> Dict[str, str]:
         """Construye los headers para las peticiones."""
@@ -21,51 +134,420 @@ class BackendAPIClient:
         }
         return headers
 
-    async def get_pending_start_events(self) -> List[Dict[str, Any]]:
+    def _build_client(self) -> httpx.AsyncClient:
+        """Crea el cliente HTTP con el pool de conexiones configurado."""
+        limits = httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        )
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers=self.headers,
+            limits=limits,
+            http2=settings.HTTP_HTTP2,
+        )
+
+    async def open(self) -> None:
+        """
+        Abre el pool de conexiones compartido.
+        Se ejecuta al arrancar la aplicación (lifespan de FastAPI).
+        """
+        if self._client is not None and not self._client.is_closed:
+            return
+        self._client = self._build_client()
+        self._client_loop = asyncio.get_running_loop()
+        logger.info(
+            f"Pool HTTP abierto (max_connections={settings.HTTP_MAX_CONNECTIONS}, "
+            f"keepalive_expiry={settings.HTTP_KEEPALIVE_EXPIRY}s, http2={settings.HTTP_HTTP2})"
+        )
+
+    async def close(self) -> None:
+        """
+        Cierra el pool de conexiones compartido.
+        Se ejecuta al apagar la aplicación.
+        """
+        if self._client is not None:
+            if self._client_loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            self._client = None
+            self._client_loop = None
+            logger.info("Pool HTTP cerrado")
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Retorna el cliente compartido, creándolo si es necesario.
+
+        Las conexiones de httpx quedan ligadas al event loop donde se crearon,
+        por lo que si el job se ejecuta en otro loop se abre un pool nuevo.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            self._client = self._build_client()
+            self._client_loop = loop
+        return self._client
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        retry: bool = False,
+        resend: bool = True,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Ejecuta una petición con el cliente compartido registrando su latencia.
+
+        Las peticiones pasan por el circuit breaker; si `retry` es True (sólo
+        para llamadas idempotentes) los errores de red y las respuestas
+        429/502/503/504 se reintentan con backoff exponencial y jitter. Con
+        `resend=False` sólo se reintenta cuando la petición no llegó a procesarse
+        (error de conexión, 429 o 503), nunca tras un timeout de lectura o un 502/504.
+
+        Args:
+            endpoint: Nombre lógico del endpoint (etiqueta de métricas)
+            method: Método HTTP
+            url: Ruta relativa a BACKEND_URL o URL absoluta
+            retry: Permite reintentar la petición
+            resend: Permite reenviar una petición que pudo llegar al backend
+
+        Raises:
+            CircuitOpenError: Si el circuit breaker está abierto.
+        """
+        retries = settings.BACKEND_RETRY_ATTEMPTS if retry else 0
+        retryable_status = RETRYABLE_STATUS if resend else UNPROCESSED_STATUS
+        attempt = 0
+        limiter = self.limiters.get(endpoint)
+        rate_limited = self.rate_limiter is not None and endpoint in LIMITED_ENDPOINTS
+
+        while True:
+            if rate_limited and await self.rate_limiter.acquire():
+                BACKEND_THROTTLED.labels(endpoint=endpoint, reason="rate").inc()
+            if limiter is not None and await limiter.acquire():
+                BACKEND_THROTTLED.labels(endpoint=endpoint, reason="concurrency").inc()
+
+            if not self.breaker.allow_request():
+                if limiter is not None:
+                    limiter.release()
+                BACKEND_SHORT_CIRCUITED.labels(endpoint=endpoint).inc()
+                raise CircuitOpenError(f"Circuit breaker abierto, no se consulta {endpoint}")
+
+            started = time.perf_counter()
+            status = "error"
+            # Señal para el límite adaptativo: None si la petición no llegó a completarse
+            overloaded: Optional[bool] = None
+            response: Optional[httpx.Response] = None
+            try:
+                response = await self._get_client().request(method, url, **kwargs)
+                status = str(response.status_code)
+                overloaded = response.status_code >= 500 or response.status_code == 429
+            except httpx.TransportError as e:
+                overloaded = True
+                self.breaker.record_failure(f"{endpoint}: {e.__class__.__name__}")
+                if (
+                    attempt >= retries
+                    or self.breaker.state == OPEN
+                    or (not resend and not isinstance(e, UNSENT_ERRORS))
+                ):
+                    raise
+            except BaseException:
+                self.breaker.release()
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                BACKEND_REQUEST_LATENCY.labels(endpoint=endpoint, status=status).observe(elapsed)
+                if limiter is not None:
+                    limiter.release(elapsed, overloaded)
+
+            if response is not None:
+                if response.status_code >= 500 or response.status_code == 429:
+                    self.breaker.record_failure(f"{endpoint}: HTTP {response.status_code}")
+                else:
+                    self.breaker.record_success()
+                if (
+                    response.status_code not in retryable_status
+                    or attempt >= retries
+                    or self.breaker.state == OPEN
+                ):
+                    return response
+
+            delay = backoff_delay(
+                attempt,
+                settings.BACKEND_RETRY_BACKOFF_SECONDS,
+                settings.BACKEND_RETRY_MAX_BACKOFF_SECONDS,
+                response.headers.get("Retry-After") if response is not None else None,
+            )
+            attempt += 1
+            BACKEND_RETRIES.labels(endpoint=endpoint).inc()
+            logger.warning(
+                f"Reintentando {endpoint} ({attempt}/{retries}) en {delay:.2f}s "
+                f"(estado: {status})"
+            )
+            await asyncio.sleep(delay)
+
+    async def get_pending_start_events(self) -> List[Event]:
         """
         Obtiene los eventos pendientes de iniciar.
 
         Returns:
             Lista de eventos en estado 'programado' cuyo start_date ya pasó.
+
+        Raises:
+            httpx.HTTPError: Si no se pudo consultar el backend.
         """
-        try:
-            url = f"{self.base_url}/events/api/events-status/pending-start/"
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
-                data = response.json()
-                return data.get("results", [])
-        except httpx.HTTPError as e:
-            logger.error(f"Error al obtener eventos pendientes de inicio: {e}")
-            return []
-        except Exception as e:
-            logger.error(
-                f"Error inesperado al obtener eventos pendientes de inicio: {e}"
-            )
-            return []
+        events: List[Event] = []
+        async for page in self.iter_pending_start_events():
+            events.extend(page)
+        return events
 
-    async def get_pending_finish_events(self) -> List[Dict[str, Any]]:
+    async def get_pending_finish_events(self) -> List[Event]:
         """
         Obtiene los eventos pendientes de finalizar.
 
         Returns:
             Lista de eventos en estado 'en_progreso' cuyo end_date ya pasó.
+
+        Raises:
+            httpx.HTTPError: Si no se pudo consultar el backend.
+        """
+        events: List[Event] = []
+        async for page in self.iter_pending_finish_events():
+            events.extend(page)
+        return events
+
+    async def iter_pending_start_events(self) -> AsyncIterator[List[Event]]:
+        """
+        Recorre por páginas los eventos pendientes de iniciar.
+
+        Yields:
+            Páginas de eventos en estado 'programado' cuyo start_date ya pasó.
+
+        Raises:
+            httpx.HTTPError: Si no se pudo consultar el backend; las páginas ya
+                entregadas son válidas pero el listado quedó incompleto.
+        """
+        url = "/events/api/events-status/pending-start/"
+        async for page in self._iter_pending("start", url):
+            yield page
+
+    async def iter_pending_finish_events(self) -> AsyncIterator[List[Event]]:
+        """
+        Recorre por páginas los eventos pendientes de finalizar.
+
+        Yields:
+            Páginas de eventos en estado 'en_progreso' cuyo end_date ya pasó.
+
+        Raises:
+            httpx.HTTPError: Si no se pudo consultar el backend.
+        """
+        url = "/events/api/events-status/pending-finish/"
+        async for page in self._iter_pending("finish", url):
+            yield page
+
+    async def _iter_pending(self, kind: str, url: str) -> AsyncIterator[List[Event]]:
+        """
+        Consulta un listado de pendientes siguiendo los enlaces `next` de la
+        paginación. Con paginación por cursor cada página se entrega apenas se
+        descarga; con paginación por número de página u offset el listado se
+        descarga completo antes de entregarlo, porque los eventos que se
+        transicionan mientras tanto desplazarían las páginas siguientes.
+
+        La primera página usa peticiones condicionales (If-None-Match /
+        If-Modified-Since) y, si está habilitado, el cursor `updated_since` para
+        recibir sólo los cambios desde la última consulta. El listado se guarda
+        en caché mientras no supere BACKEND_CACHE_MAX_EVENTS eventos; si una
+        respuesta incremental lo supera, el listado se vuelve a descargar completo.
+        """
+        cache = self._pending_cache[kind]
+        headers: Dict[str, str] = {}
+        params: Dict[str, Any] = {"page_size": settings.BACKEND_PAGE_SIZE}
+
+        if settings.BACKEND_CONDITIONAL_FETCH:
+            if cache.etag:
+                headers["If-None-Match"] = cache.etag
+            if cache.last_modified:
+                headers["If-Modified-Since"] = cache.last_modified
+        delta = settings.BACKEND_DELTA_FETCH and cache.cursor is not None
+        if delta:
+            params["updated_since"] = cache.cursor
+
+        cache.requests += 1
+        cache.last_from_cache = False
+        response = await self._request(
+            f"pending_{kind}", "GET", url, retry=True, headers=headers, params=params
+        )
+
+        if response.status_code == 304:
+            cache.not_modified += 1
+            PENDING_FETCHES.labels(phase=kind, result="not_modified").inc()
+            cache.last_from_cache = True
+            for page in self._cached_pages(cache):
+                yield page
+            return
+
+        # Hasta completar el recorrido la caché no es válida para peticiones condicionales
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        cache.etag = None
+        cache.last_modified = None
+        if delta:
+            cache.delta += 1
+        else:
+            cache.full += 1
+            cache.events = {}
+        PENDING_FETCHES.labels(phase=kind, result="delta" if delta else "full").inc()
+        cacheable = True
+        buffered: List[List[Event]] = []
+
+        while True:
+            response.raise_for_status()
+            data = loads(response.content)
+            results = parse_events(data.get("results", []))
+
+            if delta:
+                # Respuesta incremental: aplicar cambios sobre el listado conocido
+                for event_id in data.get("removed", []):
+                    cache.events.pop(event_id, None)
+            if cacheable:
+                for event in results:
+                    cache.events[event.id] = event
+                if len(cache.events) > settings.BACKEND_CACHE_MAX_EVENTS:
+                    # Listado demasiado grande: no se mantiene en memoria
+                    cacheable = False
+                    cache.events = {}
+                    cache.cursor = None
+                    if delta:
+                        # Sin el listado base los cambios no bastan: se descarga completo
+                        break
+
+            # Las respuestas incrementales se entregan al final sobre el listado completo
+            if results and not delta:
+                buffered.append(results)
+
+            next_url = data.get("next")
+            # Con paginación por número/offset, las transiciones ya despachadas
+            # desplazarían las páginas siguientes: se entrega al final del recorrido
+            if not next_url or _cursor_paginated(next_url):
+                for page in buffered:
+                    yield page
+                buffered = []
+            if not next_url:
+                break
+            response = await self._request(f"pending_{kind}", "GET", next_url, retry=True)
+
+        if delta and not cacheable:
+            async for page in self._iter_pending(kind, url):
+                yield page
+            return
+
+        if cacheable:
+            if settings.BACKEND_CONDITIONAL_FETCH:
+                cache.etag = etag
+                cache.last_modified = last_modified
+            if settings.BACKEND_DELTA_FETCH:
+                cache.cursor = data.get("cursor")
+
+        if delta:
+            for page in self._cached_pages(cache):
+                yield page
+
+    @staticmethod
+    def _cached_pages(cache: PendingCache) -> List[List[Event]]:
+        """Divide el listado en caché en páginas de BACKEND_PAGE_SIZE eventos."""
+        events = list(cache.events.values())
+        page_size = max(1, settings.BACKEND_PAGE_SIZE)
+        return [events[offset:offset + page_size] for offset in range(0, len(events), page_size)]
+
+    def _forget_pending(self, kind: str, event_id: int):
+        """Quita del listado en caché un evento cuya transición ya se realizó."""
+        self._pending_cache[kind].events.pop(event_id, None)
+
+    def fetched_from_cache(self, kind: str) -> bool:
+        """Indica si la última consulta de pendientes ('start'/'finish') fue un 304."""
+        return self._pending_cache[kind].last_from_cache
+
+    def fetch_stats(self) -> Dict[str, Dict[str, int]]:
+        """Contadores de consultas de pendientes por endpoint."""
+        return {
+            kind: {
+                "requests": cache.requests,
+                "not_modified": cache.not_modified,
+                "delta": cache.delta,
+                "full": cache.full,
+                "cached_events": len(cache.events),
+            }
+            for kind, cache in self._pending_cache.items()
+        }
+
+    def limit_stats(self) -> Dict[str, Any]:
+        """Límite adaptativo por endpoint y estado del token bucket."""
+        return {
+            "adaptive": {
+                endpoint: limiter.snapshot() for endpoint, limiter in self.limiters.items()
+            },
+            "rate": self.rate_limiter.snapshot() if self.rate_limiter is not None else None,
+        }
+
+    async def get_upcoming_events(self, window_seconds: int) -> Optional[List[Event]]:
+        """
+        Obtiene los eventos cuyo start_date o end_date cae dentro de la ventana.
+
+        Args:
+            window_seconds: Tamaño de la ventana hacia adelante, en segundos
+
+        Returns:
+            Lista de eventos en estado 'programado' o 'en_progreso', o None si
+            no se pudo consultar el backend.
         """
         try:
-            url = f"{self.base_url}/events/api/events-status/pending-finish/"
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers)
-                response.raise_for_status()
-                data = response.json()
-                return data.get("results", [])
+            url = "/events/api/events-status/upcoming/"
+            response = await self._request(
+                "upcoming", "GET", url, retry=True, params={"window_seconds": window_seconds}
+            )
+            response.raise_for_status()
+            data = loads(response.content)
+            return parse_events(data.get("results", []))
         except httpx.HTTPError as e:
-            logger.error(f"Error al obtener eventos pendientes de finalización: {e}")
-            return []
+            logger.error(f"Error al obtener eventos próximos: {e}")
+            return None
         except Exception as e:
-            logger.error(
-                f"Error inesperado al obtener eventos pendientes de finalización: {e}"
-            )
-            return []
+            logger.error(f"Error inesperado al obtener eventos próximos: {e}")
+            return None
+
+    def _idempotency_key(self, transition: str, event_id: int) -> str:
+        return idempotency_key(settings.IDEMPOTENCY_KEY_PREFIX, transition, event_id)
+
+    def _keyed(self, transition: str, event_id: int) -> Dict[str, Any]:
+        """
+        Argumentos de _request para una transición: con idempotencia habilitada
+        se adjunta la clave. Los POST sólo se reintentan con IDEMPOTENCY_RETRY_POSTS
+        (el backend debe respetar la clave), y el procesamiento de finalización
+        nunca se reenvía una vez que pudo llegar al backend.
+        """
+        if not settings.IDEMPOTENCY_ENABLED:
+            return {}
+        return {
+            "retry": settings.IDEMPOTENCY_RETRY_POSTS,
+            "resend": transition != "completion",
+            "headers": {
+                settings.IDEMPOTENCY_HEADER: self._idempotency_key(transition, event_id)
+            },
+        }
+
+    async def _deduplicated(
+        self, transition: str, event_id: int, call: Callable[[int], Awaitable[bool]]
+    ) -> bool:
+        """Ejecuta la transición salvo que ya esté en curso o se haya aplicado recientemente."""
+        if not settings.IDEMPOTENCY_ENABLED:
+            return await call(event_id)
+        key = self._idempotency_key(transition, event_id)
+        return await self.idempotency.run(key, lambda: call(event_id))
 
     async def start_event(self, event_id: int) -> bool:
         """
@@ -77,18 +559,21 @@ class BackendAPIClient:
         Returns:
             True si se inició correctamente, False en caso contrario.
         """
+        return await self._deduplicated("start", event_id, self._start_event)
+
+    async def _start_event(self, event_id: int) -> bool:
         try:
-            url = f"{self.base_url}/events/api/events-status/{event_id}/start/"
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, headers=self.headers)
-                response.raise_for_status()
-                data = response.json()
-                if data.get("success"):
-                    logger.info(
-                        f"Evento {event_id} iniciado correctamente. Nuevo estado: {data.get('status')}"
-                    )
-                    return True
-                return False
+            url = f"/events/api/events-status/{event_id}/start/"
+            response = await self._request("start", "POST", url, **self._keyed("start", event_id))
+            response.raise_for_status()
+            data = response.json()
+            if data.get("success"):
+                logger.debug(
+                    "Evento %s iniciado correctamente. Nuevo estado: %s", event_id, data.get("status")
+                )
+                self._forget_pending("start", event_id)
+                return True
+            return False
         except httpx.HTTPError as e:
             logger.error(f"Error al iniciar evento {event_id}: {e}")
             if hasattr(e, "response") and e.response is not None:
@@ -114,32 +599,224 @@ class BackendAPIClient:
         Returns:
             True si se finalizó correctamente, False en caso contrario.
         """
+        return await self._deduplicated("finish", event_id, self._finish_event)
+
+    async def _finish_event(self, event_id: int) -> bool:
+        success, _ = await self.finish_event_status(event_id)
+        return success
+
+    async def finish_event_status(self, event_id: int) -> Tuple[bool, Optional[str]]:
+        """
+        Finaliza un evento y retorna también el estado que reporta el backend.
+
+        Returns:
+            (éxito, estado) donde estado es el campo `status` (o `current_status`)
+            de la respuesta, también en las respuestas de error; None si no se
+            obtuvo respuesta o no lo incluye.
+        """
         try:
-            url = f"{self.base_url}/events/api/events-status/{event_id}/finish/"
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, headers=self.headers)
-                response.raise_for_status()
-                data = response.json()
-                if data.get("success"):
-                    logger.info(
-                        f"Evento {event_id} finalizado correctamente. Nuevo estado: {data.get('status')}"
-                    )
-                    return True
-                return False
+            url = f"/events/api/events-status/{event_id}/finish/"
+            response = await self._request("finish", "POST", url, **self._keyed("finish", event_id))
+            response.raise_for_status()
+            data = response.json()
+            if data.get("success"):
+                logger.debug(
+                    "Evento %s finalizado correctamente. Nuevo estado: %s", event_id, data.get("status")
+                )
+                self._forget_pending("finish", event_id)
+                return True, data.get("status")
+            return False, _reported_status(data)
         except httpx.HTTPError as e:
             logger.error(f"Error al finalizar evento {event_id}: {e}")
+            status = None
             if hasattr(e, "response") and e.response is not None:
                 try:
                     error_data = e.response.json()
                     logger.error(
                         f"Detalle del error: {error_data.get('error', 'Sin detalles')}"
                     )
+                    status = _reported_status(error_data)
                 except:
                     pass
-            return False
+            return False, status
         except Exception as e:
             logger.error(f"Error inesperado al finalizar evento {event_id}: {e}")
+            return False, None
+
+    def batch_available(self, transition: str) -> bool:
+        """
+        Indica si se debe intentar el endpoint batch para la transición.
+        Tras un 404/405 se vuelve a probar pasados BACKEND_BATCH_REPROBE_SECONDS.
+        """
+        if not settings.BACKEND_BATCH_ENABLED:
             return False
+        unsupported_at = self._batch_unsupported_at.get(transition)
+        if unsupported_at is None:
+            return True
+        return time.monotonic() - unsupported_at >= settings.BACKEND_BATCH_REPROBE_SECONDS
+
+    async def start_events(
+        self, event_ids: List[int], timings: Optional[List[Tuple[int, float]]] = None
+    ) -> Dict[int, bool]:
+        """
+        Inicia varios eventos usando el endpoint batch del backend.
+
+        Args:
+            event_ids: IDs de los eventos a iniciar
+            timings: Si se indica, recibe (eventos, segundos) por cada petición enviada
+
+        Returns:
+            Diccionario {event_id: éxito} para cada evento solicitado.
+        """
+        return await self._transition_batch("start", event_ids, self._start_event, timings)
+
+    async def finish_events(
+        self, event_ids: List[int], timings: Optional[List[Tuple[int, float]]] = None
+    ) -> Dict[int, bool]:
+        """
+        Finaliza varios eventos usando el endpoint batch del backend.
+
+        Args:
+            event_ids: IDs de los eventos a finalizar
+            timings: Si se indica, recibe (eventos, segundos) por cada petición enviada
+
+        Returns:
+            Diccionario {event_id: éxito} para cada evento solicitado.
+        """
+        return await self._transition_batch("finish", event_ids, self._finish_event, timings)
+
+    async def _transition_batch(
+        self,
+        transition: str,
+        event_ids: List[int],
+        fallback: Callable[[int], Awaitable[bool]],
+        timings: Optional[List[Tuple[int, float]]] = None,
+    ) -> Dict[int, bool]:
+        """
+        Envía las transiciones en lotes de BACKEND_BATCH_SIZE. Si el backend no
+        expone el endpoint batch (404/405) se usan los endpoints por evento.
+
+        Con idempotencia habilitada, los eventos ya transicionados recientemente
+        no se envían y los que tienen una petición en curso esperan su resultado.
+        """
+        results: Dict[int, bool] = {}
+        waiting: Dict[int, asyncio.Future] = {}
+        pending = list(event_ids)
+        owned: List[int] = []
+
+        if settings.IDEMPOTENCY_ENABLED:
+            pending = []
+            for event_id in event_ids:
+                key = self._idempotency_key(transition, event_id)
+                if self.idempotency.is_recent(key):
+                    results[event_id] = True
+                    continue
+                future = self.idempotency.in_flight(key)
+                if future is not None:
+                    waiting[event_id] = future
+                    continue
+                self.idempotency.begin(key)
+                pending.append(event_id)
+            owned = list(pending)
+
+        try:
+            await self._send_batch(transition, pending, results, fallback, timings)
+        finally:
+            for event_id in owned:
+                self.idempotency.finish(
+                    self._idempotency_key(transition, event_id), results.get(event_id, False)
+                )
+
+        for event_id, future in waiting.items():
+            results[event_id] = await asyncio.shield(future)
+
+        return results
+
+    async def _send_batch(
+        self,
+        transition: str,
+        pending: List[int],
+        results: Dict[int, bool],
+        fallback: Callable[[int], Awaitable[bool]],
+        timings: Optional[List[Tuple[int, float]]] = None,
+    ):
+        """
+        Aplica las transiciones de `pending` y deja el resultado en `results`;
+        la duración de cada petición enviada se agrega a `timings`.
+        """
+        if timings is None:
+            timings = []
+        if self.batch_available(transition):
+            url = f"/events/api/events-status/batch-{transition}/"
+            chunk_size = max(1, settings.BACKEND_BATCH_SIZE)
+
+            while pending:
+                chunk = pending[:chunk_size]
+                payload: Dict[str, Any] = {"event_ids": chunk}
+                if settings.IDEMPOTENCY_ENABLED:
+                    payload["idempotency_keys"] = {
+                        str(event_id): self._idempotency_key(transition, event_id)
+                        for event_id in chunk
+                    }
+                started_at = time.perf_counter()
+                try:
+                    response = await self._request(
+                        f"batch_{transition}",
+                        "POST",
+                        url,
+                        retry=settings.IDEMPOTENCY_ENABLED and settings.IDEMPOTENCY_RETRY_POSTS,
+                        json=payload,
+                    )
+                    if response.status_code in (404, 405):
+                        self._batch_unsupported_at[transition] = time.monotonic()
+                        logger.warning(
+                            f"El backend no soporta {url} ({response.status_code}), "
+                            f"se usarán los endpoints por evento"
+                        )
+                        break
+                    response.raise_for_status()
+                    data = response.json()
+                    self._batch_unsupported_at.pop(transition, None)
+
+                    for item in data.get("results", []):
+                        try:
+                            event_id = int(item.get("id"))
+                        except (TypeError, ValueError):
+                            continue
+                        results[event_id] = bool(item.get("success"))
+                        if results[event_id]:
+                            self._forget_pending(transition, event_id)
+                        if not item.get("success"):
+                            logger.warning(
+                                f"Transición '{transition}' rechazada para evento "
+                                f"{item.get('id')}: {item.get('error', 'Sin detalles')}"
+                            )
+                    for event_id in chunk:
+                        results.setdefault(event_id, False)
+                except httpx.HTTPError as e:
+                    logger.error(f"Error en transición batch '{transition}' de {len(chunk)} evento(s): {e}")
+                    for event_id in chunk:
+                        results[event_id] = False
+                except Exception as e:
+                    logger.error(
+                        f"Error inesperado en transición batch '{transition}' de {len(chunk)} evento(s): {e}"
+                    )
+                    for event_id in chunk:
+                        results[event_id] = False
+                timings.append((len(chunk), time.perf_counter() - started_at))
+                pending = pending[chunk_size:]
+
+        if pending:
+            limit = settings.PROCESS_EVENTS_MAX_CONCURRENCY if settings.PROCESS_EVENTS_CONCURRENT else 1
+            semaphore = asyncio.Semaphore(max(1, limit))
+
+            async def single(event_id: int):
+                async with semaphore:
+                    started_at = time.perf_counter()
+                    results[event_id] = await fallback(event_id)
+                    timings.append((1, time.perf_counter() - started_at))
+
+            await asyncio.gather(*(single(event_id) for event_id in pending))
 
     async def process_event_completion(self, event_id: int) -> bool:
         """
@@ -151,31 +828,54 @@ class BackendAPIClient:
         Returns:
             True si el procesamiento se inició correctamente, False en caso contrario.
         """
+        return await self._deduplicated("completion", event_id, self._process_event_completion)
+
+    async def _process_event_completion(self, event_id: int) -> bool:
         try:
-            url = f"{self.base_url}/analysis/process-event-completion/"
+            url = "/analysis/process-event-completion/"
             payload = {"event_id": event_id}
-            
-            async with httpx.AsyncClient(timeout=60) as client:  # Timeout más largo para este proceso
-                response = await client.post(url, json=payload, headers=self.headers)
-                response.raise_for_status()
-                data = response.json()
-                
-                if "message" in data:
-                    logger.info(f"Procesamiento de finalización iniciado para evento {event_id}")
-                    logger.info(f"Total participantes: {data.get('total_participants', 0)}")
-                    logger.info(f"Exitosos: {data.get('successful', 0)}, Fallidos: {data.get('failed', 0)}")
-                    
-                    # Log detalles de participantes que fallaron
-                    if data.get('failed', 0) > 0:
-                        for result in data.get('results', []):
-                            if not result.get('success'):
-                                logger.warning(f"Falló procesamiento para participante {result.get('participant_name')}: {result.get('error')}")
-                    
-                    return True
-                    
-                return False
-                
+
+            # Timeout más largo para este proceso
+            response = await self._request(
+                "completion",
+                "POST",
+                url,
+                json=payload,
+                timeout=settings.COMPLETION_HTTP_TIMEOUT,
+                **self._keyed("completion", event_id),
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            if "message" in data:
+                logger.debug(
+                    "Procesamiento de finalización del evento %s: %s participantes "
+                    "(exitosos: %s, fallidos: %s)",
+                    event_id,
+                    data.get("total_participants", 0),
+                    data.get("successful", 0),
+                    data.get("failed", 0),
+                )
+
+                # Log detalles de participantes que fallaron
+                if data.get('failed', 0) > 0:
+                    for result in data.get('results', []):
+                        if not result.get('success'):
+                            logger.warning(f"Falló procesamiento para participante {result.get('participant_name')}: {result.get('error')}")
+
+                return True
+
+            return False
+
         except httpx.HTTPError as e:
+            if _maybe_processed(e):
+                # La petición pudo llegar al backend (la unión de videos puede seguir en
+                # curso): se da por iniciada para que nadie la reenvíe
+                logger.warning(
+                    f"Sin respuesta al procesar la finalización del evento {event_id} ({e!r}); "
+                    f"se asume iniciada y no se reenvía"
+                )
+                return True
             logger.error(f"Error HTTP al procesar finalización del evento {event_id}: {e}")
             if hasattr(e, "response") and e.response is not None:
                 try:
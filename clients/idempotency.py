@@ -0,0 +1,104 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+def idempotency_key(prefix: str, transition: str, event_id: int) -> str:
+    """
+    Clave de idempotencia de una transición.
+
+    Es determinista por (evento, transición) para que el backend reconozca la
+    misma operación aunque la envíe otra réplica, un reintento o un tick manual.
+    """
+    return f"{prefix}:{transition}:{event_id}"
+
+
+class IdempotencyGuard:
+    """
+    Deduplicación en proceso de las transiciones por clave de idempotencia.
+
+    - Las peticiones concurrentes con la misma clave comparten un único future:
+      sólo la primera llega al backend y las demás esperan su resultado.
+    - Las transiciones exitosas se recuerdan durante `ttl` segundos y no se
+      vuelven a enviar mientras tanto.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._recent: "OrderedDict[str, float]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._collapsed = 0
+        self._skipped = 0
+
+    def is_recent(self, key: str) -> bool:
+        """Indica si la transición se aplicó hace menos de `ttl` segundos."""
+        expires_at = self._recent.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._recent[key]
+            return False
+        self._skipped += 1
+        return True
+
+    def in_flight(self, key: str) -> Optional[asyncio.Future]:
+        """Future de la petición en curso con la misma clave, si la hay."""
+        future = self._in_flight.get(key)
+        if future is not None:
+            self._collapsed += 1
+        return future
+
+    def begin(self, key: str) -> asyncio.Future:
+        """Registra una petición en curso; las concurrentes esperarán su future."""
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        return future
+
+    def finish(self, key: str, success: bool):
+        """Resuelve la petición en curso y recuerda la clave si tuvo éxito."""
+        future = self._in_flight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(success)
+        if success:
+            self._remember(key)
+
+    def _remember(self, key: str):
+        now = time.monotonic()
+        self._recent[key] = now + self.ttl
+        self._recent.move_to_end(key)
+        # Las claves se insertan en orden de expiración: se podan desde el inicio
+        while self._recent and (
+            len(self._recent) > self.max_entries or next(iter(self._recent.values())) <= now
+        ):
+            self._recent.popitem(last=False)
+
+    async def run(self, key: str, call: Callable[[], Awaitable[bool]]) -> bool:
+        """
+        Ejecuta `call` salvo que la transición se haya aplicado recientemente o
+        ya esté en curso, en cuyo caso retorna ese resultado sin repetirla.
+        """
+        if self.is_recent(key):
+            return True
+        pending = self.in_flight(key)
+        if pending is not None:
+            # shield: cancelar a quien espera no cancela la petición compartida
+            return await asyncio.shield(pending)
+
+        self.begin(key)
+        success = False
+        try:
+            success = await call()
+            return success
+        finally:
+            self.finish(key, success)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ttl_seconds": self.ttl,
+            "recent": len(self._recent),
+            "in_flight": len(self._in_flight),
+            "collapsed": self._collapsed,
+            "skipped_recent": self._skipped,
+        }
@@ -0,0 +1,84 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    # orjson decodifica bastante más rápido que json y devuelve los mismos tipos
+    from orjson import loads as _loads
+
+    JSON_DECODER = "orjson"
+except ImportError:
+    from json import loads as _loads
+
+    JSON_DECODER = "json"
+
+
+def loads(content: bytes) -> Any:
+    """Decodifica un cuerpo JSON con el decodificador más rápido disponible."""
+    return _loads(content)
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """Convierte una fecha ISO 8601 del backend en datetime (o None si no es válida)."""
+    if isinstance(value, datetime):
+        return value
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class Event:
+    """
+    Evento tal como lo usa el servicio: sólo id, estado y fechas ya parseadas.
+
+    Usa __slots__ para que los listados grandes de pendientes ocupen una
+    fracción de lo que ocupan los dict completos devueltos por el backend.
+    """
+
+    __slots__ = ("id", "status", "start_date", "end_date")
+
+    def __init__(
+        self,
+        id: int,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ):
+        self.id = id
+        self.status = status
+        self.start_date = start_date
+        self.end_date = end_date
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Event":
+        return cls(
+            data["id"],
+            data.get("status"),
+            parse_datetime(data.get("start_date")),
+            parse_datetime(data.get("end_date")),
+        )
+
+    def scheduled_at(self, transition: str) -> Optional[datetime]:
+        """Fecha programada de la transición ("start" o "finish")."""
+        return self.start_date if transition == "start" else self.end_date
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "start_date": self.start_date.isoformat() if self.start_date else None,
+            "end_date": self.end_date.isoformat() if self.end_date else None,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"Event(id={self.id!r}, status={self.status!r}, "
+            f"start_date={self.start_date!r}, end_date={self.end_date!r})"
+        )
+
+
+def parse_events(items: List[Dict[str, Any]]) -> List[Event]:
+    """Convierte la lista `results` del backend, descartando elementos sin id."""
+    return [Event.from_dict(item) for item in items if item.get("id") is not None]
@@ -0,0 +1,275 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Estados del circuit breaker
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """Se lanza cuando el circuit breaker está abierto y la petición no se envía."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker para las peticiones al backend.
+
+    Tras `failure_threshold` fallos consecutivos (errores de red o respuestas
+    5xx/429) se abre y rechaza las peticiones durante `reset_timeout` segundos.
+    Luego pasa a semiabierto y deja pasar hasta `half_open_max_calls` peticiones
+    de prueba: si una tiene éxito se cierra, si falla vuelve a abrirse.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, half_open_max_calls: int = 1):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_calls = 0
+        self._rejected = 0
+        self._last_failure: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._half_open_calls = 0
+            logger.info("Circuit breaker semiabierto: se probará el backend")
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Indica si se puede enviar una petición (y reserva un turno de prueba)."""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+            self._half_open_calls += 1
+            return True
+        self._rejected += 1
+        return False
+
+    def record_success(self):
+        if self._state != CLOSED:
+            logger.info("✓ Circuit breaker cerrado: el backend responde nuevamente")
+        self._state = CLOSED
+        self._failures = 0
+        self._half_open_calls = 0
+
+    def record_failure(self, reason: str):
+        self._failures += 1
+        self._last_failure = reason
+        if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != OPEN:
+                logger.warning(
+                    f"Circuit breaker abierto tras {self._failures} fallo(s) consecutivo(s): {reason}"
+                )
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+            self._half_open_calls = 0
+
+    def release(self):
+        """Libera el turno de prueba de una petición cancelada sin resultado."""
+        if self._state == HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Estado del breaker para el health check."""
+        state = self.state
+        return {
+            "state": state,
+            "consecutive_failures": self._failures,
+            "rejected_requests": self._rejected,
+            "last_failure": self._last_failure,
+            "retry_in_seconds": (
+                max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+                if state == OPEN
+                else None
+            ),
+        }
+
+
+class AdaptiveLimiter:
+    """
+    Límite de concurrencia AIMD para un endpoint del backend.
+
+    Cada respuesta correcta con latencia dentro de `latency_tolerance` veces la
+    latencia base suma 1/limit al límite (≈ +1 por ventana completa). Las
+    respuestas 429/5xx y los errores de red lo multiplican por `backoff_ratio`,
+    y una latencia por encima de la tolerancia lo reduce un 10%; las
+    reducciones se aplican a lo sumo una vez por tiempo de respuesta, para que
+    una ráfaga de fallos de la misma ventana cuente una sola vez.
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        minimum: float,
+        maximum: float,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.5,
+    ):
+        self.minimum = max(1.0, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(self.maximum, max(self.minimum, initial))
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._baseline: Optional[float] = None
+        self._rtt: Optional[float] = None
+        self._last_decrease = 0.0
+        self._throttled = 0
+        self._decreases = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _has_capacity(self) -> bool:
+        return self._in_flight < int(self.limit)
+
+    def _wake(self):
+        """Entrega los turnos libres a las peticiones en espera, en orden."""
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> bool:
+        """
+        Reserva un turno, esperando si se alcanzó el límite.
+
+        Returns:
+            True si la petición tuvo que esperar (fue limitada).
+        """
+        if self._has_capacity() and not self._waiters:
+            self._in_flight += 1
+            return False
+
+        self._throttled += 1
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # El turno ya había sido entregado: devolverlo
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        return True
+
+    def release(self, latency: Optional[float] = None, overloaded: Optional[bool] = None):
+        """
+        Libera el turno y ajusta el límite con el resultado de la petición.
+        Sin `overloaded` (petición cancelada o no enviada) no se ajusta.
+        """
+        saturated = self._in_flight >= int(self.limit)
+        self._in_flight -= 1
+
+        if overloaded is not None:
+            now = time.monotonic()
+            if latency is not None:
+                self._rtt = latency if self._rtt is None else 0.8 * self._rtt + 0.2 * latency
+            if overloaded:
+                self._decrease(self.backoff_ratio, now)
+            elif latency is not None:
+                if self._baseline is None or latency < self._baseline:
+                    self._baseline = latency
+                else:
+                    # La base sigue lentamente los cambios legítimos de latencia
+                    self._baseline += (latency - self._baseline) * 0.01
+                if latency > max(self._baseline * self.latency_tolerance, self._baseline + 0.005):
+                    self._decrease(0.9, now)
+                elif saturated:
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+        self._wake()
+
+    def _decrease(self, ratio: float, now: float):
+        if now - self._last_decrease < (self._rtt or 0.0):
+            return
+        self._last_decrease = now
+        self._decreases += 1
+        self.limit = max(self.minimum, self.limit * ratio)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "throttled": self._throttled,
+            "decreases": self._decreases,
+            "baseline_latency_seconds": round(self._baseline, 4) if self._baseline else None,
+        }
+
+
+class TokenBucket:
+    """Limita la tasa de peticiones a `rate` por segundo con ráfagas de hasta `burst`."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._throttled = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> bool:
+        """
+        Consume un token, esperando a que se repongan si no hay.
+
+        Returns:
+            True si la petición tuvo que esperar (fue limitada).
+        """
+        waited = False
+        while True:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return waited
+            if not waited:
+                self._throttled += 1
+                waited = True
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def snapshot(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "throttled": self._throttled,
+        }
+
+
+def backoff_delay(attempt: int, base: float, cap: float, retry_after: Optional[str] = None) -> float:
+    """
+    Calcula la espera antes del reintento `attempt` (desde 0) con backoff
+    exponencial y jitter completo. Respeta `Retry-After` (en segundos) si viene.
+    """
+    if retry_after:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
@@ -0,0 +1,124 @@
+import atexit
+import json
+import logging
+import queue
+import random
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+from settings import settings
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Argumentos que pueden formatearse más tarde sin riesgo de haber cambiado
+_PRIMITIVES = (str, int, float, bool, type(None))
+
+_listener: Optional[QueueListener] = None
+
+
+def structured(sample: bool = False, **fields: Any) -> Dict[str, Any]:
+    """
+    Construye el `extra` de un registro estructurado.
+
+    Los campos se emiten como claves propias en modo JSON y se ignoran en modo
+    texto. Con `sample=True` el registro es un éxito rutinario y se conserva sólo
+    con probabilidad LOG_SUCCESS_SAMPLE_RATE.
+    """
+    return {"fields": fields, "sample": sample}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatea cada registro como un objeto JSON en una sola línea."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            payload.update(fields)
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SuccessSampler(logging.Filter):
+    """Descarta una fracción de los registros marcados como muestreables."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = min(1.0, max(0.0, rate))
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sample", False) or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler que deja el formateo al hilo del listener.
+
+    QueueHandler.prepare formatea el mensaje en el hilo que registra; aquí sólo
+    se hace cuando los argumentos no son inmutables y podrían cambiar antes de
+    que el listener los procese.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args and not all(isinstance(arg, _PRIMITIVES) for arg in record.args):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def configure_logging():
+    """
+    Configura el logging raíz a partir de settings.
+
+    LOG_FORMAT elige texto o JSON. Con LOG_QUEUE_ENABLED los registros se
+    encolan y un QueueListener los escribe desde su propio hilo, de modo que el
+    event loop nunca se bloquea escribiendo en stdout.
+    """
+    global _listener
+
+    handler = logging.StreamHandler()
+    if settings.LOG_FORMAT == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.setLevel(getattr(logging, settings.LOG_LEVEL))
+    # httpx registra cada petición en INFO; sólo se conserva en modo DEBUG
+    if settings.LOG_LEVEL != "DEBUG":
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    sampler = SuccessSampler(settings.LOG_SUCCESS_SAMPLE_RATE)
+    if settings.LOG_QUEUE_ENABLED:
+        if _listener is None:
+            atexit.register(stop_logging)
+        else:
+            _listener.stop()
+        queue_handler = _DeferredQueueHandler(queue.SimpleQueue())
+        queue_handler.addFilter(sampler)
+        root.addHandler(queue_handler)
+        _listener = QueueListener(queue_handler.queue, handler, respect_handler_level=True)
+        _listener.start()
+    else:
+        handler.addFilter(sampler)
+        root.addHandler(handler)
+
+
+def stop_logging():
+    """Vacía la cola de logs y detiene el hilo del listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -4,14 +4,20 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from settings import settings
-from routers import health
+from logging_config import configure_logging
+from routers import admin, health, completions, metrics, scheduler, webhooks
+from clients.backend_api import backend_client
+from scheduler.completion_queue import completion_queue
+from scheduler.jobs.deadline_events import deadline_runner
+from scheduler.jobs.journal_replay import replay_journal
+from scheduler.journal import journal
+from scheduler.leader import leader_elector
+from scheduler.push import push_ingestor
+from scheduler.sharding import shard_assignment
 from scheduler.bootstrap import init_scheduler, shutdown_scheduler
 
 # Configurar logging
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -22,14 +28,37 @@ async def lifespan(app: FastAPI):
     Se ejecuta al iniciar y al cerrar el servidor.
     """
     # Startup
+    if settings.SHARDING_ENABLED and settings.LEADER_ELECTION_ENABLED:
+        # Sólo el líder procesaría su partición: los eventos del resto quedarían sin procesar
+        raise RuntimeError(
+            "SHARDING_ENABLED y LEADER_ELECTION_ENABLED no pueden habilitarse a la vez"
+        )
+
     logger.info("=== Iniciando servicio de estado de eventos ===")
     logger.info(f"Backend URL: {settings.BACKEND_URL}")
     logger.info(
         f"Intervalo del scheduler: {settings.SCHEDULER_INTERVAL_SECONDS} segundos"
     )
 
+    # Abrir el pool de conexiones HTTP compartido
+    await backend_client.open()
+
+    # Iniciar la cola de procesamiento de finalización
+    if settings.COMPLETION_QUEUE_ENABLED:
+        await completion_queue.start()
+
+    # Elección de líder: sólo una instancia ejecuta los ticks. Al tomar el
+    # liderazgo se reejecutan las transiciones que quedaron pendientes en el journal
+    journal.open()
+    leader_elector.on_acquired(replay_journal)
+    await leader_elector.start()
+
     # Inicializar el scheduler
     init_scheduler()
+    if webhooks_enabled and not deadline_runner.is_running:
+        logger.warning(
+            "WEBHOOK_ENABLED requiere SCHEDULER_DEADLINE_ENABLED: las notificaciones se rechazarán"
+        )
 
     logger.info("=== Servicio iniciado correctamente ===")
 
@@ -37,10 +66,24 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("=== Deteniendo servicio de estado de eventos ===")
-    shutdown_scheduler()
+    await shutdown_scheduler()
+    await leader_elector.stop()
+    await completion_queue.stop()
+    journal.close()
+    await backend_client.close()
     logger.info("=== Servicio detenido ===")
 
 
+# Sin secreto cualquiera podría programar transiciones: el webhook no se registra
+webhooks_enabled = settings.WEBHOOK_ENABLED and bool(settings.WEBHOOK_SECRET)
+if settings.WEBHOOK_ENABLED and not settings.WEBHOOK_SECRET:
+    logger.error("WEBHOOK_ENABLED requiere WEBHOOK_SECRET: no se registra POST /webhooks/events")
+
+# Sin token cualquiera podría forzar ticks o pausar el scheduler: /admin no se registra
+admin_enabled = bool(settings.ADMIN_TOKEN)
+if not admin_enabled:
+    logger.warning("ADMIN_TOKEN no está configurado: no se registran los endpoints /admin")
+
 # Crear aplicación FastAPI
 app = FastAPI(
     title="Servicio de Estado de Eventos",
@@ -51,17 +94,34 @@ app = FastAPI(
 
 # Registrar routers
 app.include_router(health.router, tags=["Health"])
+app.include_router(completions.router, tags=["Completions"])
+app.include_router(metrics.router, tags=["Metrics"])
+app.include_router(scheduler.router, tags=["Scheduler"])
+if admin_enabled:
+    app.include_router(admin.router, tags=["Admin"])
+if webhooks_enabled:
+    app.include_router(webhooks.router, tags=["Webhooks"])
 
 
 @app.get("/")
 async def root():
     """Endpoint raíz."""
-    return {
+    info = {
         "service": "Estado de Eventos",
         "version": "1.0.0",
         "status": "running",
         "scheduler_interval_seconds": settings.SCHEDULER_INTERVAL_SECONDS,
+        "pending_fetch": backend_client.fetch_stats(),
+        "idempotency": backend_client.idempotency.stats(),
+        "backend_limits": backend_client.limit_stats(),
+        "leader": leader_elector.stats(),
+        "sharding": shard_assignment.stats(),
     }
+    if settings.SCHEDULER_DEADLINE_ENABLED:
+        info["deadline_scheduler"] = deadline_runner.stats()
+    if webhooks_enabled:
+        info["webhooks"] = push_ingestor.stats()
+    return info
 
 
 if __name__ == "__main__":
@@ -72,4 +132,5 @@ if __name__ == "__main__":
         port=settings.PORT,
         reload=False,  # No usar reload con APScheduler
         log_level=settings.LOG_LEVEL.lower(),
+        log_config=None,  # Los logs de uvicorn pasan por configure_logging
     )
@@ -0,0 +1,119 @@
+from prometheus_client import Counter, Gauge, Histogram
+from settings import settings
+
+# Buckets de duración de tick relativos al intervalo configurado, para poder
+# alertar cuando un tick se acerca a SCHEDULER_INTERVAL_SECONDS
+_interval = settings.SCHEDULER_INTERVAL_SECONDS
+TICK_BUCKETS = sorted(
+    {0.1, 0.5, 1.0, 2.5, 5.0, *(round(_interval * f, 3) for f in (0.25, 0.5, 0.75, 0.9, 1.0, 1.5, 2.0))}
+)
+
+TICK_DURATION = Histogram(
+    "estado_eventos_tick_duration_seconds",
+    "Duración de cada ejecución de process_events",
+    buckets=TICK_BUCKETS,
+)
+TICK_INTERVAL = Gauge(
+    "estado_eventos_tick_interval_seconds",
+    "Intervalo efectivo del job process_events",
+)
+SCHEDULER_RUNS_MISSED = Counter(
+    "estado_eventos_scheduler_runs_missed_total",
+    "Ejecuciones de process_events perdidas u omitidas por el scheduler",
+    ["reason"],
+)
+LAST_SUCCESSFUL_TICK = Gauge(
+    "estado_eventos_last_successful_tick_timestamp_seconds",
+    "Momento (epoch) del último tick completado sin errores",
+)
+BACKLOG = Gauge(
+    "estado_eventos_backlog_events",
+    "Eventos pendientes encontrados en el último tick",
+    ["phase"],
+)
+
+BACKEND_REQUEST_LATENCY = Histogram(
+    "estado_eventos_backend_request_duration_seconds",
+    "Latencia de las peticiones al backend Django",
+    ["endpoint", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+BACKEND_RETRIES = Counter(
+    "estado_eventos_backend_retries_total",
+    "Reintentos de peticiones al backend",
+    ["endpoint"],
+)
+BACKEND_SHORT_CIRCUITED = Counter(
+    "estado_eventos_backend_short_circuited_total",
+    "Peticiones no enviadas por circuit breaker abierto",
+    ["endpoint"],
+)
+BACKEND_CIRCUIT_STATE = Gauge(
+    "estado_eventos_backend_circuit_state",
+    "Estado del circuit breaker (0 cerrado, 1 semiabierto, 2 abierto)",
+)
+BACKEND_CONCURRENCY_LIMIT = Gauge(
+    "estado_eventos_backend_concurrency_limit",
+    "Límite de concurrencia adaptativo por endpoint",
+    ["endpoint"],
+)
+BACKEND_IN_FLIGHT = Gauge(
+    "estado_eventos_backend_in_flight_requests",
+    "Peticiones en curso por endpoint limitado",
+    ["endpoint"],
+)
+BACKEND_THROTTLED = Counter(
+    "estado_eventos_backend_throttled_total",
+    "Peticiones que esperaron por el límite de concurrencia o de tasa",
+    ["endpoint", "reason"],
+)
+PENDING_FETCHES = Counter(
+    "estado_eventos_pending_fetches_total",
+    "Consultas de eventos pendientes por resultado (full, delta, not_modified)",
+    ["phase", "result"],
+)
+
+WEBHOOK_NOTIFICATIONS = Counter(
+    "estado_eventos_webhook_notifications_total",
+    "Notificaciones de eventos recibidas del backend",
+    ["action", "result"],
+)
+
+EVENT_TRANSITIONS = Counter(
+    "estado_eventos_transitions_total",
+    "Transiciones de estado por resultado",
+    ["transition", "outcome"],
+)
+EVENT_LATENESS = Histogram(
+    "estado_eventos_transition_lateness_seconds",
+    "Retraso de cada transición respecto a su start_date/end_date",
+    ["phase"],
+    buckets=(0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0),
+)
+TRANSITION_LATENCY = Histogram(
+    "estado_eventos_transition_backend_duration_seconds",
+    "Latencia de la llamada al backend que aplicó cada transición",
+    ["phase", "mode"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+BATCH_TRANSITION_EVENTS = Counter(
+    "estado_eventos_batch_transition_events_total",
+    "Eventos enviados en las peticiones de transición en lote",
+    ["phase"],
+)
+SLO_BREACHES = Counter(
+    "estado_eventos_lateness_slo_breaches_total",
+    "Transiciones aplicadas con un retraso mayor a SLO_LATENESS_SECONDS",
+    ["phase"],
+)
+COMPLETIONS = Counter(
+    "estado_eventos_completions_total",
+    "Procesamientos de finalización por resultado",
+    ["outcome"],
+)
+COMPLETION_QUEUE_DEPTH = Gauge(
+    "estado_eventos_completion_queue_depth",
+    "Procesamientos de finalización en cola",
+)
+
+TICK_INTERVAL.set(_interval)
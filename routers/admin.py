@@ -0,0 +1,127 @@
+import asyncio
+import hmac
+import logging
+from typing import Optional, Set
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from scheduler.bootstrap import get_scheduler
+from scheduler.jobs.process_events import PHASES, process_events, tick_in_progress
+from scheduler.leader import leader_elector
+from scheduler.monitor import scheduler_monitor
+from scheduler.profiler import tick_profiler
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Ticks manuales lanzados en segundo plano (se conservan para que no los recoja el GC)
+_background_ticks: Set[asyncio.Task] = set()
+
+
+async def require_admin_token(x_admin_token: Optional[str] = Header(None)):
+    """Exige el header X-Admin-Token con el valor de ADMIN_TOKEN (obligatorio)."""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=503, detail="ADMIN_TOKEN no está configurado")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Token de administración inválido")
+
+
+router = APIRouter(prefix="/admin", dependencies=[Depends(require_admin_token)])
+
+
+@router.post("/process-events")
+async def trigger_process_events(
+    phase: str = Query("all", pattern="^(all|start|finish)$"),
+    wait: bool = True,
+):
+    """
+    Ejecuta process_events inmediatamente, sin esperar al próximo tick.
+    Con `phase` se ejecuta sólo el paso de inicio o el de finalización; con
+    `wait=false` el tick corre en segundo plano y la respuesta es inmediata.
+    """
+    if not leader_elector.is_leader:
+        raise HTTPException(status_code=409, detail="Esta instancia no es la líder")
+    if tick_in_progress():
+        raise HTTPException(status_code=409, detail="Ya hay un tick en curso")
+
+    phases = PHASES if phase == "all" else (phase,)
+    logger.info(f"Tick manual solicitado (pasos: {', '.join(phases)})")
+
+    if not wait:
+        task = asyncio.create_task(process_events(phases, source="manual"))
+        _background_ticks.add(task)
+        task.add_done_callback(_background_ticks.discard)
+        return {"status": "accepted", "phases": list(phases)}
+
+    await process_events(phases, source="manual")
+    return {"status": "completed", "phases": list(phases), "report": scheduler_monitor.reports[-1]}
+
+
+@router.post("/scheduler/pause")
+async def pause_process_events():
+    """Pausa el job programado `process_events` (los ticks manuales siguen disponibles)."""
+    scheduler = get_scheduler()
+    if scheduler is None:
+        raise HTTPException(status_code=503, detail="El scheduler no está activo")
+    scheduler.pause_job("process_events")
+    scheduler_monitor.set_paused(True)
+    logger.warning("Job 'process_events' pausado desde /admin")
+    return {"paused": True}
+
+
+@router.post("/scheduler/resume")
+async def resume_process_events():
+    """Reanuda el job programado `process_events`."""
+    scheduler = get_scheduler()
+    if scheduler is None:
+        raise HTTPException(status_code=503, detail="El scheduler no está activo")
+    scheduler.resume_job("process_events")
+    scheduler_monitor.set_paused(False)
+    logger.info("Job 'process_events' reanudado desde /admin")
+    return {"paused": False}
+
+
+@router.get("/ticks")
+async def tick_reports(limit: int = Query(10, ge=1, le=1000)):
+    """Retorna los últimos reportes de tick (duración, contadores y fallos)."""
+    return {"ticks": list(scheduler_monitor.reports)[-limit:]}
+
+
+@router.post("/profiler")
+async def start_profiler(ticks: int = Query(1, ge=1, le=100)):
+    """
+    Perfila los próximos `ticks` ticks de process_events (cProfile y tramos por
+    paso). El resultado se consulta en GET /admin/profiler.
+    """
+    if tick_profiler.state in ("armed", "running"):
+        raise HTTPException(status_code=409, detail="Ya hay un perfilado en curso")
+    tick_profiler.arm(ticks)
+    logger.warning(f"Perfilado solicitado para los próximos {ticks} tick(s)")
+    return {"state": tick_profiler.state, "ticks": ticks}
+
+
+@router.get("/profiler")
+async def profiler_report(
+    top: int = Query(30, ge=1, le=500),
+    sort: str = Query("cumulative", pattern="^(cumulative|tottime)$"),
+):
+    """Estado del perfilado, tramos por paso y las funciones más costosas."""
+    return tick_profiler.report(top=top, sort=sort)
+
+
+@router.get("/profiler/dump")
+async def profiler_dump():
+    """Descarga el perfil completo en formato pstats (p. ej. para snakeviz)."""
+    dump = tick_profiler.dump()
+    if dump is None:
+        raise HTTPException(status_code=404, detail="No hay un perfil completado")
+    return Response(
+        content=dump,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": 'attachment; filename="process_events.prof"'},
+    )
+
+
+@router.delete("/profiler")
+async def cancel_profiler():
+    """Cancela el perfilado pendiente y descarta su resultado."""
+    tick_profiler.disarm()
+    return {"state": tick_profiler.state}
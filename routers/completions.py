@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from scheduler.completion_queue import completion_queue
+
+router = APIRouter()
+
+
+@router.get("/completions/queue")
+async def completion_queue_stats():
+    return completion_queue.stats()
@@ -1,8 +1,9 @@
 from fastapi import APIRouter
+from clients.backend_api import backend_client
 
 router = APIRouter()
 
 
 @router.get("/health")
 async def health_check():
-    return {"status": "ok"}
+    return {"status": "ok", "backend_circuit": backend_client.breaker.snapshot()}
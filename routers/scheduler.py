@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Query
+from scheduler.monitor import scheduler_monitor
+from scheduler.timing import event_timings
+
+router = APIRouter()
+
+
+@router.get("/scheduler")
+async def scheduler_status():
+    return scheduler_monitor.stats()
+
+
+@router.get("/scheduler/timings")
+async def scheduler_timings():
+    return event_timings.stats()
+
+
+@router.get("/scheduler/events")
+async def scheduler_events(limit: int = Query(50, ge=1, le=1000)):
+    return {"events": list(scheduler_monitor.events)[-limit:]}
@@ -0,0 +1,72 @@
+import hashlib
+import hmac
+from datetime import datetime
+from typing import List, Literal, Optional, Union
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, TypeAdapter, ValidationError, model_validator
+from clients.models import Event
+from scheduler.jobs.deadline_events import deadline_runner
+from scheduler.push import REMOVE_ACTIONS, UPSERT_ACTIONS, push_ingestor
+from settings import settings
+
+router = APIRouter(prefix="/webhooks")
+
+
+class EventPayload(BaseModel):
+    id: int
+    status: Optional[str] = None
+    # Una fecha omitida conserva la conocida; null indica que el evento no la tiene
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+
+class EventNotification(BaseModel):
+    action: Literal[UPSERT_ACTIONS + REMOVE_ACTIONS]
+    event: EventPayload
+
+    @model_validator(mode="after")
+    def _require_status(self):
+        # Sin estado no se sabe qué transiciones programar
+        if self.action in UPSERT_ACTIONS and not self.event.status:
+            raise ValueError(f"'{self.action}' requiere event.status")
+        return self
+
+
+_payload = TypeAdapter(Union[EventNotification, List[EventNotification]])
+
+
+def _verify_signature(body: bytes, signature: Optional[str]):
+    """Valida `X-Webhook-Signature: sha256=<hmac>` con WEBHOOK_SECRET (obligatorio)."""
+    if not settings.WEBHOOK_SECRET:
+        raise HTTPException(status_code=503, detail="WEBHOOK_SECRET no está configurado")
+    expected = hmac.new(settings.WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+    if signature is None or not hmac.compare_digest(signature, f"sha256={expected}"):
+        raise HTTPException(status_code=401, detail="Firma del webhook inválida")
+
+
+@router.post("/events")
+async def receive_event_notifications(request: Request):
+    """
+    Recibe una notificación (o una lista) del backend al crear, modificar,
+    reprogramar o eliminar eventos y la aplica a la línea de tiempo.
+    """
+    body = await request.body()
+    _verify_signature(body, request.headers.get("X-Webhook-Signature"))
+
+    if not deadline_runner.is_running:
+        raise HTTPException(status_code=503, detail="El runner de fechas límite no está activo")
+
+    try:
+        payload = _payload.validate_json(body)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+
+    notifications = payload if isinstance(payload, list) else [payload]
+    return push_ingestor.apply(
+        {
+            "action": n.action,
+            "event": Event(**n.event.model_dump()),
+            "fields": n.event.model_fields_set,
+        }
+        for n in notifications
+    )
@@ -1,19 +1,117 @@
+import asyncio
 import logging
+import time
+from typing import Optional
+from apscheduler.events import (
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+)
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import BaseScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from settings import settings
-from scheduler.jobs.process_events import process_events_sync
+from scheduler.jobs.deadline_events import deadline_runner
+from scheduler.jobs.process_events import process_events, wait_for_idle
+from scheduler.monitor import next_interval, scheduler_monitor
+from scheduler.runner import bind_event_loop, run_coroutine
 
 logger = logging.getLogger(__name__)
 
 # Instancia global del scheduler
-scheduler: BackgroundScheduler = None
+scheduler: BaseScheduler = None
+
+# Tick en curso cuando el scheduler corre sobre el event loop de la aplicación
+_current_tick: Optional[asyncio.Task] = None
+
+
+async def _process_events_job():
+    """
+    Job asíncrono ejecutado por AsyncIOScheduler sobre el loop de la aplicación.
+    Registra la tarea en curso para poder esperarla al apagar el servicio y mide
+    la duración del tick para detectar desbordes y adaptar el intervalo.
+    """
+    global _current_tick
+
+    _current_tick = asyncio.current_task()
+    started = time.monotonic()
+    try:
+        summary = await process_events()
+    finally:
+        _current_tick = None
+
+    if summary.skipped:
+        return
+
+    duration = time.monotonic() - started
+    scheduler_monitor.record_tick(duration, summary.backlog)
+    if duration > scheduler_monitor.interval:
+        logger.warning(
+            f"El tick duró {duration:.1f}s y superó el intervalo de "
+            f"{scheduler_monitor.interval:.0f}s (pendientes: {summary.backlog})"
+        )
+
+    # Sin listado completo el backlog no es fiable: se mantiene el intervalo
+    if scheduler_monitor.adaptive and not summary.fetch_failed:
+        _adapt_interval(duration, summary.backlog)
+
+
+def _process_events_job_sync():
+    """
+    Wrapper síncrono del job para el modo `thread`.
+    APScheduler ejecutará esta función.
+    """
+    run_coroutine(_process_events_job())
+
+
+def _adapt_interval(duration: float, backlog: int):
+    """Reprograma el job con el intervalo calculado a partir del último tick."""
+    interval = next_interval(scheduler_monitor.interval, duration, backlog)
+    # reschedule_job reanudaría un job pausado desde /admin
+    if interval == scheduler_monitor.interval or scheduler is None or scheduler_monitor.paused:
+        return
+
+    reason = "backlog" if backlog > 0 else "idle"
+    scheduler.reschedule_job("process_events", trigger=IntervalTrigger(seconds=interval))
+    logger.info(
+        f"Intervalo de 'process_events' ajustado de {scheduler_monitor.interval:.0f}s "
+        f"a {interval:.0f}s ({reason})"
+    )
+    scheduler_monitor.set_interval(interval, reason)
+
+
+def _on_job_event(event: JobEvent):
+    """Registra las ejecuciones perdidas, coalescidas o descartadas por el scheduler."""
+    if event.job_id != "process_events":
+        return
+    if event.code in (EVENT_JOB_SUBMITTED, EVENT_JOB_MAX_INSTANCES):
+        scheduler_monitor.record_run_times(event.scheduled_run_times)
+    if event.code == EVENT_JOB_MISSED:
+        scheduler_monitor.record_event(
+            "missed", scheduled_run_time=event.scheduled_run_time.isoformat()
+        )
+        logger.warning(
+            f"Ejecución de 'process_events' perdida (programada para {event.scheduled_run_time})"
+        )
+    elif event.code == EVENT_JOB_MAX_INSTANCES:
+        scheduler_monitor.record_event(
+            "max_instances", scheduled_run_time=event.scheduled_run_times[-1].isoformat()
+        )
+        logger.warning(
+            "Ejecución de 'process_events' omitida: el tick anterior sigue en curso"
+        )
 
 
 def init_scheduler():
     """
     Inicializa y configura el scheduler de APScheduler.
     Se ejecuta al arrancar la aplicación.
+
+    En modo `asyncio` (por defecto) los jobs son corrutinas que se ejecutan en
+    el event loop de uvicorn; en modo `thread` se usa un BackgroundScheduler
+    cuyos jobs envían sus corrutinas a ese mismo loop.
     """
     global scheduler
 
@@ -23,12 +121,41 @@ def init_scheduler():
 
     logger.info("Inicializando APScheduler...")
 
-    scheduler = BackgroundScheduler()
+    # Los jobs se ejecutan sobre el loop de la aplicación si existe
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    bind_event_loop(loop)
+
+    mode = settings.SCHEDULER_MODE
+    if mode == "asyncio" and loop is None:
+        logger.warning(
+            "No hay un event loop activo, el scheduler se ejecutará en modo 'thread'"
+        )
+        mode = "thread"
+
+    if mode == "asyncio":
+        scheduler = AsyncIOScheduler(event_loop=loop)
+        job_func = _process_events_job
+    else:
+        scheduler = BackgroundScheduler()
+        job_func = _process_events_job_sync
+
+    # Con fechas límite, el job por intervalo queda como reconciliación de respaldo
+    deadline_enabled = settings.SCHEDULER_DEADLINE_ENABLED and loop is not None
+    if settings.SCHEDULER_DEADLINE_ENABLED and loop is None:
+        logger.warning("No hay un event loop activo, se desactiva el modo por fechas límite")
+    interval = (
+        settings.SCHEDULER_RECONCILE_INTERVAL_SECONDS
+        if deadline_enabled
+        else settings.SCHEDULER_INTERVAL_SECONDS
+    )
 
     # Job unificado para procesar eventos (inicio y finalización) de forma secuencial
     scheduler.add_job(
-        func=process_events_sync,
-        trigger=IntervalTrigger(seconds=settings.SCHEDULER_INTERVAL_SECONDS),
+        func=job_func,
+        trigger=IntervalTrigger(seconds=interval),
         id="process_events",
         name="Procesar eventos (inicio y finalización)",
         replace_existing=True,
@@ -37,33 +164,56 @@ def init_scheduler():
         max_instances=1,  # Solo permitir una instancia ejecutándose a la vez
     )
     logger.info(
-        f"Job 'process_events' programado cada {settings.SCHEDULER_INTERVAL_SECONDS} segundos"
+        f"Job 'process_events' programado cada {interval} segundos (modo {mode})"
+    )
+
+    scheduler_monitor.interval = interval
+    # El intervalo de reconciliación no debe acotarse a SCHEDULER_MAX_INTERVAL_SECONDS
+    scheduler_monitor.adaptive = settings.SCHEDULER_ADAPTIVE_ENABLED and not deadline_enabled
+    if settings.SCHEDULER_ADAPTIVE_ENABLED and deadline_enabled:
+        logger.info("Intervalo adaptativo deshabilitado en el modo por fechas límite")
+    scheduler.add_listener(
+        _on_job_event, EVENT_JOB_SUBMITTED | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES
     )
 
     # Iniciar el scheduler
     scheduler.start()
     logger.info("✓ Scheduler iniciado correctamente")
 
+    if deadline_enabled:
+        deadline_runner.start(loop)
+
     return scheduler
 
 
-def shutdown_scheduler():
+async def shutdown_scheduler():
     """
-    Detiene el scheduler de forma ordenada.
+    Detiene el scheduler de forma ordenada esperando al tick en curso.
     Se ejecuta al apagar la aplicación.
     """
     global scheduler
 
     if scheduler is not None:
         logger.info("Deteniendo scheduler...")
-        scheduler.shutdown(wait=True)
+        await deadline_runner.stop()
+        if isinstance(scheduler, AsyncIOScheduler):
+            scheduler.pause()
+            if _current_tick is not None:
+                await asyncio.wait({_current_tick})
+            # Un tick lanzado desde /admin también corre sobre este loop
+            await wait_for_idle()
+            scheduler.shutdown(wait=False)
+        else:
+            # Los jobs del hilo esperan corrutinas que corren en este loop
+            await asyncio.to_thread(scheduler.shutdown, True)
         scheduler = None
+        bind_event_loop(None)
         logger.info("✓ Scheduler detenido")
     else:
         logger.warning("No hay scheduler activo para detener")
 
 
-def get_scheduler() -> BackgroundScheduler:
+def get_scheduler() -> BaseScheduler:
     """
     Retorna la instancia del scheduler.
     """
@@ -0,0 +1,262 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from clients.backend_api import backend_client
+from logging_config import structured
+from metrics import COMPLETIONS, COMPLETION_QUEUE_DEPTH
+from scheduler import journal as journal_entries
+from scheduler.journal import journal
+from scheduler.profiler import tick_profiler
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CompletionJob:
+    """Solicitud de procesamiento de finalización pendiente."""
+
+    event_id: int
+    enqueued_at: float
+    attempts: int = 0
+    # Encolado durante un tick perfilado: su procesamiento se mide en el perfil
+    profiled: bool = False
+
+
+class CompletionQueue:
+    """
+    Cola de trabajo en memoria para `process_event_completion`.
+
+    Los eventos finalizados se encolan y un pool de workers los procesa de
+    forma independiente al tick del scheduler, con reintentos y backoff.
+
+    Con la cola llena el evento queda diferido (su entrada COMPLETION sigue
+    pendiente en el journal) y los workers lo encolan al liberarse espacio; el
+    tick nunca procesa la finalización en línea por desborde.
+    """
+
+    def __init__(self):
+        self.workers = settings.COMPLETION_QUEUE_WORKERS
+        self.max_retries = settings.COMPLETION_QUEUE_MAX_RETRIES
+        self.retry_backoff = settings.COMPLETION_QUEUE_RETRY_BACKOFF_SECONDS
+        self.maxsize = settings.COMPLETION_QUEUE_MAXSIZE
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: List[asyncio.Task] = []
+        self._retry_tasks: set = set()
+        self._in_flight = 0
+        # Eventos que no cupieron en la cola, en orden de llegada
+        self._deferred: deque = deque()
+
+        # Métricas
+        self._enqueued = 0
+        self._processed = 0
+        self._failed = 0
+        self._retried = 0
+        self._deferred_total = 0
+        self._total_latency = 0.0
+        self._last_latency: Optional[float] = None
+        self._max_latency = 0.0
+        COMPLETION_QUEUE_DEPTH.set_function(
+            lambda: self._queue.qsize() if self._queue is not None else 0
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Indica si la cola está activa en el event loop actual."""
+        if self._queue is None or self._loop is None:
+            return False
+        try:
+            return self._loop is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+    async def start(self):
+        """Crea la cola y lanza los workers en el event loop actual."""
+        if self._queue is not None:
+            logger.warning("La cola de procesamiento de finalización ya está iniciada")
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._tasks = [
+            asyncio.create_task(self._worker(n), name=f"completion-worker-{n}")
+            for n in range(max(1, self.workers))
+        ]
+        logger.info(
+            f"Cola de procesamiento de finalización iniciada con {len(self._tasks)} worker(s)"
+        )
+
+    async def stop(self):
+        """
+        Detiene los workers esperando a que la cola se vacíe como máximo
+        COMPLETION_QUEUE_DRAIN_TIMEOUT_SECONDS.
+        """
+        if self._queue is None:
+            return
+
+        try:
+            await asyncio.wait_for(
+                self._queue.join(), timeout=settings.COMPLETION_QUEUE_DRAIN_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Se detiene la cola con {self._queue.qsize()} procesamiento(s) pendiente(s)"
+            )
+        if self._deferred:
+            # Siguen pendientes en el journal: se reejecutan al tomar el liderazgo
+            logger.warning(
+                f"Se detiene la cola con {len(self._deferred)} procesamiento(s) diferido(s)"
+            )
+
+        for task in [*self._tasks, *self._retry_tasks]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._retry_tasks, return_exceptions=True)
+
+        self._tasks = []
+        self._retry_tasks = set()
+        self._deferred.clear()
+        self._queue = None
+        self._loop = None
+        logger.info("Cola de procesamiento de finalización detenida")
+
+    def enqueue(self, event_id: int) -> bool:
+        """
+        Encola el procesamiento de finalización de un evento.
+
+        Returns:
+            True si se encoló o quedó diferido por estar la cola llena, False
+            si la cola está detenida.
+        """
+        if self._queue is None:
+            return False
+
+        if self._deferred or not self._put(event_id):
+            self._deferred.append(event_id)
+            self._deferred_total += 1
+            COMPLETIONS.labels(outcome="deferred").inc()
+            logger.warning(
+                f"Cola de procesamiento llena, se difiere el evento {event_id} "
+                f"({len(self._deferred)} diferido(s))"
+            )
+        return True
+
+    def _put(self, event_id: int) -> bool:
+        try:
+            self._queue.put_nowait(
+                CompletionJob(
+                    event_id=event_id,
+                    enqueued_at=time.monotonic(),
+                    profiled=tick_profiler.active,
+                )
+            )
+        except asyncio.QueueFull:
+            return False
+        self._enqueued += 1
+        return True
+
+    def _refill(self):
+        """Encola los eventos diferidos mientras haya espacio."""
+        while self._deferred and self._put(self._deferred[0]):
+            self._deferred.popleft()
+
+    async def _worker(self, n: int):
+        while True:
+            job = await self._queue.get()
+            self._in_flight += 1
+            try:
+                await self._handle(job)
+            except Exception as e:
+                logger.error(
+                    f"Error inesperado en worker {n} procesando evento {job.event_id}: {e}",
+                    exc_info=True,
+                )
+            finally:
+                self._in_flight -= 1
+                self._queue.task_done()
+                self._refill()
+
+    async def _handle(self, job: CompletionJob):
+        job.attempts += 1
+        with tick_profiler.span("completion_queue", profiled=job.profiled):
+            success = await backend_client.process_event_completion(job.event_id)
+
+        if success:
+            latency = time.monotonic() - job.enqueued_at
+            self._processed += 1
+            self._total_latency += latency
+            self._last_latency = latency
+            self._max_latency = max(self._max_latency, latency)
+            COMPLETIONS.labels(outcome="success").inc()
+            journal.mark(journal_entries.COMPLETION, [job.event_id], journal_entries.DONE)
+            logger.info(
+                "Procesamiento de finalización iniciado para evento %s (intento %d, latencia %.2fs)",
+                job.event_id,
+                job.attempts,
+                latency,
+                extra=structured(
+                    sample=True,
+                    event_id=job.event_id,
+                    transition="completion",
+                    outcome="success",
+                    mode="queue",
+                    attempts=job.attempts,
+                    latency_seconds=round(latency, 4),
+                ),
+            )
+            return
+
+        if job.attempts <= self.max_retries:
+            delay = self.retry_backoff * (2 ** (job.attempts - 1))
+            self._retried += 1
+            COMPLETIONS.labels(outcome="retried").inc()
+            logger.warning(
+                f"✗ Falló el procesamiento de finalización del evento {job.event_id}, "
+                f"reintento {job.attempts}/{self.max_retries} en {delay:.1f}s"
+            )
+            task = asyncio.create_task(self._requeue_later(job, delay))
+            self._retry_tasks.add(task)
+            task.add_done_callback(self._retry_tasks.discard)
+            return
+
+        self._failed += 1
+        COMPLETIONS.labels(outcome="failed").inc()
+        journal.mark(journal_entries.COMPLETION, [job.event_id], journal_entries.FAILED)
+        logger.error(
+            f"✗ No se pudo iniciar el procesamiento de finalización para evento "
+            f"{job.event_id} tras {job.attempts} intento(s)"
+        )
+
+    async def _requeue_later(self, job: CompletionJob, delay: float):
+        await asyncio.sleep(delay)
+        if self._queue is not None:
+            await self._queue.put(job)
+
+    def stats(self) -> Dict[str, Any]:
+        """Estado actual de la cola para monitoreo."""
+        return {
+            "running": self._queue is not None,
+            "workers": len(self._tasks),
+            "depth": self._queue.qsize() if self._queue is not None else 0,
+            "in_flight": self._in_flight,
+            "pending_retries": len(self._retry_tasks),
+            "enqueued": self._enqueued,
+            "processed": self._processed,
+            "failed": self._failed,
+            "retried": self._retried,
+            "deferred": len(self._deferred),
+            "deferred_total": self._deferred_total,
+            "avg_latency_seconds": (
+                self._total_latency / self._processed if self._processed else None
+            ),
+            "last_latency_seconds": self._last_latency,
+            "max_latency_seconds": self._max_latency,
+        }
+
+
+# Singleton de la cola
+completion_queue = CompletionQueue()
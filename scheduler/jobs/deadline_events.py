@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from clients.backend_api import backend_client
+from clients.models import Event
+from scheduler.jobs.process_events import (
+    TickSummary,
+    report_summary,
+    run_finish_transitions,
+    run_start_transitions,
+)
+from scheduler.journal import journal
+from scheduler.leader import leader_elector
+from scheduler.sharding import shard_assignment
+from scheduler.timeline import FINISH, START, EventTimeline, timeline
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineRunner:
+    """
+    Ejecuta las transiciones en el momento exacto de su fecha límite.
+
+    Refresca periódicamente la línea de tiempo con los eventos próximos del
+    backend y duerme hasta la siguiente fecha límite. El job por intervalo
+    `process_events` se mantiene como reconciliación de respaldo.
+    """
+
+    def __init__(self, event_timeline: EventTimeline):
+        self.timeline = event_timeline
+        self._task: Optional[asyncio.Task] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._last_refresh: Optional[float] = None
+        self._dispatched = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, loop: asyncio.AbstractEventLoop):
+        """Lanza el runner como tarea del event loop de la aplicación."""
+        if self.is_running:
+            logger.warning("El runner de fechas límite ya está iniciado")
+            return
+        self._task = loop.create_task(self._run(), name="deadline-runner")
+        logger.info("✓ Runner de fechas límite iniciado")
+
+    async def stop(self):
+        """Detiene el runner."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        logger.info("✓ Runner de fechas límite detenido")
+
+    async def refresh(self):
+        """Carga en la línea de tiempo los eventos con fecha límite dentro de la ventana."""
+        window = settings.SCHEDULER_DEADLINE_WINDOW_SECONDS
+        events = await backend_client.get_upcoming_events(window)
+        if events is None:
+            return
+
+        # En modo particionado sólo se programan los eventos de esta instancia
+        events = shard_assignment.filter(events, source="deadline")
+        for event in events:
+            self.timeline.upsert_event(event)
+        self.timeline.retain({event.id for event in events}, time.time() + window)
+
+        self._last_refresh = time.time()
+        logger.info(
+            f"Línea de tiempo actualizada: {len(events)} evento(s) próximos, "
+            f"{len(self.timeline)} transición(es) programadas"
+        )
+
+    async def _run(self):
+        self._changed = asyncio.Event()
+        self.timeline.bind(self._changed)
+        next_refresh = 0.0
+
+        while True:
+            try:
+                # Sólo la instancia líder despacha; al asumir el liderazgo se refresca
+                if not leader_elector.is_leader:
+                    next_refresh = 0.0
+                    await asyncio.sleep(settings.LEADER_RENEW_INTERVAL_SECONDS)
+                    continue
+
+                if time.time() >= next_refresh:
+                    await self.refresh()
+                    next_refresh = time.time() + settings.SCHEDULER_DEADLINE_REFRESH_SECONDS
+
+                self._changed.clear()
+                due = self.timeline.pop_due(time.time())
+                if due:
+                    await self._dispatch(due)
+                    continue
+
+                timeout = next_refresh - time.time()
+                next_deadline = self.timeline.next_deadline()
+                if next_deadline is not None:
+                    timeout = min(timeout, next_deadline - time.time())
+
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout=max(0.0, timeout))
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error en el runner de fechas límite: {e}", exc_info=True)
+                await asyncio.sleep(1)
+
+    async def _dispatch(self, due: List[Tuple[str, Event]]):
+        """Despacha las transiciones vencidas: primero inicios, luego finalizaciones."""
+        summary = TickSummary()
+        starts = [event for transition, event in due if transition == START]
+        finishes = [event for transition, event in due if transition == FINISH]
+
+        logger.info(
+            f"Fecha límite alcanzada: {len(starts)} inicio(s), {len(finishes)} finalización(es)"
+        )
+        if starts:
+            await run_start_transitions(summary, starts)
+        if finishes:
+            await run_finish_transitions(summary, finishes)
+
+        self._dispatched += len(due)
+        journal.flush()
+        report_summary(summary, source="deadline")
+
+    def stats(self) -> Dict[str, Any]:
+        """Estado del runner para monitoreo."""
+        return {
+            "running": self.is_running,
+            "last_refresh": self._last_refresh,
+            "dispatched_transitions": self._dispatched,
+            **self.timeline.stats(),
+        }
+
+
+# Singleton del runner
+deadline_runner = DeadlineRunner(timeline)
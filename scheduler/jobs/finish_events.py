@@ -1,6 +1,6 @@
-import asyncio
 import logging
 from clients.backend_api import backend_client
+from scheduler.runner import run_coroutine
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +26,8 @@ async def finish_pending_events():
 
         # Finalizar cada evento
         for event in pending_events:
-            event_id = event.get("id")
-            end_date = event.get("end_date")
+            event_id = event.id
+            end_date = event.end_date
 
             logger.info(
                 f"Intentando finalizar evento {event_id} (fecha fin: {end_date})"
@@ -61,4 +61,4 @@ def finish_pending_events_sync():
     Wrapper síncrono para el job asíncrono.
     APScheduler ejecutará esta función.
     """
-    asyncio.run(finish_pending_events())
+    run_coroutine(finish_pending_events())
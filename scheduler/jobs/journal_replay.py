@@ -0,0 +1,73 @@
+import logging
+from clients.backend_api import backend_client
+from clients.models import Event
+from scheduler import journal as journal_entries
+from scheduler.jobs.process_events import (
+    TickSummary,
+    report_summary,
+    run_start_transitions,
+    tick_exclusive,
+    trigger_completion,
+)
+from scheduler.journal import journal
+
+logger = logging.getLogger(__name__)
+
+# Estado del evento una vez finalizado
+COMPLETED = "completado"
+
+
+async def replay_journal():
+    """
+    Vuelve a ejecutar las entradas que quedaron pendientes en el journal
+    (p. ej. si el proceso murió entre `finish_event` y el procesamiento de
+    finalización). Se ejecuta cada vez que la instancia pasa a ser líder: al
+    arrancar, antes del primer tick, y tras tomar el liderazgo de un líder caído.
+    """
+    async with tick_exclusive():
+        await _replay_pending()
+
+
+async def _replay_pending():
+    pending = journal.pending()
+    starts = pending.get(journal_entries.START, [])
+    finishes = pending.get(journal_entries.FINISH, [])
+    completions = pending.get(journal_entries.COMPLETION, [])
+
+    if not (starts or finishes or completions):
+        return
+
+    logger.info(
+        f"Reejecutando journal: {len(starts)} inicio(s), {len(finishes)} finalización(es), "
+        f"{len(completions)} procesamiento(s) de finalización"
+    )
+    summary = TickSummary()
+
+    await run_start_transitions(summary, [Event(event_id) for event_id in starts])
+
+    # El procesamiento de finalización sólo se lanza si el evento quedó finalizado:
+    # porque la finalización se reintenta con éxito o porque el backend reporta que
+    # ya estaba 'completado' antes de la caída
+    finish_set = set(finishes)
+    retry = [event_id for event_id in completions if event_id not in finish_set]
+    for event_id in finishes:
+        success, status = await backend_client.finish_event_status(event_id)
+        if success or status == COMPLETED:
+            summary.finished.append(event_id)
+            journal.mark(journal_entries.FINISH, [event_id], journal_entries.DONE)
+            retry.append(event_id)
+        else:
+            # La finalización y su procesamiento quedan pendientes: se resuelven en el
+            # próximo tick que finalice el evento o en el próximo arranque
+            summary.failed_finish.append(event_id)
+            logger.warning(
+                f"No se pudo confirmar la finalización del evento {event_id} "
+                f"(estado: {status or 'desconocido'}), no se lanza su procesamiento"
+            )
+    journal.flush()
+
+    for event_id in retry:
+        await trigger_completion(summary, event_id)
+
+    journal.flush()
+    report_summary(summary, source="journal_replay")
@@ -1,120 +1,629 @@
 import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+import httpx
 from clients.backend_api import backend_client
+from clients.models import Event
+from logging_config import structured
+from metrics import BACKLOG, COMPLETIONS, EVENT_TRANSITIONS, LAST_SUCCESSFUL_TICK, TICK_DURATION
+from scheduler import journal as journal_entries
+from scheduler.completion_queue import completion_queue
+from scheduler.journal import journal
+from scheduler.leader import leader_elector
+from scheduler.monitor import scheduler_monitor
+from scheduler.priority import TransitionQueue
+from scheduler.profiler import tick_profiler
+from scheduler.sharding import shard_assignment
+from scheduler.timeline import FINISH, START
+from scheduler.timing import event_timings
+from scheduler.runner import run_coroutine
+from settings import settings
 
 logger = logging.getLogger(__name__)
 
+PHASES = (START, FINISH)
 
-async def process_events():
+# Evita que un tick manual se solape con el programado
+_tick_lock = asyncio.Lock()
+
+
+@dataclass
+class TickSummary:
+    """Resultado por evento de una ejecución de process_events."""
+
+    started: List[int] = field(default_factory=list)
+    failed_start: List[int] = field(default_factory=list)
+    finished: List[int] = field(default_factory=list)
+    failed_finish: List[int] = field(default_factory=list)
+    completion_queued: List[int] = field(default_factory=list)
+    completion_ok: List[int] = field(default_factory=list)
+    completion_failed: List[int] = field(default_factory=list)
+    fetches_from_cache: int = 0
+    backlog: int = 0
+    # Pasos cuyo listado de pendientes no se pudo descargar completo
+    fetch_failed: List[str] = field(default_factory=list)
+    skipped: bool = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "started": self.started,
+            "failed_start": self.failed_start,
+            "finished": self.finished,
+            "failed_finish": self.failed_finish,
+            "completion_queued": self.completion_queued,
+            "completion_ok": self.completion_ok,
+            "completion_failed": self.completion_failed,
+            "fetches_from_cache": self.fetches_from_cache,
+            "backlog": self.backlog,
+            "fetch_failed": self.fetch_failed,
+            "skipped": self.skipped,
+        }
+
+
+@dataclass
+class _Prefetch:
+    """Consulta de pendientes del siguiente tick, lanzada al final del actual."""
+
+    phases: Tuple[str, ...]
+    started_at: float
+    task: asyncio.Task
+    # Tick que la lanzó: sus transiciones aplicadas se excluyen al usarla
+    previous: TickSummary
+
+
+_prefetch: Optional[_Prefetch] = None
+
+
+async def _dispatch(
+    events: List[Event],
+    handler: Callable[[int, int, Event], Awaitable[None]],
+):
     """
-    Job principal que ejecuta las tareas de eventos de forma secuencial.
-    1. Primero inicia eventos programados
-    2. Luego finaliza eventos en progreso
+    Ejecuta `handler` para cada evento.
+
+    En modo concurrente las transiciones se lanzan en paralelo limitadas por
+    PROCESS_EVENTS_MAX_CONCURRENCY; en caso contrario se ejecutan en orden.
     """
-    logger.info("=" * 80)
-    logger.info("INICIANDO PROCESAMIENTO DE EVENTOS")
-    logger.info("=" * 80)
+    total = len(events)
 
-    # =============================
-    # PASO 1: Iniciar eventos programados
-    # =============================
-    logger.info("")
-    logger.info("PASO 1/2: Verificando eventos pendientes de inicio...")
-    logger.info("-" * 80)
+    if not settings.PROCESS_EVENTS_CONCURRENT:
+        for idx, event in enumerate(events, 1):
+            await handler(idx, total, event)
+        return
 
-    try:
-        # Obtener eventos pendientes de inicio
-        pending_start = await backend_client.get_pending_start_events()
+    semaphore = asyncio.Semaphore(max(1, settings.PROCESS_EVENTS_MAX_CONCURRENCY))
 
-        if not pending_start:
-            logger.info("  No hay eventos pendientes de inicio")
-        else:
-            logger.info(
-                f"   ✓ Se encontraron {len(pending_start)} evento(s) para iniciar"
+    async def bounded(idx: int, event: Event):
+        async with semaphore:
+            await handler(idx, total, event)
+
+    results = await asyncio.gather(
+        *(bounded(idx, event) for idx, event in enumerate(events, 1)),
+        return_exceptions=True,
+    )
+    for event, result in zip(events, results):
+        if isinstance(result, Exception):
+            logger.error(
+                f"       Error procesando evento {event.id}: {result}",
+                exc_info=result,
             )
 
-            # Iniciar cada evento
-            for idx, event in enumerate(pending_start, 1):
-                event_id = event.get("id")
-                start_date = event.get("start_date")
 
-                logger.info(
-                    f"   [{idx}/{len(pending_start)}] Iniciando evento ID={event_id}"
-                )
-                logger.info(f"       - Fecha programada: {start_date}")
+def _pending_pages(phase: str) -> AsyncIterator[List[Event]]:
+    """Iterador por páginas del listado de pendientes de un paso."""
+    if phase == START:
+        return backend_client.iter_pending_start_events()
+    return backend_client.iter_pending_finish_events()
 
-                success = await backend_client.start_event(event_id)
 
-                if success:
-                    logger.info(f"       Evento {event_id} iniciado correctamente")
-                else:
-                    logger.warning(f"       No se pudo iniciar el evento {event_id}")
+async def _replay(pages: List[List[Event]]) -> AsyncIterator[List[Event]]:
+    for page in pages:
+        yield page
 
-        logger.info("-" * 80)
-        logger.info("✓ PASO 1/2 COMPLETADO")
 
-    except Exception as e:
-        logger.error(f"Error en paso 1 (iniciar eventos): {e}", exc_info=True)
+async def _fetch_all(phases: Tuple[str, ...]) -> Dict[str, List[List[Event]]]:
+    """Descarga completos, en paralelo, los listados de los pasos indicados."""
 
-    # =============================
-    # PASO 2: Finalizar eventos en progreso
-    # =============================
-    logger.info("")
-    logger.info("PASO 2/2: Verificando eventos pendientes de finalización...")
-    logger.info("-" * 80)
+    async def collect(phase: str) -> List[List[Event]]:
+        return [page async for page in _pending_pages(phase)]
 
-    try:
-        # Obtener eventos pendientes de finalización
-        pending_finish = await backend_client.get_pending_finish_events()
+    pages = await asyncio.gather(*(collect(phase) for phase in phases))
+    return dict(zip(phases, pages))
+
+
+def _record_transition(
+    transition: str, event: Event, success: bool, mode: str, latency: float
+):
+    """
+    Mide el retraso y la latencia de la transición y emite un único registro
+    por evento; los éxitos se muestrean.
+    """
+    event_id = event.id
+    scheduled = event.scheduled_at(transition)
+    scheduled_at = scheduled.isoformat() if scheduled is not None else None
+    # En lote, la latencia se registra una vez por petición (ver _record_batch_requests)
+    lateness = event_timings.record(
+        transition, scheduled, latency if mode == "single" else None, success, mode
+    )
+    fields = structured(
+        sample=success,
+        event_id=event_id,
+        transition=transition,
+        outcome="success" if success else "failed",
+        mode=mode,
+        scheduled_at=scheduled_at,
+        lateness_seconds=round(lateness, 3) if lateness is not None else None,
+        backend_latency_seconds=round(latency, 4),
+    )
+    if success:
+        logger.info(
+            "Transición '%s' del evento %s aplicada (fecha programada: %s)",
+            transition, event_id, scheduled_at, extra=fields,
+        )
+    else:
+        logger.warning(
+            "No se pudo aplicar la transición '%s' al evento %s", transition, event_id, extra=fields
+        )
+
+
+async def _start_one(summary: TickSummary, idx: int, total: int, event: Event):
+    """Inicia un evento y registra el resultado en el resumen."""
+    event_id = event.id
+    started_at = time.perf_counter()
+    success = await backend_client.start_event(event_id)
+    latency = time.perf_counter() - started_at
+
+    if success:
+        summary.started.append(event_id)
+    else:
+        summary.failed_start.append(event_id)
+    _record_transition("start", event, success, "single", latency)
+
+
+async def _finish_one(summary: TickSummary, idx: int, total: int, event: Event):
+    """Finaliza un evento y lanza su procesamiento de finalización."""
+    event_id = event.id
+    started_at = time.perf_counter()
+    success = await backend_client.finish_event(event_id)
+    latency = time.perf_counter() - started_at
 
-        if not pending_finish:
-            logger.info("   No hay eventos pendientes de finalización")
+    if success:
+        summary.finished.append(event_id)
+    else:
+        summary.failed_finish.append(event_id)
+    _record_transition("finish", event, success, "single", latency)
+    if success:
+        await trigger_completion(summary, event_id)
+
+
+async def trigger_completion(summary: TickSummary, event_id: int):
+    """Lanza el procesamiento de finalización de un evento ya finalizado."""
+    # Encolar procesamiento de finalización (unión de videos y análisis)
+    if completion_queue.is_running and completion_queue.enqueue(event_id):
+        summary.completion_queued.append(event_id)
+        logger.debug("Procesamiento de finalización encolado para evento %s", event_id)
+        return
+
+    # Sin cola disponible se procesa en línea
+    with tick_profiler.span("completion_inline"):
+        processing_success = await backend_client.process_event_completion(event_id)
+    fields = structured(
+        sample=processing_success,
+        event_id=event_id,
+        transition="completion",
+        outcome="success" if processing_success else "failed",
+        mode="inline",
+    )
+
+    if processing_success:
+        summary.completion_ok.append(event_id)
+        journal.mark(journal_entries.COMPLETION, [event_id], journal_entries.DONE)
+        logger.info("Procesamiento de finalización iniciado para evento %s", event_id, extra=fields)
+    else:
+        summary.completion_failed.append(event_id)
+        journal.mark(journal_entries.COMPLETION, [event_id], journal_entries.FAILED)
+        logger.warning(
+            "No se pudo iniciar el procesamiento de finalización para evento %s",
+            event_id, extra=fields,
+        )
+
+
+def _record_batch_requests(transition: str, timings: List[Tuple[int, float]]):
+    """Registra la latencia de cada petición en lote (no la de cada evento)."""
+    for events, latency in timings:
+        event_timings.record_latency(transition, latency, "batch", events)
+
+
+async def _start_batch(summary: TickSummary, events: List[Event]):
+    """Inicia los eventos mediante el endpoint batch del backend."""
+    timings: List[Tuple[int, float]] = []
+    started_at = time.perf_counter()
+    results = await backend_client.start_events([event.id for event in events], timings)
+    latency = time.perf_counter() - started_at
+    _record_batch_requests("start", timings)
+
+    for event in events:
+        event_id = event.id
+        success = bool(results.get(event_id))
+        if success:
+            summary.started.append(event_id)
         else:
-            logger.info(
-                f"   Se encontraron {len(pending_finish)} evento(s) para finalizar"
-            )
+            summary.failed_start.append(event_id)
+        _record_transition("start", event, success, "batch", latency)
+
+
+async def _finish_batch(summary: TickSummary, events: List[Event]):
+    """Finaliza los eventos mediante el endpoint batch del backend."""
+    timings: List[Tuple[int, float]] = []
+    started_at = time.perf_counter()
+    results = await backend_client.finish_events([event.id for event in events], timings)
+    latency = time.perf_counter() - started_at
+    _record_batch_requests("finish", timings)
+
+    finished = []
+    for event in events:
+        event_id = event.id
+        success = bool(results.get(event_id))
+        if success:
+            summary.finished.append(event_id)
+            finished.append(event)
+        else:
+            summary.failed_finish.append(event_id)
+        _record_transition("finish", event, success, "batch", latency)
+
+    await _dispatch(
+        finished,
+        lambda idx, total, event: trigger_completion(summary, event.id),
+    )
+
+
+async def run_start_transitions(summary: TickSummary, events: List[Event]):
+    """Inicia los eventos (en lote si el backend lo soporta)."""
+    if not events:
+        return
+
+    # Registrar las intenciones en el journal antes de despachar
+    journal.record(journal_entries.START, [event.id for event in events])
+    started, failed = len(summary.started), len(summary.failed_start)
+
+    if backend_client.batch_available("start"):
+        await _start_batch(summary, events)
+    else:
+        await _dispatch(
+            events,
+            lambda idx, total, event: _start_one(summary, idx, total, event),
+        )
+
+    journal.mark(journal_entries.START, summary.started[started:], journal_entries.DONE)
+    journal.mark(journal_entries.START, summary.failed_start[failed:], journal_entries.FAILED)
+
+
+async def run_finish_transitions(summary: TickSummary, events: List[Event]):
+    """Finaliza los eventos (en lote si el backend lo soporta)."""
+    if not events:
+        return
+
+    # La finalización y su procesamiento posterior se registran juntos, de modo
+    # que el procesamiento no se pierda si el proceso muere entre ambos
+    journal.record(
+        journal_entries.FINISH,
+        [event.id for event in events],
+        journal_entries.COMPLETION,
+    )
+    finished, failed = len(summary.finished), len(summary.failed_finish)
+
+    if backend_client.batch_available("finish"):
+        await _finish_batch(summary, events)
+    else:
+        await _dispatch(
+            events,
+            lambda idx, total, event: _finish_one(summary, idx, total, event),
+        )
+
+    journal.mark(journal_entries.FINISH, summary.finished[finished:], journal_entries.DONE)
+    journal.mark(journal_entries.FINISH, summary.failed_finish[failed:], journal_entries.FAILED)
+    journal.mark(
+        journal_entries.COMPLETION, summary.failed_finish[failed:], journal_entries.CANCELLED
+    )
 
-            # Finalizar cada evento
-            for idx, event in enumerate(pending_finish, 1):
-                event_id = event.get("id")
-                end_date = event.get("end_date")
-
-                logger.info(
-                    f"   [{idx}/{len(pending_finish)}] Finalizando evento ID={event_id}"
-                )
-                logger.info(f"       - Fecha programada: {end_date}")
-
-                success = await backend_client.finish_event(event_id)
-
-                if success:
-                    logger.info(f"       Evento {event_id} finalizado correctamente")
-                    
-                    # Iniciar procesamiento de finalización (unión de videos y análisis)
-                    logger.info(f"       Iniciando procesamiento de finalización para evento {event_id}")
-                    processing_success = await backend_client.process_event_completion(event_id)
-                    
-                    if processing_success:
-                        logger.info(f"       ✓ Procesamiento de finalización iniciado para evento {event_id}")
-                    else:
-                        logger.warning(f"       ✗ No se pudo iniciar el procesamiento de finalización para evento {event_id}")
-                        
-                else:
-                    logger.warning(f"       No se pudo finalizar el evento {event_id}")
-
-        logger.info("-" * 80)
-        logger.info("✓ PASO 2/2 COMPLETADO")
 
+def report_summary(summary: TickSummary, source: str = "tick", duration: Optional[float] = None):
+    """Registra el resumen de transiciones de un tick en un único log y en métricas."""
+    EVENT_TRANSITIONS.labels(transition="start", outcome="success").inc(len(summary.started))
+    EVENT_TRANSITIONS.labels(transition="start", outcome="failed").inc(len(summary.failed_start))
+    EVENT_TRANSITIONS.labels(transition="finish", outcome="success").inc(len(summary.finished))
+    EVENT_TRANSITIONS.labels(transition="finish", outcome="failed").inc(len(summary.failed_finish))
+    COMPLETIONS.labels(outcome="queued").inc(len(summary.completion_queued))
+    COMPLETIONS.labels(outcome="success").inc(len(summary.completion_ok))
+    COMPLETIONS.labels(outcome="failed").inc(len(summary.completion_failed))
+
+    errors = bool(
+        summary.failed_start
+        or summary.failed_finish
+        or summary.completion_failed
+        or summary.fetch_failed
+    )
+    report = {
+        "source": source,
+        "duration_seconds": round(duration, 4) if duration is not None else None,
+        "started": len(summary.started),
+        "failed_start": len(summary.failed_start),
+        "finished": len(summary.finished),
+        "failed_finish": len(summary.failed_finish),
+        "completion_ok": len(summary.completion_ok),
+        "completion_queued": len(summary.completion_queued),
+        "completion_failed": len(summary.completion_failed),
+        "fetches_from_cache": summary.fetches_from_cache,
+        "backlog": summary.backlog,
+        "fetch_failed": summary.fetch_failed,
+        "failed_start_ids": summary.failed_start,
+        "failed_finish_ids": summary.failed_finish,
+        "completion_failed_ids": summary.completion_failed,
+    }
+    scheduler_monitor.record_report(report)
+    fields = structured(**report)
+    message = (
+        "Procesamiento de eventos completado (%s) | Iniciados: %d (fallidos: %d) | "
+        "Finalizados: %d (fallidos: %d) | Procesamientos: %d (encolados: %d, fallidos: %d) | "
+        "Consultas desde caché: %d"
+    )
+    args = (
+        source,
+        len(summary.started), len(summary.failed_start),
+        len(summary.finished), len(summary.failed_finish),
+        len(summary.completion_ok), len(summary.completion_queued), len(summary.completion_failed),
+        summary.fetches_from_cache,
+    )
+    if errors:
+        logger.warning(
+            message + " | Listados no descargados: %s | Eventos con errores - inicio: %s, "
+            "finalización: %s, procesamiento: %s",
+            *args, summary.fetch_failed or "-",
+            summary.failed_start, summary.failed_finish, summary.completion_failed,
+            extra=fields,
+        )
+    else:
+        logger.info(message, *args, extra=fields)
+
+
+def tick_exclusive() -> asyncio.Lock:
+    """Lock que impide solaparse con un tick de process_events."""
+    return _tick_lock
+
+
+def tick_in_progress() -> bool:
+    """Indica si hay un tick de process_events en curso."""
+    return _tick_lock.locked()
+
+
+async def wait_for_idle():
+    """Espera a que termine el tick en curso, si lo hay, y cancela la precarga."""
+    async with _tick_lock:
+        prefetch = _take_prefetch_task()
+    if prefetch is not None:
+        prefetch.cancel()
+        await asyncio.gather(prefetch, return_exceptions=True)
+
+
+async def process_events(phases: Iterable[str] = PHASES, source: str = "tick") -> TickSummary:
+    """
+    Job principal que ejecuta las tareas de eventos.
+
+    Los listados de pendientes de inicio y de finalización se descargan en
+    paralelo y sus transiciones se despachan por orden de retraso (la más
+    atrasada primero). La finalización de un evento espera siempre a que su
+    inicio se haya aplicado.
+
+    Args:
+        phases: Pasos a ejecutar ("start", "finish"); por defecto ambos
+        source: Origen del tick para el reporte ("tick", "manual")
+    """
+    summary = TickSummary()
+
+    # Sólo la instancia líder ejecuta las transiciones
+    if not leader_elector.is_leader:
+        logger.info("Instancia en espera (no es líder), se omite el procesamiento de eventos")
+        summary.skipped = True
+        return summary
+
+    async with _tick_lock:
+        await _run_phases(summary, tuple(phase for phase in PHASES if phase in set(phases)), source)
+    return summary
+
+
+def _take_prefetch_task() -> Optional[asyncio.Task]:
+    global _prefetch
+    prefetch, _prefetch = _prefetch, None
+    return prefetch.task if prefetch is not None else None
+
+
+def _start_prefetch(summary: TickSummary, phases: Tuple[str, ...], elapsed: float):
+    """
+    Lanza la consulta del siguiente tick mientras se despacha el final del
+    actual, sólo si ese tick vence antes de PROCESS_EVENTS_PREFETCH_MAX_AGE_SECONDS
+    (o el actual ya superó el intervalo); si no, la precarga se descartaría.
+    """
+    global _prefetch
+    if not settings.PROCESS_EVENTS_PREFETCH_ENABLED or _prefetch is not None:
+        return
+    if scheduler_monitor.interval - elapsed > settings.PROCESS_EVENTS_PREFETCH_MAX_AGE_SECONDS:
+        return
+    logger.debug("Precargando los pendientes del siguiente tick")
+    _prefetch = _Prefetch(
+        phases=phases,
+        started_at=time.monotonic(),
+        task=asyncio.create_task(_fetch_all(phases)),
+        previous=summary,
+    )
+
+
+async def _take_prefetch(phases: Tuple[str, ...]) -> Optional[Dict[str, List[List[Event]]]]:
+    """
+    Retorna los listados precargados por el tick anterior si cubren los mismos
+    pasos y tienen menos de PROCESS_EVENTS_PREFETCH_MAX_AGE_SECONDS; se quitan
+    los eventos que ese tick ya transicionó.
+    """
+    global _prefetch
+    prefetch, _prefetch = _prefetch, None
+    if prefetch is None:
+        return None
+
+    # Se espera aunque se descarte: nunca se consulta el backend en paralelo a la precarga
+    try:
+        pages = await asyncio.shield(prefetch.task)
+    except asyncio.CancelledError:
+        if not prefetch.task.cancelled():
+            raise
+        return None
     except Exception as e:
-        logger.error(f"Error en paso 2 (finalizar eventos): {e}", exc_info=True)
+        logger.error(f"Error en la precarga de eventos pendientes: {e}", exc_info=True)
+        return None
+
+    age = time.monotonic() - prefetch.started_at
+    if prefetch.phases != phases or age > settings.PROCESS_EVENTS_PREFETCH_MAX_AGE_SECONDS:
+        logger.debug("Precarga descartada (pasos distintos o %.1fs de antigüedad)", age)
+        return None
+
+    applied = {START: set(prefetch.previous.started), FINISH: set(prefetch.previous.finished)}
+    return {
+        phase: [[event for event in page if event.id not in applied[phase]] for page in pages[phase]]
+        for phase in phases
+    }
+
+
+async def _spanned(name: str, coroutine: Awaitable[None]):
+    with tick_profiler.span(name):
+        await coroutine
+
+
+async def _dispatch_chunk(summary: TickSummary, queue: TransitionQueue, chunk: List[Tuple[str, Event]]):
+    """Despacha en paralelo los inicios y las finalizaciones de un tramo de la cola."""
+    starts = [event for transition, event in chunk if transition == START]
+    finishes = [event for transition, event in chunk if transition == FINISH]
+    started = len(summary.started)
+
+    steps = []
+    if starts:
+        steps.append(_spanned("transitions_start", run_start_transitions(summary, starts)))
+    if finishes:
+        steps.append(_spanned("transitions_finish", run_finish_transitions(summary, finishes)))
+    results = await asyncio.gather(*steps, return_exceptions=True)
+    queue.complete_starts(starts, set(summary.started[started:]))
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+
+async def _run_transitions(summary: TickSummary, phases: Tuple[str, ...]) -> bool:
+    """
+    Descarga en paralelo los listados de los pasos y despacha sus transiciones
+    por orden de retraso, en tramos de BACKEND_PAGE_SIZE, a medida que llegan
+    las páginas. Los eventos iniciados cuyo end_date ya venció se finalizan en
+    el mismo tick. Retorna False si hubo errores.
+    """
+    started_at = time.perf_counter()
+    queue = TransitionQueue(chain_finish=FINISH in phases)
+    changed = asyncio.Event()
+    drained = asyncio.Event()
+    chunk_size = max(1, settings.BACKEND_PAGE_SIZE)
+    capacity = max(1, settings.BACKEND_PREFETCH_PAGES) * chunk_size
+    totals = {phase: 0 for phase in phases}
+    ok = True
+
+    with tick_profiler.span("prefetch_wait"):
+        prefetched = await _take_prefetch(phases)
+    if prefetched is not None:
+        logger.debug("Usando los pendientes precargados por el tick anterior")
+
+    async def produce(phase: str):
+        nonlocal ok
+        pages = _replay(prefetched[phase]) if prefetched is not None else _pending_pages(phase)
+        try:
+            with tick_profiler.span(f"fetch_{phase}"):
+                async for page in pages:
+                    # No acumular en la cola más de BACKEND_PREFETCH_PAGES páginas
+                    while len(queue) >= capacity:
+                        drained.clear()
+                        await drained.wait()
+                    owned = shard_assignment.filter(page)
+                    totals[phase] += len(owned)
+                    queue.push(phase, owned)
+                    changed.set()
+        except asyncio.CancelledError:
+            raise
+        except httpx.HTTPError as e:
+            logger.error(f"No se pudo descargar el listado de pendientes ({phase}): {e!r}")
+            summary.fetch_failed.append(phase)
+            ok = False
+        except Exception as e:
+            logger.error(f"Error descargando eventos pendientes ({phase}): {e}", exc_info=True)
+            summary.fetch_failed.append(phase)
+            ok = False
+        finally:
+            changed.set()
+
+    producers = [asyncio.create_task(produce(phase)) for phase in phases]
+    try:
+        while True:
+            chunk = queue.pop(chunk_size)
+            drained.set()
+            fetched = all(producer.done() for producer in producers)
+            if not chunk:
+                if fetched:
+                    break
+                changed.clear()
+                await changed.wait()
+                continue
+
+            # Último tramo de un backlog grande: precargar el siguiente tick
+            if fetched and not queue and sum(totals.values()) >= chunk_size:
+                _start_prefetch(summary, phases, time.perf_counter() - started_at)
+            await _dispatch_chunk(summary, queue, chunk)
+
+    except Exception as e:
+        logger.error(f"Error procesando transiciones de eventos: {e}", exc_info=True)
+        ok = False
+    finally:
+        for producer in producers:
+            producer.cancel()
+        await asyncio.gather(*producers, return_exceptions=True)
+
+    for phase, total in totals.items():
+        BACKLOG.labels(phase=phase).set(total)
+        summary.backlog += total
+        if backend_client.fetched_from_cache(phase):
+            summary.fetches_from_cache += 1
+            logger.debug("Listado de '%s' sin cambios (304), se usó la caché", phase)
+        logger.debug("Pendientes de '%s': %d evento(s)", phase, total)
+    return ok
+
+
+async def _run_phases(summary: TickSummary, phases: Tuple[str, ...], source: str):
+    """Ejecuta los pasos solicitados de un tick y registra su resumen."""
+    started_at = time.perf_counter()
+    tick_profiler.begin_tick()
+    try:
+        shard_assignment.begin_tick()
+
+        ok = await _run_transitions(summary, phases) if phases else True
+
+        shard_assignment.end_tick()
+        with tick_profiler.span("journal_flush"):
+            journal.flush()
 
-    # =============================
-    # Resumen final
-    # =============================
-    logger.info("")
-    logger.info("=" * 80)
-    logger.info("PROCESAMIENTO DE EVENTOS COMPLETADO")
-    logger.info("=" * 80)
-    logger.info("")
+        # =============================
+        # Resumen final: un único registro por tick
+        # =============================
+        duration = time.perf_counter() - started_at
+        with tick_profiler.span("report"):
+            report_summary(summary, source=source, duration=duration)
+    finally:
+        tick_profiler.end_tick()
+    TICK_DURATION.observe(duration)
+    if ok:
+        LAST_SUCCESSFUL_TICK.set_to_current_time()
 
 
 def process_events_sync():
@@ -122,4 +631,4 @@ def process_events_sync():
     Wrapper síncrono para el job asíncrono.
     APScheduler ejecutará esta función.
     """
-    asyncio.run(process_events())
+    run_coroutine(process_events())
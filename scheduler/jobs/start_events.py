@@ -1,6 +1,6 @@
-import asyncio
 import logging
 from clients.backend_api import backend_client
+from scheduler.runner import run_coroutine
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +26,8 @@ async def start_pending_events():
 
         # Iniciar cada evento
         for event in pending_events:
-            event_id = event.get("id")
-            start_date = event.get("start_date")
+            event_id = event.id
+            start_date = event.start_date
 
             logger.info(
                 f"Intentando iniciar evento {event_id} (fecha inicio: {start_date})"
@@ -51,4 +51,4 @@ def start_pending_events_sync():
     Wrapper síncrono para el job asíncrono.
     APScheduler ejecutará esta función.
     """
-    asyncio.run(start_pending_events())
+    run_coroutine(start_pending_events())
@@ -0,0 +1,152 @@
+import logging
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Tipos de entrada del journal
+START = "start"
+FINISH = "finish"
+COMPLETION = "completion"
+
+# Estados de una entrada
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class TransitionJournal:
+    """
+    Journal local (SQLite, append-only) de transiciones y procesamientos de
+    finalización.
+
+    Las intenciones se registran antes de despachar, en una sola transacción por
+    lote. Los resultados se acumulan en memoria y se confirman juntos con
+    `flush()` al final de cada tick (group commit). Al arrancar, las entradas
+    que quedaron pendientes se vuelven a ejecutar.
+    """
+
+    def __init__(self, path: str, enabled: bool):
+        self.path = path
+        self.enabled = enabled
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending_updates: List[Tuple[str, float, int, str]] = []
+        self._last_prune = 0.0
+
+    def open(self):
+        """Abre la base de datos y crea el esquema si no existe."""
+        if not self.enabled or self._conn is not None:
+            return
+
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS journal (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        # Una sola intención pendiente por (evento, tipo)
+        self._conn.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS journal_pending
+            ON journal (event_id, kind) WHERE status = 'pending'
+            """
+        )
+        self.prune()
+        logger.info(f"Journal de transiciones abierto en {self.path}")
+
+    def close(self):
+        """Confirma los resultados pendientes y cierra la base de datos."""
+        if self._conn is None:
+            return
+        self.flush()
+        self._conn.close()
+        self._conn = None
+
+    def record(self, kind: str, event_ids: Iterable[int], *extra_kinds: str):
+        """
+        Registra en una sola transacción las intenciones `kind` (y `extra_kinds`)
+        para los eventos, antes de despacharlas.
+        """
+        if self._conn is None:
+            return
+
+        now = time.time()
+        rows = [
+            (event_id, entry_kind, PENDING, now, now)
+            for event_id in event_ids
+            for entry_kind in (kind, *extra_kinds)
+        ]
+        if not rows:
+            return
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO journal (event_id, kind, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def mark(self, kind: str, event_ids: Iterable[int], status: str):
+        """Acumula el resultado de las entradas; se confirma en el próximo `flush()`."""
+        if self._conn is None:
+            return
+        now = time.time()
+        self._pending_updates.extend((status, now, event_id, kind) for event_id in event_ids)
+
+    def flush(self):
+        """Confirma en una sola transacción los resultados acumulados."""
+        if self._conn is None or not self._pending_updates:
+            return
+
+        updates, self._pending_updates = self._pending_updates, []
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "UPDATE journal SET status = ?, updated_at = ? "
+                "WHERE event_id = ? AND kind = ? AND status = 'pending'",
+                updates,
+            )
+
+        if time.time() - self._last_prune > 3600:
+            self.prune()
+
+    def pending(self) -> Dict[str, List[int]]:
+        """Retorna las entradas pendientes agrupadas por tipo."""
+        result: Dict[str, List[int]] = {START: [], FINISH: [], COMPLETION: []}
+        if self._conn is None:
+            return result
+
+        rows = self._conn.execute(
+            "SELECT kind, event_id FROM journal WHERE status = 'pending' ORDER BY id"
+        ).fetchall()
+        for kind, event_id in rows:
+            result.setdefault(kind, []).append(event_id)
+        return result
+
+    def prune(self):
+        """Elimina las entradas resueltas más antiguas que JOURNAL_RETENTION_HOURS."""
+        if self._conn is None:
+            return
+        cutoff = time.time() - settings.JOURNAL_RETENTION_HOURS * 3600
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute(
+                "DELETE FROM journal WHERE status != 'pending' AND updated_at < ?", (cutoff,)
+            )
+        self._last_prune = time.time()
+
+
+# Singleton del journal
+journal = TransitionJournal(settings.JOURNAL_PATH, settings.JOURNAL_ENABLED)
@@ -0,0 +1,269 @@
+import asyncio
+import importlib
+import logging
+import os
+import socket
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class LeaderLease(ABC):
+    """Mecanismo de exclusión para elegir la instancia que ejecuta los ticks."""
+
+    @abstractmethod
+    async def try_acquire(self) -> bool:
+        """Adquiere o renueva el liderazgo. Retorna True si esta instancia es líder."""
+
+    @abstractmethod
+    async def release(self):
+        """Libera el liderazgo si se tiene."""
+
+
+class FileLockLease(LeaderLease):
+    """
+    Liderazgo mediante un lock exclusivo sobre un archivo local.
+
+    Pensado para varios workers de uvicorn en el mismo host: el sistema operativo
+    libera el lock si el proceso líder muere, y otro worker lo toma en el
+    siguiente intento de renovación.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    async def try_acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, f"{os.getpid()}\n".encode())
+        self._fd = fd
+        return True
+
+    async def release(self):
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+class LeaseStore(ABC):
+    """
+    Almacén compartido de leases (p. ej. Redis, base de datos o etcd).
+    Las implementaciones deben hacer atómicas ambas operaciones.
+    """
+
+    @abstractmethod
+    async def acquire(self, name: str, holder: str, ttl: float) -> bool:
+        """
+        Toma el lease `name` para `holder` si está libre, expirado o ya es suyo,
+        renovando su expiración a `ttl` segundos.
+        """
+
+    @abstractmethod
+    async def release(self, name: str, holder: str):
+        """Libera el lease si pertenece a `holder`."""
+
+
+class InMemoryLeaseStore(LeaseStore):
+    """Almacén local en memoria; sustituto del almacén compartido para desarrollo."""
+
+    def __init__(self):
+        self._leases: Dict[str, Tuple[str, float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, name: str, holder: str, ttl: float) -> bool:
+        async with self._lock:
+            now = time.monotonic()
+            current = self._leases.get(name)
+            if current is None or current[0] == holder or current[1] <= now:
+                self._leases[name] = (holder, now + ttl)
+                return True
+            return False
+
+    async def release(self, name: str, holder: str):
+        async with self._lock:
+            current = self._leases.get(name)
+            if current is not None and current[0] == holder:
+                del self._leases[name]
+
+
+class StoreLease(LeaderLease):
+    """Liderazgo mediante un lease con TTL en un LeaseStore compartido."""
+
+    def __init__(self, store: LeaseStore, name: str, holder: str, ttl: float):
+        self.store = store
+        self.name = name
+        self.holder = holder
+        self.ttl = ttl
+
+    async def try_acquire(self) -> bool:
+        return await self.store.acquire(self.name, self.holder, self.ttl)
+
+    async def release(self):
+        await self.store.release(self.name, self.holder)
+
+
+class LeaderElector:
+    """
+    Mantiene el liderazgo de esta instancia renovando el lease periódicamente.
+    Con la elección deshabilitada, la instancia siempre se considera líder.
+
+    Las corrutinas registradas con `on_acquired` se ejecutan cada vez que la
+    instancia pasa a ser líder (al arrancar o al tomar el lease tras un failover).
+    """
+
+    def __init__(self, lease: Optional[LeaderLease], instance_id: str, renew_interval: float):
+        self.lease = lease
+        self.instance_id = instance_id
+        self.renew_interval = renew_interval
+        self._is_leader = lease is None
+        self._since: Optional[float] = time.time() if lease is None else None
+        self._transitions = 0
+        self._task: Optional[asyncio.Task] = None
+        self._started = False
+        self._callbacks: List[Callable[[], Awaitable[None]]] = []
+        self._acquired_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    def on_acquired(self, callback: Callable[[], Awaitable[None]]):
+        """Registra una corrutina a ejecutar cada vez que la instancia pasa a ser líder."""
+        self._callbacks.append(callback)
+
+    async def start(self):
+        """
+        Intenta adquirir el liderazgo y lanza el ciclo de renovación. Si la
+        instancia es líder al arrancar, espera a que terminen los `on_acquired`.
+        """
+        if self._started:
+            return
+        self._started = True
+        if self.lease is None:
+            await self._notify_acquired()
+            return
+        await self._renew()
+        self._task = asyncio.create_task(self._run(), name="leader-elector")
+        if self._acquired_task is not None:
+            await self._acquired_task
+
+    async def stop(self):
+        """Detiene la renovación y libera el liderazgo para un failover inmediato."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._acquired_task is not None:
+            self._acquired_task.cancel()
+            await asyncio.gather(self._acquired_task, return_exceptions=True)
+            self._acquired_task = None
+        self._started = False
+        if self.lease is not None and self._is_leader:
+            await self.lease.release()
+            self._set_leader(False)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.renew_interval)
+            await self._renew()
+
+    async def _renew(self):
+        try:
+            acquired = await self.lease.try_acquire()
+        except Exception as e:
+            logger.error(f"Error al renovar el liderazgo: {e}")
+            acquired = False
+        self._set_leader(acquired)
+
+    def _set_leader(self, leader: bool):
+        if leader == self._is_leader:
+            return
+        self._is_leader = leader
+        self._transitions += 1
+        self._since = time.time()
+        if leader:
+            logger.info(f"✓ Instancia {self.instance_id} es ahora líder del scheduler")
+            # Sin bloquear la renovación del lease
+            self._acquired_task = asyncio.create_task(
+                self._notify_acquired(), name="leader-acquired"
+            )
+        else:
+            logger.warning(f"Instancia {self.instance_id} dejó de ser líder del scheduler")
+
+    async def _notify_acquired(self):
+        for callback in self._callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                logger.error(f"Error al tomar el liderazgo: {e}", exc_info=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Estado de la elección para monitoreo."""
+        return {
+            "enabled": self.lease is not None,
+            "backend": settings.LEADER_BACKEND if self.lease is not None else None,
+            "instance_id": self.instance_id,
+            "is_leader": self._is_leader,
+            "since": self._since,
+            "transitions": self._transitions,
+        }
+
+
+def _load_store(path: str) -> LeaseStore:
+    """Instancia el LeaseStore indicado como 'modulo:Clase'."""
+    module_name, _, class_name = path.partition(":")
+    store_class = getattr(importlib.import_module(module_name), class_name)
+    return store_class()
+
+
+def build_leader_elector() -> LeaderElector:
+    """Construye el elector según la configuración."""
+    instance_id = settings.LEADER_INSTANCE_ID or f"{socket.gethostname()}-{os.getpid()}"
+
+    lease: Optional[LeaderLease] = None
+    if settings.LEADER_ELECTION_ENABLED:
+        if settings.LEADER_BACKEND == "file":
+            lease = FileLockLease(settings.LEADER_LOCK_PATH)
+        else:
+            lease = StoreLease(
+                _load_store(settings.LEADER_STORE_CLASS),
+                name="svc-estado-eventos",
+                holder=instance_id,
+                ttl=settings.LEADER_LEASE_TTL_SECONDS,
+            )
+
+    return LeaderElector(lease, instance_id, settings.LEADER_RENEW_INTERVAL_SECONDS)
+
+
+# Singleton del elector
+leader_elector = build_leader_elector()
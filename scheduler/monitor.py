@@ -0,0 +1,137 @@
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+from metrics import SCHEDULER_RUNS_MISSED, TICK_INTERVAL
+from settings import settings
+
+
+class SchedulerMonitor:
+    """
+    Registro en memoria de la ejecución del job `process_events`: duración de
+    los ticks, intervalo efectivo y ejecuciones perdidas, omitidas o fuera de tiempo.
+    """
+
+    def __init__(self, max_events: int, max_reports: int):
+        self.interval: float = settings.SCHEDULER_INTERVAL_SECONDS
+        # Sin efecto en el modo por fechas límite (el job sólo reconcilia)
+        self.adaptive = settings.SCHEDULER_ADAPTIVE_ENABLED
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self.reports: Deque[Dict[str, Any]] = deque(maxlen=max_reports)
+        self.paused = False
+        self.counts: Dict[str, int] = {
+            "overrun": 0, "missed": 0, "max_instances": 0, "coalesced": 0
+        }
+        self.ticks = 0
+        self.last_duration: Optional[float] = None
+        self.last_backlog: Optional[int] = None
+        self.last_tick_at: Optional[float] = None
+        # Última ejecución programada que el scheduler lanzó u omitió
+        self._last_run_time: Optional[datetime] = None
+
+    def record_event(self, kind: str, **details: Any):
+        """
+        Registra un evento del scheduler (overrun, missed, max_instances,
+        interval_changed, paused, resumed).
+        """
+        if kind in self.counts:
+            self.counts[kind] += 1
+        if kind in ("missed", "max_instances"):
+            SCHEDULER_RUNS_MISSED.labels(reason=kind).inc()
+        self.events.append({"type": kind, "at": time.time(), **details})
+
+    def record_run_times(self, run_times: List[datetime]):
+        """
+        Registra las ejecuciones programadas que el scheduler lanzó u omitió.
+        Con `coalesce`, APScheduler descarta sin aviso todas las ejecuciones
+        atrasadas salvo la última: se deducen del hueco con la anterior y se
+        registran como `coalesced`.
+        """
+        if not run_times:
+            return
+        if self._last_run_time is not None and self.interval > 0:
+            gap = (run_times[0] - self._last_run_time).total_seconds()
+            coalesced = round(gap / self.interval) - 1
+            if coalesced > 0:
+                self.counts["coalesced"] += coalesced
+                SCHEDULER_RUNS_MISSED.labels(reason="coalesced").inc(coalesced)
+                self.events.append(
+                    {
+                        "type": "coalesced",
+                        "at": time.time(),
+                        "runs": coalesced,
+                        "scheduled_run_time": run_times[0].isoformat(),
+                    }
+                )
+        self._last_run_time = run_times[-1]
+
+    def record_tick(self, duration: float, backlog: int):
+        """Registra un tick completado y detecta si superó el intervalo."""
+        self.ticks += 1
+        self.last_duration = duration
+        self.last_backlog = backlog
+        self.last_tick_at = time.time()
+        if duration > self.interval:
+            self.record_event(
+                "overrun",
+                duration_seconds=round(duration, 3),
+                interval_seconds=self.interval,
+                backlog=backlog,
+            )
+
+    def record_report(self, report: Dict[str, Any]):
+        """Guarda el reporte de un tick (duración, contadores y fallos)."""
+        self.reports.append({"at": time.time(), **report})
+
+    def set_paused(self, paused: bool, **details: Any):
+        """Registra la pausa o reanudación del job `process_events`."""
+        self.paused = paused
+        # Las ejecuciones no lanzadas durante la pausa no son coalescencias
+        self._last_run_time = None
+        self.record_event("paused" if paused else "resumed", **details)
+
+    def set_interval(self, interval: float, reason: str):
+        """Registra un cambio del intervalo efectivo."""
+        previous = self.interval
+        self.interval = interval
+        # El trigger nuevo empieza a contar desde ahora
+        self._last_run_time = None
+        TICK_INTERVAL.set(interval)
+        self.record_event(
+            "interval_changed", previous_seconds=previous, interval_seconds=interval, reason=reason
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Estado del scheduler para monitoreo."""
+        return {
+            "interval_seconds": self.interval,
+            "adaptive": self.adaptive,
+            "paused": self.paused,
+            "ticks": self.ticks,
+            "last_tick_at": self.last_tick_at,
+            "last_duration_seconds": self.last_duration,
+            "last_backlog": self.last_backlog,
+            "counts": dict(self.counts),
+        }
+
+
+def next_interval(current: float, duration: float, backlog: int) -> float:
+    """
+    Calcula el intervalo del próximo tick: se reduce a la mitad mientras haya
+    eventos pendientes y crece un 50% cuando el tick no encontró trabajo, siempre
+    dentro de [SCHEDULER_MIN_INTERVAL_SECONDS, SCHEDULER_MAX_INTERVAL_SECONDS] y
+    nunca por debajo de la duración del último tick con margen.
+    """
+    if backlog > 0:
+        interval = current / 2
+    else:
+        interval = current * 1.5
+    interval = max(interval, duration * 1.25)
+    interval = min(settings.SCHEDULER_MAX_INTERVAL_SECONDS, interval)
+    return float(max(settings.SCHEDULER_MIN_INTERVAL_SECONDS, round(interval)))
+
+
+# Singleton del monitor
+scheduler_monitor = SchedulerMonitor(
+    settings.SCHEDULER_EVENTS_HISTORY, settings.SCHEDULER_REPORTS_HISTORY
+)
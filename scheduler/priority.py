@@ -0,0 +1,91 @@
+import heapq
+import itertools
+import time
+from typing import Dict, Iterable, List, Set, Tuple
+from clients.models import Event
+from scheduler.timeline import FINISH, START
+
+
+class TransitionQueue:
+    """
+    Cola de prioridad de las transiciones pendientes de un tick.
+
+    Ordena inicios y finalizaciones juntos por fecha programada: la transición
+    más atrasada sale primero. La finalización de un evento cuyo inicio sigue en
+    cola o en curso se aparta y vuelve a la cola sólo cuando el inicio se aplicó,
+    de modo que un evento nunca se finaliza antes de haberse iniciado.
+
+    Con `chain_finish`, un evento iniciado cuyo end_date también venció se
+    encola para finalizar en el mismo tick, aunque no estuviera en el listado
+    de pendientes de finalización (se descargó antes de iniciarlo).
+    """
+
+    def __init__(self, chain_finish: bool = False):
+        self.chain_finish = chain_finish
+        self._heap: List[Tuple[float, int, str, Event]] = []
+        self._order = itertools.count()
+        # Eventos con el inicio en cola o en curso
+        self._starting: Set[int] = set()
+        # Finalizaciones a la espera de su inicio
+        self._deferred: Dict[int, Event] = {}
+        # Eventos cuya finalización ya pasó por la cola
+        self._finishing: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, transition: str, events: Iterable[Event]):
+        """
+        Agrega transiciones; las fechas no válidas cuentan como vencidas ahora.
+        Una finalización de un evento que ya pasó por la cola en este tick
+        (p. ej. encadenada tras su inicio) se ignora.
+        """
+        now = time.time()
+        for event in events:
+            if transition == START:
+                self._starting.add(event.id)
+            elif event.id in self._finishing:
+                continue
+            else:
+                self._finishing.add(event.id)
+            self._push_entry(transition, event, now)
+
+    def _push_entry(self, transition: str, event: Event, now: float):
+        scheduled = event.scheduled_at(transition)
+        deadline = scheduled.timestamp() if scheduled is not None else now
+        heapq.heappush(self._heap, (deadline, next(self._order), transition, event))
+
+    def pop(self, limit: int) -> List[Tuple[str, Event]]:
+        """Extrae hasta `limit` transiciones, las más atrasadas primero."""
+        due = []
+        while self._heap and len(due) < limit:
+            _, _, transition, event = heapq.heappop(self._heap)
+            if transition == FINISH and event.id in self._starting:
+                self._deferred[event.id] = event
+                continue
+            due.append((transition, event))
+        return due
+
+    def complete_starts(self, events: Iterable[Event], started: Set[int]):
+        """
+        Libera los inicios ya despachados y encola la finalización de los que
+        se aplicaron; las finalizaciones de inicios fallidos se descartan (el
+        backend las reportará en el próximo tick).
+        """
+        now = time.time()
+        for event in events:
+            self._starting.discard(event.id)
+            deferred = self._deferred.pop(event.id, None)
+            if event.id not in started:
+                continue
+            if deferred is not None:
+                # Ya registrada en _finishing al encolarla por primera vez
+                self._push_entry(FINISH, deferred, now)
+            elif (
+                self.chain_finish
+                and event.id not in self._finishing
+                and event.end_date is not None
+                and event.end_date.timestamp() <= now
+            ):
+                self._finishing.add(event.id)
+                self._push_entry(FINISH, event, now)
@@ -0,0 +1,170 @@
+import cProfile
+import marshal
+import pstats
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional
+
+# Contexto compartido de los tramos cuando el profiler no está activo
+_NO_SPAN = nullcontext()
+
+
+class _Span:
+    """Mide el tiempo de pared de un tramo del tick."""
+
+    __slots__ = ("profiler", "name", "started_at")
+
+    def __init__(self, profiler: "TickProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.started_at = time.perf_counter()
+
+    def __exit__(self, *exc):
+        self.profiler._add_span(self.name, time.perf_counter() - self.started_at)
+
+
+class TickProfiler:
+    """
+    Perfilado bajo demanda de los próximos N ticks de process_events.
+
+    Mientras un tick está perfilado se activa cProfile en el hilo del event loop
+    y se miden tramos de tiempo de pared (descarga de cada listado,
+    transiciones, procesamiento de finalización). Sin un perfilado solicitado,
+    `span()` retorna un contexto vacío compartido y no se mide nada.
+
+    cProfile registra todo lo que corre en el hilo durante el tick, incluidas
+    otras tareas del event loop (webhooks, workers de la cola de finalización);
+    los tramos pueden solaparse porque las descargas y transiciones son concurrentes.
+    """
+
+    def __init__(self):
+        self.active = False
+        self._remaining = 0
+        self._requested = 0
+        self._profile: Optional[cProfile.Profile] = None
+        self._spans: Dict[str, Dict[str, float]] = {}
+        self._ticks: List[float] = []
+        self._tick_started_at = 0.0
+        self._stats: Optional[pstats.Stats] = None
+        self._finished_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.active:
+            return "running"
+        if self._remaining:
+            return "armed"
+        return "done" if self._stats is not None else "idle"
+
+    def arm(self, ticks: int):
+        """Perfila los próximos `ticks` ticks; descarta el resultado anterior."""
+        self._remaining = self._requested = ticks
+        self._profile = cProfile.Profile()
+        self._spans = {}
+        self._ticks = []
+        self._stats = None
+        self._finished_at = None
+
+    def disarm(self):
+        """Cancela el perfilado pendiente y descarta su resultado."""
+        if self.active and self._profile is not None:
+            self._profile.disable()
+        self.active = False
+        self._remaining = self._requested = 0
+        self._profile = None
+        self._spans = {}
+        self._ticks = []
+        self._stats = None
+        self._finished_at = None
+
+    def begin_tick(self):
+        if not self._remaining or self._profile is None:
+            return
+        self.active = True
+        self._tick_started_at = time.perf_counter()
+        self._profile.enable()
+
+    def end_tick(self):
+        if not self.active:
+            return
+        self._profile.disable()
+        self.active = False
+        self._ticks.append(time.perf_counter() - self._tick_started_at)
+        self._remaining -= 1
+        if not self._remaining:
+            self._stats = pstats.Stats(self._profile)
+            self._profile = None
+            self._finished_at = time.time()
+
+    def span(self, name: str, profiled: bool = False):
+        """
+        Contexto que mide un tramo del tick perfilado (vacío si no hay perfilado).
+        Con `profiled` se mide también fuera del tick: trabajo que un tick
+        perfilado dejó en segundo plano (p. ej. la cola de finalización).
+        """
+        if not self.active and not (profiled and self.state != "idle"):
+            return _NO_SPAN
+        return _Span(self, name)
+
+    def _add_span(self, name: str, elapsed: float):
+        # Un tramo que empezó en un tick perfilado puede terminar fuera de él
+        span = self._spans.get(name)
+        if span is None:
+            span = self._spans[name] = {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        span["count"] += 1
+        span["total_seconds"] += elapsed
+        span["max_seconds"] = max(span["max_seconds"], elapsed)
+
+    def dump(self) -> Optional[bytes]:
+        """Perfil en formato pstats (marshal), legible con pstats o snakeviz."""
+        if self._stats is None:
+            return None
+        return marshal.dumps(self._stats.stats)
+
+    def report(self, top: int = 30, sort: str = "cumulative") -> Dict[str, Any]:
+        """Estado, tramos y las `top` funciones más costosas del perfil."""
+        ticks = len(self._ticks)
+        report: Dict[str, Any] = {
+            "state": self.state,
+            "requested_ticks": self._requested,
+            "remaining_ticks": self._remaining,
+            "profiled_ticks": ticks,
+            "tick_seconds": [round(duration, 4) for duration in self._ticks],
+            "finished_at": self._finished_at,
+            "spans": {
+                name: {
+                    "count": int(span["count"]),
+                    "total_seconds": round(span["total_seconds"], 4),
+                    "max_seconds": round(span["max_seconds"], 4),
+                    "per_tick_seconds": round(span["total_seconds"] / ticks, 4) if ticks else None,
+                }
+                for name, span in sorted(
+                    self._spans.items(), key=lambda item: item[1]["total_seconds"], reverse=True
+                )
+            },
+            "functions": [],
+        }
+        if self._stats is None:
+            return report
+
+        index = 3 if sort == "cumulative" else 2
+        entries = sorted(self._stats.stats.items(), key=lambda item: item[1][index], reverse=True)
+        report["total_seconds"] = round(self._stats.total_tt, 4)
+        report["functions"] = [
+            {
+                "function": func,
+                "file": filename,
+                "line": line,
+                "calls": calls,
+                "primitive_calls": primitive,
+                "total_seconds": round(total, 6),
+                "cumulative_seconds": round(cumulative, 6),
+            }
+            for (filename, line, func), (primitive, calls, total, cumulative, _) in entries[:top]
+        ]
+        return report
+
+
+tick_profiler = TickProfiler()
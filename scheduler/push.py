@@ -0,0 +1,72 @@
+import logging
+import time
+from typing import Any, Dict, Iterable, Optional
+from clients.models import Event
+from metrics import WEBHOOK_NOTIFICATIONS
+from scheduler.sharding import shard_assignment
+from scheduler.timeline import EventTimeline, timeline
+
+logger = logging.getLogger(__name__)
+
+# Acciones que notifica el backend
+UPSERT_ACTIONS = ("created", "updated", "rescheduled")
+REMOVE_ACTIONS = ("deleted", "cancelled")
+
+
+class PushIngestor:
+    """
+    Aplica a la línea de tiempo las notificaciones que el backend envía al
+    crear, modificar, reprogramar o eliminar eventos, de modo que el runner de
+    fechas límite no depende sólo de la consulta periódica de `upcoming`.
+    """
+
+    def __init__(self, event_timeline: EventTimeline):
+        self.timeline = event_timeline
+        self._counts: Dict[str, int] = {"applied": 0, "removed": 0, "ignored": 0}
+        self._last_received: Optional[float] = None
+
+    def apply(self, notifications: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Aplica un lote de notificaciones {"action": ..., "event": Event}.
+
+        Si la notificación incluye "fields" (campos presentes en el cuerpo),
+        los campos omitidos se toman del evento que ya sigue la línea de tiempo.
+
+        Returns:
+            Contadores del lote (applied, removed, ignored).
+        """
+        result = {"applied": 0, "removed": 0, "ignored": 0}
+        for notification in notifications:
+            action = notification["action"]
+            event = notification["event"]
+
+            # En modo particionado sólo se programan los eventos de esta instancia
+            if not shard_assignment.filter([event], source="webhook"):
+                outcome = "ignored"
+            elif action in REMOVE_ACTIONS:
+                self.timeline.remove_event(event.id)
+                outcome = "removed"
+            else:
+                fields = notification.get("fields")
+                if fields is not None:
+                    event = self.timeline.merge_event(event, fields)
+                self.timeline.upsert_event(event)
+                outcome = "applied"
+
+            result[outcome] += 1
+            WEBHOOK_NOTIFICATIONS.labels(action=action, result=outcome).inc()
+
+        for outcome, count in result.items():
+            self._counts[outcome] += count
+        self._last_received = time.time()
+        logger.info(
+            f"Notificaciones del backend: {result['applied']} aplicada(s), "
+            f"{result['removed']} eliminada(s), {result['ignored']} de otra partición"
+        )
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._counts, "last_received_at": self._last_received}
+
+
+push_ingestor = PushIngestor(timeline)
@@ -0,0 +1,33 @@
+import asyncio
+import logging
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+# Event loop de la aplicación (uvicorn) donde viven los recursos compartidos
+_app_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def bind_event_loop(loop: Optional[asyncio.AbstractEventLoop]):
+    """
+    Registra el event loop de la aplicación.
+    Los jobs síncronos ejecutarán sus corrutinas sobre este loop para
+    reutilizar el pool de conexiones del cliente HTTP entre ticks.
+    """
+    global _app_loop
+    _app_loop = loop
+
+
+def run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Ejecuta una corrutina desde el hilo del scheduler.
+
+    Si hay un loop de aplicación activo, la corrutina se envía a ese loop y se
+    espera su resultado; en caso contrario se usa un loop temporal.
+    """
+    loop = _app_loop
+    if loop is not None and loop.is_running():
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        return future.result()
+
+    return asyncio.run(coro)
@@ -0,0 +1,143 @@
+import bisect
+import hashlib
+import json
+import logging
+import os
+import socket
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from clients.models import Event
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Anillo de hashing consistente con nodos virtuales.
+
+    Al agregar o quitar un miembro sólo se reasignan los eventos de los
+    segmentos del anillo que le correspondían.
+    """
+
+    def __init__(self, members: List[str], virtual_nodes: int):
+        self.members = sorted(set(members))
+        points: List[Tuple[int, str]] = []
+        for member in self.members:
+            for replica in range(max(1, virtual_nodes)):
+                points.append((_hash(f"{member}#{replica}"), member))
+        points.sort()
+        self._hashes = [point for point, _ in points]
+        self._owners = [member for _, member in points]
+
+    def owner(self, key: Any) -> Optional[str]:
+        """Retorna el miembro dueño de la clave."""
+        if not self._hashes:
+            return None
+        idx = bisect.bisect(self._hashes, _hash(str(key))) % len(self._hashes)
+        return self._owners[idx]
+
+
+class ShardAssignment:
+    """
+    Asignación de eventos a esta instancia en modo particionado.
+
+    Los miembros se toman del archivo SHARD_MEMBERSHIP_FILE (recargado cuando
+    cambia) o, si no se define, de SHARD_COUNT con esta instancia en SHARD_INDEX.
+    """
+
+    def __init__(self):
+        self.enabled = settings.SHARDING_ENABLED
+        self.membership_file = settings.SHARD_MEMBERSHIP_FILE
+        self._membership_mtime: Optional[float] = None
+        self._current: Counter = Counter()
+        self._last: Dict[str, int] = {}
+        # Eventos propios y de otras particiones por origen (tick, deadline, webhook)
+        self._owned: Counter = Counter()
+        self._skipped: Counter = Counter()
+        self.member_id = ""
+        self.ring = HashRing([], settings.SHARD_VIRTUAL_NODES)
+        if self.enabled:
+            self._load_membership()
+
+    def _load_membership(self):
+        if self.membership_file:
+            try:
+                mtime = os.path.getmtime(self.membership_file)
+                if mtime == self._membership_mtime:
+                    return
+                with open(self.membership_file, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.error(f"No se pudo leer el archivo de membresía {self.membership_file}: {e}")
+                return
+            members = data.get("members", []) if isinstance(data, dict) else data
+            member_id = settings.SHARD_MEMBER_ID or socket.gethostname()
+            self._membership_mtime = mtime
+        else:
+            members = [f"shard-{idx}" for idx in range(max(1, settings.SHARD_COUNT))]
+            member_id = f"shard-{settings.SHARD_INDEX}"
+
+        members = [str(member) for member in members]
+        if member_id not in members:
+            logger.warning(f"La instancia '{member_id}' no figura entre los miembros: {members}")
+
+        previous = self.ring.members
+        self.member_id = member_id
+        self.ring = HashRing(members, settings.SHARD_VIRTUAL_NODES)
+        if previous != self.ring.members:
+            logger.info(
+                f"Particionado: instancia '{member_id}' en un anillo de {len(self.ring.members)} miembro(s)"
+            )
+
+    def begin_tick(self):
+        """Reinicia los contadores por partición y recarga la membresía si cambió."""
+        if not self.enabled:
+            return
+        self._load_membership()
+        self._current = Counter()
+
+    def end_tick(self):
+        """Publica los contadores por partición del tick."""
+        if self.enabled:
+            self._last = dict(self._current)
+
+    def filter(self, events: List[Event], source: str = "tick") -> List[Event]:
+        """
+        Retorna sólo los eventos cuyo id pertenece a esta instancia. Los
+        contadores por partición del tick sólo cuentan los filtrados por
+        process_events (`source="tick"`); el resto se cuenta por origen.
+        """
+        if not self.enabled:
+            return events
+
+        per_shard = self._current if source == "tick" else None
+        owned = []
+        for event in events:
+            owner = self.ring.owner(event.id)
+            if per_shard is not None:
+                per_shard[owner] += 1
+            if owner == self.member_id:
+                owned.append(event)
+        self._owned[source] += len(owned)
+        self._skipped[source] += len(events) - len(owned)
+        return owned
+
+    def stats(self) -> Dict[str, Any]:
+        """Asignación y contadores por partición para monitoreo."""
+        return {
+            "enabled": self.enabled,
+            "member_id": self.member_id,
+            "members": self.ring.members,
+            "last_tick_events_per_shard": self._last,
+            "owned_total": dict(self._owned),
+            "skipped_total": dict(self._skipped),
+        }
+
+
+# Singleton de la asignación
+shard_assignment = ShardAssignment()
@@ -0,0 +1,182 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from clients.models import Event
+
+logger = logging.getLogger(__name__)
+
+# Transiciones que se programan en la línea de tiempo
+START = "start"
+FINISH = "finish"
+
+
+class EventTimeline:
+    """
+    Línea de tiempo en memoria de las transiciones próximas.
+
+    Mantiene un min-heap ordenado por fecha límite. Las reprogramaciones y
+    eliminaciones se resuelven de forma perezosa: cada entrada lleva un número
+    de versión y las obsoletas se descartan al llegar a la cima del heap.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, str, int]] = []
+        # (event_id, transición) -> (deadline, versión vigente)
+        self._entries: Dict[Tuple[int, str], Tuple[float, int]] = {}
+        # Datos del evento usados para despachar la transición
+        self._events: Dict[int, Event] = {}
+        self._versions = itertools.count()
+        self._changed: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _notify(self):
+        if self._changed is not None:
+            self._changed.set()
+
+    def bind(self, changed: asyncio.Event):
+        """Registra el evento asyncio que se activa al cambiar la línea de tiempo."""
+        self._changed = changed
+
+    def schedule(self, event_id: int, transition: str, deadline: float):
+        """Programa (o reprograma) una transición para un evento."""
+        key = (event_id, transition)
+        current = self._entries.get(key)
+        if current is not None and current[0] == deadline:
+            return
+
+        version = next(self._versions)
+        self._entries[key] = (deadline, version)
+        heapq.heappush(self._heap, (deadline, version, transition, event_id))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+
+        # Despertar al runner sólo si cambia la próxima fecha límite
+        if self._heap[0][1] == version:
+            self._notify()
+
+    def upsert_event(self, event: Event):
+        """
+        Programa las transiciones pendientes de un evento según su estado:
+        'programado' -> inicio y fin; 'en_progreso' -> sólo fin.
+        """
+        event_id = event.id
+        status = event.status
+        start = event.start_date
+        end = event.end_date
+
+        self._events[event_id] = event
+
+        if status == "programado" and start is not None:
+            self.schedule(event_id, START, start.timestamp())
+        else:
+            self.unschedule(event_id, START)
+
+        if status in ("programado", "en_progreso") and end is not None:
+            self.schedule(event_id, FINISH, end.timestamp())
+        else:
+            self.unschedule(event_id, FINISH)
+
+        if (event_id, START) not in self._entries and (event_id, FINISH) not in self._entries:
+            self._events.pop(event_id, None)
+
+    def merge_event(self, event: Event, fields: Iterable[str]) -> Event:
+        """
+        Completa una actualización parcial: los campos que no están en `fields`
+        se toman del evento ya registrado, si lo hay.
+        """
+        known = self._events.get(event.id)
+        if known is None:
+            return event
+        fields = set(fields)
+        return Event(
+            event.id,
+            event.status if "status" in fields else known.status,
+            event.start_date if "start_date" in fields else known.start_date,
+            event.end_date if "end_date" in fields else known.end_date,
+        )
+
+    def unschedule(self, event_id: int, transition: str):
+        """Cancela una transición programada (eliminación perezosa)."""
+        self._entries.pop((event_id, transition), None)
+
+    def remove_event(self, event_id: int):
+        """Cancela todas las transiciones de un evento."""
+        self.unschedule(event_id, START)
+        self.unschedule(event_id, FINISH)
+        self._events.pop(event_id, None)
+        self._notify()
+
+    def retain(self, event_ids: Set[int], horizon: float):
+        """
+        Cancela las transiciones con fecha límite anterior a `horizon` cuyos
+        eventos ya no fueron reportados por el backend (p. ej. cancelados).
+        """
+        for (event_id, transition), (deadline, _) in list(self._entries.items()):
+            if deadline <= horizon and event_id not in event_ids:
+                self.unschedule(event_id, transition)
+                if (event_id, START) not in self._entries and (event_id, FINISH) not in self._entries:
+                    self._events.pop(event_id, None)
+
+    def _compact(self):
+        """Reconstruye el heap descartando las entradas obsoletas."""
+        self._heap = [
+            (deadline, version, transition, event_id)
+            for (event_id, transition), (deadline, version) in self._entries.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def _discard_stale(self):
+        while self._heap:
+            deadline, version, transition, event_id = self._heap[0]
+            current = self._entries.get((event_id, transition))
+            if current is not None and current[1] == version:
+                return
+            heapq.heappop(self._heap)
+
+    def next_deadline(self) -> Optional[float]:
+        """Retorna la próxima fecha límite (epoch) o None si no hay transiciones."""
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float) -> List[Tuple[str, Event]]:
+        """
+        Extrae las transiciones vencidas en orden de fecha límite.
+
+        Returns:
+            Lista de tuplas (transición, evento).
+        """
+        due = []
+        while True:
+            self._discard_stale()
+            if not self._heap or self._heap[0][0] > now:
+                break
+            _, _, transition, event_id = heapq.heappop(self._heap)
+            self._entries.pop((event_id, transition), None)
+            event = self._events.get(event_id) or Event(event_id)
+            due.append((transition, event))
+            if (event_id, START) not in self._entries and (event_id, FINISH) not in self._entries:
+                self._events.pop(event_id, None)
+        return due
+
+    def stats(self) -> Dict[str, Any]:
+        """Estado de la línea de tiempo para monitoreo."""
+        next_deadline = self.next_deadline()
+        return {
+            "scheduled_transitions": len(self._entries),
+            "tracked_events": len(self._events),
+            "heap_size": len(self._heap),
+            "next_deadline": (
+                datetime.fromtimestamp(next_deadline).astimezone().isoformat()
+                if next_deadline is not None
+                else None
+            ),
+        }
+
+
+# Singleton de la línea de tiempo
+timeline = EventTimeline()
@@ -0,0 +1,108 @@
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from metrics import BATCH_TRANSITION_EVENTS, EVENT_LATENESS, SLO_BREACHES, TRANSITION_LATENCY
+from clients.models import parse_datetime
+from settings import settings
+
+
+def _percentiles(samples: Deque[float]) -> Dict[str, Optional[float]]:
+    """p50/p95/p99 de una ventana de muestras (None si está vacía)."""
+    if not samples:
+        return {"p50": None, "p95": None, "p99": None}
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return {
+        f"p{pct}": round(ordered[min(last, int(pct / 100 * len(ordered)))], 4)
+        for pct in (50, 95, 99)
+    }
+
+
+class EventTimings:
+    """
+    Retraso de cada transición respecto a su fecha programada (`start_date` /
+    `end_date`) y latencia de la llamada al backend que la aplicó.
+
+    Cada observación va a los histogramas de Prometheus y a una ventana
+    deslizante por paso, de la que se calculan p50/p95/p99 bajo demanda.
+    """
+
+    def __init__(self, window: int, slo_seconds: float):
+        self.slo_seconds = slo_seconds
+        self._lateness: Dict[str, Deque[float]] = {}
+        self._latency: Dict[str, Deque[float]] = {}
+        self._window = window
+        self._breaches: Dict[str, int] = {}
+        self._unparsed: Dict[str, int] = {}
+
+    def _samples(self, store: Dict[str, Deque[float]], phase: str) -> Deque[float]:
+        samples = store.get(phase)
+        if samples is None:
+            samples = store[phase] = deque(maxlen=self._window)
+        return samples
+
+    def record_latency(self, phase: str, latency: float, mode: str, events: int = 1):
+        """
+        Registra la latencia de una petición al backend; una petición en lote
+        cuenta una sola vez, con sus `events` eventos en un contador aparte.
+        """
+        TRANSITION_LATENCY.labels(phase=phase, mode=mode).observe(latency)
+        self._samples(self._latency, phase).append(latency)
+        if mode == "batch":
+            BATCH_TRANSITION_EVENTS.labels(phase=phase).inc(events)
+
+    def record(
+        self, phase: str, scheduled_at: Any, latency: Optional[float], success: bool, mode: str
+    ) -> Optional[float]:
+        """
+        Registra una transición.
+
+        Args:
+            phase: "start" o "finish"
+            scheduled_at: Fecha programada (datetime o texto ISO 8601 del backend)
+            latency: Duración de la llamada al backend, o None si ya se registró
+                por petición con `record_latency` (lotes)
+            success: Si la transición se aplicó; el retraso sólo se mide en ese caso
+            mode: "single" o "batch"
+
+        Returns:
+            El retraso en segundos, o None si no se aplicó o la fecha no es válida.
+        """
+        if latency is not None:
+            self.record_latency(phase, latency, mode)
+        if not success:
+            return None
+
+        scheduled = parse_datetime(scheduled_at)
+        if scheduled is None:
+            self._unparsed[phase] = self._unparsed.get(phase, 0) + 1
+            return None
+
+        lateness = time.time() - scheduled.timestamp()
+        EVENT_LATENESS.labels(phase=phase).observe(max(0.0, lateness))
+        self._samples(self._lateness, phase).append(lateness)
+        if lateness > self.slo_seconds:
+            self._breaches[phase] = self._breaches.get(phase, 0) + 1
+            SLO_BREACHES.labels(phase=phase).inc()
+        return lateness
+
+    def stats(self) -> Dict[str, Any]:
+        """Percentiles de la ventana y contadores por paso."""
+        phases = sorted(set(self._lateness) | set(self._latency))
+        return {
+            "slo_lateness_seconds": self.slo_seconds,
+            "window": self._window,
+            "phases": {
+                phase: {
+                    "samples": len(self._lateness.get(phase, ())),
+                    "lateness_seconds": _percentiles(self._lateness.get(phase, deque())),
+                    "backend_latency_seconds": _percentiles(self._latency.get(phase, deque())),
+                    "slo_breaches": self._breaches.get(phase, 0),
+                    "unparsed_dates": self._unparsed.get(phase, 0),
+                }
+                for phase in phases
+            },
+        }
+
+
+event_timings = EventTimings(settings.TIMING_WINDOW_SIZE, settings.SLO_LATENESS_SECONDS)
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
+from typing import Literal
 
 
 class Settings(BaseSettings):
@@ -13,15 +14,135 @@ class Settings(BaseSettings):
     SCHEDULER_MISFIRE_GRACE_SECONDS: int = 5
     SCHEDULER_COALESCE: bool = True
 
+    # Intervalo adaptativo: se acorta con eventos pendientes y se alarga sin trabajo
+    SCHEDULER_ADAPTIVE_ENABLED: bool = False
+    SCHEDULER_MIN_INTERVAL_SECONDS: int = 10
+    SCHEDULER_MAX_INTERVAL_SECONDS: int = 120
+    # Eventos del scheduler (desbordes, ejecuciones perdidas) conservados en memoria
+    SCHEDULER_EVENTS_HISTORY: int = 200
+    SCHEDULER_REPORTS_HISTORY: int = 50
+
+    # Retraso de las transiciones respecto a la fecha programada
+    SLO_LATENESS_SECONDS: float = 120
+    TIMING_WINDOW_SIZE: int = 1000
+
+    # "asyncio": jobs como corrutinas en el loop de uvicorn; "thread": BackgroundScheduler
+    SCHEDULER_MODE: Literal["asyncio", "thread"] = "asyncio"
+
+    # Programación por fechas límite (la consulta por intervalo queda como reconciliación)
+    SCHEDULER_DEADLINE_ENABLED: bool = False
+    SCHEDULER_DEADLINE_WINDOW_SECONDS: int = 900
+    SCHEDULER_DEADLINE_REFRESH_SECONDS: int = 300
+    SCHEDULER_RECONCILE_INTERVAL_SECONDS: int = 300
+
+    # Notificaciones push del backend (requiere SCHEDULER_DEADLINE_ENABLED)
+    WEBHOOK_ENABLED: bool = False
+    WEBHOOK_SECRET: str = ""
+
+    # Elección de líder entre réplicas / workers
+    LEADER_ELECTION_ENABLED: bool = False
+    LEADER_BACKEND: Literal["file", "store"] = "file"
+    LEADER_LOCK_PATH: str = "/tmp/svc-estado-eventos.lock"
+    LEADER_STORE_CLASS: str = "scheduler.leader:InMemoryLeaseStore"
+    LEADER_INSTANCE_ID: str = ""  # Por defecto hostname-pid
+    LEADER_LEASE_TTL_SECONDS: float = 10.0
+    LEADER_RENEW_INTERVAL_SECONDS: float = 2.0
+
+    # Particionado de eventos entre réplicas por hashing consistente
+    SHARDING_ENABLED: bool = False
+    SHARD_INDEX: int = 0
+    SHARD_COUNT: int = 1
+    SHARD_MEMBERSHIP_FILE: str = ""  # JSON {"members": [...]}; tiene prioridad sobre SHARD_COUNT
+    SHARD_MEMBER_ID: str = ""  # Identificador en el archivo de membresía
+    SHARD_VIRTUAL_NODES: int = 128
+
+    # Journal local de transiciones (reejecutado al arrancar)
+    JOURNAL_ENABLED: bool = True
+    JOURNAL_PATH: str = "transitions_journal.db"
+    JOURNAL_RETENTION_HOURS: int = 24
+
+    # Procesamiento concurrente de transiciones dentro de un tick
+    PROCESS_EVENTS_CONCURRENT: bool = False
+    PROCESS_EVENTS_MAX_CONCURRENCY: int = 10
+
+    # Precarga de los pendientes del siguiente tick al final de un backlog grande
+    PROCESS_EVENTS_PREFETCH_ENABLED: bool = True
+    PROCESS_EVENTS_PREFETCH_MAX_AGE_SECONDS: float = 10.0
+
+    # Cola de procesamiento de finalización (unión de videos y análisis)
+    COMPLETION_QUEUE_ENABLED: bool = True
+    COMPLETION_QUEUE_WORKERS: int = 4
+    COMPLETION_QUEUE_MAXSIZE: int = 1000
+    COMPLETION_QUEUE_MAX_RETRIES: int = 3
+    COMPLETION_QUEUE_RETRY_BACKOFF_SECONDS: float = 5.0
+    COMPLETION_QUEUE_DRAIN_TIMEOUT_SECONDS: float = 30.0
+
     # Configuración del servidor
     HOST: str = "0.0.0.0"
     PORT: int = 8001
 
     # Timeout para requests HTTP
     HTTP_TIMEOUT: int = 30
+    # Timeout para el procesamiento de finalización (unión de videos y análisis)
+    COMPLETION_HTTP_TIMEOUT: int = 60
+
+    # Pool de conexiones HTTP hacia el backend
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_HTTP2: bool = False  # Requiere el extra `httpx[http2]`
+
+    # Reintentos con backoff exponencial y jitter (sólo llamadas idempotentes)
+    BACKEND_RETRY_ATTEMPTS: int = 3
+    BACKEND_RETRY_BACKOFF_SECONDS: float = 0.5
+    BACKEND_RETRY_MAX_BACKOFF_SECONDS: float = 10.0
+
+    # Circuit breaker hacia el backend
+    BACKEND_BREAKER_FAILURE_THRESHOLD: int = 5
+    BACKEND_BREAKER_RESET_SECONDS: float = 30.0
+    BACKEND_BREAKER_HALF_OPEN_CALLS: int = 1
+
+    # Paginación de los listados de pendientes
+    BACKEND_PAGE_SIZE: int = 500
+    BACKEND_PREFETCH_PAGES: int = 2
+    BACKEND_CACHE_MAX_EVENTS: int = 5000
+
+    # Consultas condicionales (ETag / Last-Modified) e incrementales (updated_since)
+    BACKEND_CONDITIONAL_FETCH: bool = True
+    BACKEND_DELTA_FETCH: bool = False
+
+    # Límite de concurrencia adaptativo (AIMD) y tasa máxima hacia el backend
+    BACKEND_ADAPTIVE_LIMIT_ENABLED: bool = True
+    BACKEND_LIMIT_INITIAL: int = 10
+    BACKEND_LIMIT_MIN: int = 1
+    BACKEND_LIMIT_MAX: int = 100
+    BACKEND_LIMIT_LATENCY_TOLERANCE: float = 2.0
+    BACKEND_LIMIT_BACKOFF_RATIO: float = 0.5
+    BACKEND_RATE_LIMIT_PER_SECOND: float = 0  # 0 = sin límite de tasa
+    BACKEND_RATE_LIMIT_BURST: int = 20
+
+    # Claves de idempotencia y deduplicación de transiciones
+    IDEMPOTENCY_ENABLED: bool = True
+    IDEMPOTENCY_HEADER: str = "Idempotency-Key"
+    # Reintenta los POST de transiciones; sólo si el backend respeta Idempotency-Key
+    IDEMPOTENCY_RETRY_POSTS: bool = False
+    IDEMPOTENCY_KEY_PREFIX: str = "svc-estado-eventos"
+    IDEMPOTENCY_TTL_SECONDS: int = 600
+    IDEMPOTENCY_CACHE_MAX_ENTRIES: int = 10000
+
+    # Endpoints batch de transiciones (con fallback a los endpoints por evento)
+    BACKEND_BATCH_ENABLED: bool = True
+    BACKEND_BATCH_SIZE: int = 100
+    BACKEND_BATCH_REPROBE_SECONDS: int = 3600
+
+    # API de administración (vacío = /admin deshabilitado)
+    ADMIN_TOKEN: str = ""
 
     # Logging
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: Literal["text", "json"] = "text"
+    LOG_QUEUE_ENABLED: bool = True
+    LOG_SUCCESS_SAMPLE_RATE: float = 1.0
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,75 @@
+import asyncio
+import os
+import tempfile
+
+import httpx
+import pytest
+
+# settings se lee al importar los módulos del servicio
+os.environ.setdefault("BACKEND_URL", "http://backend.invalid")
+os.environ.setdefault("JOURNAL_PATH", os.path.join(tempfile.mkdtemp(), "journal.db"))
+os.environ.setdefault("LOG_QUEUE_ENABLED", "false")
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Journal de transiciones sobre una base SQLite temporal."""
+    from scheduler.journal import journal
+
+    journal.path = str(tmp_path / "journal.db")
+    journal.open()
+    yield journal
+    journal.close()
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    """Sustituye las llamadas al backend y registra las que se realizan."""
+    from clients.backend_api import backend_client
+
+    calls = {"start": [], "finish": [], "completion": []}
+
+    def fake(kind):
+        async def call(event_id):
+            calls[kind].append(event_id)
+            return True
+
+        return call
+
+    monkeypatch.setattr(backend_client, "batch_available", lambda transition: False)
+    monkeypatch.setattr(backend_client, "start_event", fake("start"))
+    monkeypatch.setattr(backend_client, "finish_event", fake("finish"))
+    monkeypatch.setattr(backend_client, "process_event_completion", fake("completion"))
+
+    async def finish_event_status(event_id):
+        calls["finish"].append(event_id)
+        return calls["finish_result"]
+
+    calls["finish_result"] = (True, "completado")
+    monkeypatch.setattr(backend_client, "finish_event_status", finish_event_status)
+    return calls
+
+
+@pytest.fixture
+def http_backend():
+    """
+    Retorna `run(handler, call)`: ejecuta `call(client)` con un BackendAPIClient
+    nuevo cuyas peticiones responde `handler` (httpx.MockTransport).
+    """
+    from clients.backend_api import BackendAPIClient
+
+    def run(handler, call):
+        async def main():
+            client = BackendAPIClient()
+            client._client = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler), base_url="http://backend.test"
+            )
+            client._client_loop = asyncio.get_running_loop()
+            try:
+                return await call(client)
+            finally:
+                await client.close()
+
+        return asyncio.run(main())
+
+    return run
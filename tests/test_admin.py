@@ -0,0 +1,26 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers import admin
+from settings import settings
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(admin.router)
+    return TestClient(app)
+
+
+def test_admin_is_closed_without_token(monkeypatch, client):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "")
+    assert client.get("/admin/ticks").status_code == 503
+    assert client.post("/admin/scheduler/pause", headers={"X-Admin-Token": ""}).status_code == 503
+
+
+def test_admin_requires_matching_token(monkeypatch, client):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "s3cret")
+    assert client.get("/admin/ticks").status_code == 401
+    assert client.get("/admin/ticks", headers={"X-Admin-Token": "bad"}).status_code == 401
+    assert client.get("/admin/ticks", headers={"X-Admin-Token": "s3cret"}).status_code == 200
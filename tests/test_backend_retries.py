@@ -0,0 +1,58 @@
+import httpx
+
+from settings import settings
+
+
+def test_transitions_are_not_retried_by_default(monkeypatch, http_backend):
+    monkeypatch.setattr(settings, "BACKEND_RETRY_BACKOFF_SECONDS", 0)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503)
+
+    assert not http_backend(handler, lambda client: client.start_event(1))
+    assert len(requests) == 1
+    assert requests[0].headers[settings.IDEMPOTENCY_HEADER].endswith(":start:1")
+
+
+def test_opt_in_retries_transitions(monkeypatch, http_backend):
+    monkeypatch.setattr(settings, "BACKEND_RETRY_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(settings, "IDEMPOTENCY_RETRY_POSTS", True)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503 if len(requests) == 1 else 200, json={"success": True})
+
+    assert http_backend(handler, lambda client: client.start_event(1))
+    assert len(requests) == 2
+
+
+def test_completion_is_not_resent_after_read_timeout(monkeypatch, http_backend):
+    monkeypatch.setattr(settings, "BACKEND_RETRY_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(settings, "IDEMPOTENCY_RETRY_POSTS", True)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        raise httpx.ReadTimeout("timeout", request=request)
+
+    # Se asume iniciada para que ni la cola ni el tick la reenvíen
+    assert http_backend(handler, lambda client: client.process_event_completion(9))
+    assert len(requests) == 1
+
+
+def test_completion_retries_connection_errors_when_enabled(monkeypatch, http_backend):
+    monkeypatch.setattr(settings, "BACKEND_RETRY_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(settings, "IDEMPOTENCY_RETRY_POSTS", True)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"message": "ok"})
+
+    assert http_backend(handler, lambda client: client.process_event_completion(9))
+    assert len(requests) == 2
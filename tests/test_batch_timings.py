@@ -0,0 +1,35 @@
+import json
+
+import httpx
+from prometheus_client import REGISTRY
+
+from scheduler.jobs.process_events import _record_batch_requests
+from settings import settings
+
+LATENCY_COUNT = "estado_eventos_transition_backend_duration_seconds_count"
+BATCH_EVENTS = "estado_eventos_batch_transition_events_total"
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_batch_latency_is_observed_once_per_request(monkeypatch, http_backend):
+    monkeypatch.setattr(settings, "BACKEND_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "IDEMPOTENCY_ENABLED", False)
+
+    def handler(request):
+        ids = json.loads(request.content)["event_ids"]
+        return httpx.Response(200, json={"results": [{"id": i, "success": True} for i in ids]})
+
+    timings = []
+    results = http_backend(handler, lambda client: client.start_events([1, 2, 3, 4, 5], timings))
+    assert all(results.values())
+    assert [events for events, _ in timings] == [2, 2, 1]
+
+    observed = sample(LATENCY_COUNT, phase="start", mode="batch")
+    counted = sample(BATCH_EVENTS, phase="start")
+    _record_batch_requests("start", timings)
+
+    assert sample(LATENCY_COUNT, phase="start", mode="batch") == observed + 3
+    assert sample(BATCH_EVENTS, phase="start") == counted + 5
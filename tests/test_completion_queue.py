@@ -0,0 +1,51 @@
+import asyncio
+
+from scheduler.completion_queue import CompletionQueue
+from scheduler.jobs import process_events
+from scheduler.jobs.process_events import TickSummary, trigger_completion
+
+
+def test_full_queue_defers_instead_of_processing_inline(monkeypatch, journal, backend):
+    queue = CompletionQueue()
+    queue.workers, queue.maxsize = 1, 1
+    monkeypatch.setattr(process_events, "completion_queue", queue)
+
+    async def main():
+        await queue.start()
+        summary = TickSummary()
+        for event_id in (1, 2, 3, 4):
+            await trigger_completion(summary, event_id)
+        deferred = queue.stats()["deferred"]
+        await queue.stop()
+        return summary, deferred
+
+    summary, deferred = asyncio.run(main())
+
+    assert summary.completion_queued == [1, 2, 3, 4]
+    assert summary.completion_ok == []
+    assert deferred > 0
+    # Los workers encolan los diferidos al liberarse espacio
+    assert backend["completion"] == [1, 2, 3, 4]
+
+
+def test_queued_completions_are_profiled(monkeypatch, journal, backend):
+    from scheduler import completion_queue as module
+    from scheduler.profiler import TickProfiler
+
+    profiler = TickProfiler()
+    monkeypatch.setattr(module, "tick_profiler", profiler)
+    queue = CompletionQueue()
+
+    async def main():
+        await queue.start()
+        profiler.arm(1)
+        profiler.begin_tick()
+        queue.enqueue(1)
+        profiler.end_tick()
+        # El worker procesa el evento después de terminar el tick perfilado
+        await queue.stop()
+
+    asyncio.run(main())
+
+    assert backend["completion"] == [1]
+    assert profiler.report()["spans"]["completion_queue"]["count"] == 1
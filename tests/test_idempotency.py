@@ -0,0 +1,76 @@
+import asyncio
+from types import SimpleNamespace
+
+from clients import idempotency
+from clients.idempotency import IdempotencyGuard, idempotency_key
+
+
+def test_key_is_deterministic_per_transition():
+    assert idempotency_key("svc", "start", 7) == idempotency_key("svc", "start", 7)
+    assert idempotency_key("svc", "start", 7) != idempotency_key("svc", "finish", 7)
+
+
+def test_concurrent_calls_share_one_request():
+    calls = []
+
+    async def main():
+        guard = IdempotencyGuard(ttl=60, max_entries=10)
+        release = asyncio.Event()
+
+        async def call():
+            calls.append(1)
+            await release.wait()
+            return True
+
+        first = asyncio.ensure_future(guard.run("k", call))
+        second = asyncio.ensure_future(guard.run("k", call))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second)
+        return results, guard.stats()
+
+    results, stats = asyncio.run(main())
+    assert results == [True, True]
+    assert calls == [1]
+    assert stats["collapsed"] == 1
+
+
+def test_successes_are_remembered_until_ttl(monkeypatch):
+    now = SimpleNamespace(value=0.0)
+    monkeypatch.setattr(idempotency, "time", SimpleNamespace(monotonic=lambda: now.value))
+    calls = []
+
+    async def call():
+        calls.append(1)
+        return True
+
+    guard = IdempotencyGuard(ttl=60, max_entries=10)
+    asyncio.run(guard.run("k", call))
+    asyncio.run(guard.run("k", call))
+    assert calls == [1]
+
+    now.value = 61
+    asyncio.run(guard.run("k", call))
+    assert calls == [1, 1]
+
+
+def test_failures_are_not_remembered():
+    async def fail():
+        return False
+
+    guard = IdempotencyGuard(ttl=60, max_entries=10)
+    assert not asyncio.run(guard.run("k", fail))
+    assert not guard.is_recent("k")
+
+
+def test_recent_keys_are_bounded():
+    guard = IdempotencyGuard(ttl=60, max_entries=2)
+
+    async def remember():
+        for key in ("a", "b", "c"):
+            guard.begin(key)
+            guard.finish(key, True)
+
+    asyncio.run(remember())
+    assert not guard.is_recent("a")
+    assert guard.is_recent("b") and guard.is_recent("c")
@@ -0,0 +1,49 @@
+import asyncio
+
+from scheduler import journal as journal_entries
+from scheduler.jobs.journal_replay import replay_journal
+
+
+def test_replay_pending_finish_triggers_completion(journal, backend):
+    journal.record(journal_entries.FINISH, [7], journal_entries.COMPLETION)
+
+    asyncio.run(replay_journal())
+
+    assert backend["finish"] == [7]
+    assert backend["completion"] == [7]
+    assert journal.pending() == {
+        journal_entries.START: [],
+        journal_entries.FINISH: [],
+        journal_entries.COMPLETION: [],
+    }
+
+
+def test_replay_pending_start(journal, backend):
+    journal.record(journal_entries.START, [3])
+
+    asyncio.run(replay_journal())
+
+    assert backend["start"] == [3]
+    assert journal.pending()[journal_entries.START] == []
+
+
+def test_replay_rejected_finish_of_completed_event_triggers_completion(journal, backend):
+    backend["finish_result"] = (False, "completado")
+    journal.record(journal_entries.FINISH, [7], journal_entries.COMPLETION)
+
+    asyncio.run(replay_journal())
+
+    assert backend["completion"] == [7]
+
+
+def test_replay_failed_finish_keeps_completion_pending(journal, backend):
+    backend["finish_result"] = (False, None)
+    journal.record(journal_entries.FINISH, [7], journal_entries.COMPLETION)
+
+    asyncio.run(replay_journal())
+    asyncio.run(replay_journal())
+
+    assert backend["finish"] == [7, 7]
+    assert backend["completion"] == []
+    assert journal.pending()[journal_entries.FINISH] == [7]
+    assert journal.pending()[journal_entries.COMPLETION] == [7]
@@ -0,0 +1,46 @@
+import asyncio
+
+from scheduler.leader import InMemoryLeaseStore, LeaderElector, StoreLease
+
+
+def elector(store: InMemoryLeaseStore, holder: str, acquired: list) -> LeaderElector:
+    lease = StoreLease(store, name="svc", holder=holder, ttl=30)
+    leader = LeaderElector(lease, holder, renew_interval=0.01)
+
+    async def record():
+        acquired.append(holder)
+
+    leader.on_acquired(record)
+    return leader
+
+
+def test_new_leader_runs_acquired_callbacks_after_failover():
+    async def main():
+        store, acquired = InMemoryLeaseStore(), []
+        first, second = elector(store, "a", acquired), elector(store, "b", acquired)
+        await first.start()
+        await second.start()
+        assert acquired == ["a"]
+
+        # El líder se detiene y la otra instancia toma el lease
+        await first.stop()
+        for _ in range(100):
+            if second.is_leader and acquired == ["a", "b"]:
+                break
+            await asyncio.sleep(0.01)
+        await second.stop()
+        return acquired
+
+    assert asyncio.run(main()) == ["a", "b"]
+
+
+def test_callbacks_run_at_start_without_election():
+    acquired = []
+
+    async def record():
+        acquired.append("local")
+
+    leader = LeaderElector(None, "local", renew_interval=1)
+    leader.on_acquired(record)
+    asyncio.run(leader.start())
+    assert acquired == ["local"]
@@ -0,0 +1,54 @@
+import httpx
+
+from settings import settings
+
+
+async def collect(client):
+    return [event.id async for page in client.iter_pending_start_events() for event in page]
+
+
+def test_delta_overflow_restarts_with_full_fetch(monkeypatch, http_backend):
+    monkeypatch.setattr(settings, "BACKEND_DELTA_FETCH", True)
+    monkeypatch.setattr(settings, "BACKEND_CACHE_MAX_EVENTS", 3)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if "updated_since" in request.url.params:
+            # Respuesta incremental que desborda la caché
+            return httpx.Response(200, json={"results": [{"id": 3}, {"id": 4}], "cursor": "c2"})
+        if len(requests) == 1:
+            return httpx.Response(200, json={"results": [{"id": 1}, {"id": 2}], "cursor": "c1"})
+        return httpx.Response(200, json={"results": [{"id": i} for i in range(1, 5)]})
+
+    async def twice(client):
+        return await collect(client), await collect(client)
+
+    first, second = http_backend(handler, twice)
+    assert first == [1, 2]
+    assert second == [1, 2, 3, 4]
+    assert [r.url.params.get("updated_since") for r in requests] == [None, "c1", None]
+
+
+def test_page_number_listing_is_not_shifted_by_transitions(http_backend):
+    pending = list(range(1, 7))
+
+    def handler(request):
+        # Paginación por número de página sobre los eventos aún pendientes
+        page, size = int(request.url.params.get("page", 1)), 2
+        chunk = pending[(page - 1) * size:page * size]
+        next_url = None
+        if page * size < len(pending):
+            next_url = str(request.url.copy_merge_params({"page": page + 1}))
+        return httpx.Response(200, json={"next": next_url, "results": [{"id": i} for i in chunk]})
+
+    async def start_all(client):
+        seen = []
+        async for page in client.iter_pending_start_events():
+            for event in page:
+                # El evento se inicia y deja de estar pendiente
+                seen.append(event.id)
+                pending.remove(event.id)
+        return seen
+
+    assert http_backend(handler, start_all) == [1, 2, 3, 4, 5, 6]
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta, timezone
+
+from clients.models import Event
+from scheduler.priority import TransitionQueue
+from scheduler.timeline import FINISH, START
+
+NOW = datetime.now(timezone.utc)
+
+
+def ago(minutes: int) -> datetime:
+    return NOW - timedelta(minutes=minutes)
+
+
+def test_most_overdue_transition_first():
+    queue = TransitionQueue()
+    queue.push(START, [Event(1, start_date=ago(1)), Event(2, start_date=ago(10))])
+    queue.push(FINISH, [Event(3, end_date=ago(5))])
+
+    assert [(t, e.id) for t, e in queue.pop(10)] == [(START, 2), (FINISH, 3), (START, 1)]
+
+
+def test_finish_waits_for_its_start():
+    queue = TransitionQueue()
+    event = Event(1, start_date=ago(5), end_date=ago(10))
+    queue.push(START, [event])
+    queue.push(FINISH, [event])
+
+    assert queue.pop(10) == [(START, event)]
+    queue.complete_starts([event], {1})
+    assert queue.pop(10) == [(FINISH, event)]
+
+
+def test_chained_finish_is_not_repeated_by_the_listing():
+    queue = TransitionQueue(chain_finish=True)
+    event = Event(1, start_date=ago(10), end_date=ago(5))
+    queue.push(START, [event])
+    assert queue.pop(10) == [(START, event)]
+    queue.complete_starts([event], {1})
+
+    # El listado de finalización llega después con el mismo evento
+    queue.push(FINISH, [Event(1, end_date=ago(5))])
+    assert [(t, e.id) for t, e in queue.pop(10)] == [(FINISH, 1)]
+    assert not queue
@@ -0,0 +1,49 @@
+import asyncio
+
+import httpx
+
+from clients.backend_api import backend_client
+from metrics import LAST_SUCCESSFUL_TICK
+from scheduler.jobs.process_events import process_events
+
+
+def test_unreachable_backend_fails_the_tick(monkeypatch, journal):
+    async def unreachable(kind, url):
+        raise httpx.ConnectError("connection refused")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(backend_client, "_iter_pending", unreachable)
+    LAST_SUCCESSFUL_TICK.set(0)
+
+    summary = asyncio.run(process_events())
+
+    assert summary.fetch_failed == ["start", "finish"]
+    assert summary.backlog == 0
+    assert LAST_SUCCESSFUL_TICK._value.get() == 0
+
+
+def test_prefetch_only_when_next_tick_is_due(monkeypatch):
+    from scheduler.jobs import process_events as module
+    from scheduler.monitor import scheduler_monitor
+    from settings import settings
+
+    async def fetch_all(phases):
+        return {phase: [] for phase in phases}
+
+    monkeypatch.setattr(module, "_fetch_all", fetch_all)
+    monkeypatch.setattr(scheduler_monitor, "interval", 60.0)
+    monkeypatch.setattr(settings, "PROCESS_EVENTS_PREFETCH_MAX_AGE_SECONDS", 10.0)
+
+    async def main():
+        summary = module.TickSummary()
+        module._start_prefetch(summary, module.PHASES, elapsed=5.0)
+        early = module._take_prefetch_task()
+        module._start_prefetch(summary, module.PHASES, elapsed=55.0)
+        due = module._take_prefetch_task()
+        if due is not None:
+            await due
+        return early, due
+
+    early, due = asyncio.run(main())
+    assert early is None
+    assert due is not None
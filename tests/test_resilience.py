@@ -0,0 +1,110 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from clients import resilience
+from clients.resilience import CLOSED, HALF_OPEN, OPEN, AdaptiveLimiter, CircuitBreaker, backoff_delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Reloj monotónico controlado por el test."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(resilience, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    breaker.record_failure("503")
+    breaker.record_success()
+    for _ in range(2):
+        breaker.record_failure("503")
+    assert breaker.state == CLOSED
+
+    breaker.record_failure("503")
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    assert breaker.snapshot()["rejected_requests"] == 1
+
+
+def test_breaker_half_open_allows_limited_probes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, half_open_max_calls=1)
+    breaker.record_failure("timeout")
+
+    clock.value += 30
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    # Una prueba cancelada devuelve su turno
+    breaker.release()
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_breaker_reopens_when_probe_fails(clock):
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+    for _ in range(5):
+        breaker.record_failure("503")
+    clock.value += 30
+    assert breaker.allow_request()
+
+    breaker.record_failure("503")
+    assert breaker.state == OPEN
+    assert breaker.snapshot()["retry_in_seconds"] == 30
+
+
+def test_limiter_grows_additively_when_saturated(clock):
+    async def main():
+        limiter = AdaptiveLimiter(initial=2, minimum=1, maximum=10)
+        for _ in range(4):
+            await limiter.acquire()
+            await limiter.acquire()
+            clock.value += 1
+            limiter.release(0.1, overloaded=False)
+            limiter.release(0.1, overloaded=False)
+        return limiter.limit
+
+    assert 2 < asyncio.run(main()) <= 4
+
+
+def test_limiter_backs_off_once_per_round_trip(clock):
+    limiter = AdaptiveLimiter(initial=8, minimum=1, maximum=10)
+
+    async def fail_burst():
+        for _ in range(3):
+            await limiter.acquire()
+        for _ in range(3):
+            limiter.release(0.5, overloaded=True)
+
+    asyncio.run(fail_burst())
+    # La ráfaga de la misma ventana cuenta una sola vez
+    assert limiter.limit == 4
+    clock.value += 1
+    asyncio.run(fail_burst())
+    assert limiter.limit == 2
+    assert limiter.snapshot()["decreases"] == 2
+
+
+def test_limiter_queues_requests_over_the_limit():
+    async def main():
+        limiter = AdaptiveLimiter(initial=1, minimum=1, maximum=1)
+        assert not await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        limiter.release()
+        return await waiter, limiter.in_flight
+
+    throttled, in_flight = asyncio.run(main())
+    assert throttled
+    assert in_flight == 1
+
+
+def test_backoff_honours_retry_after_and_cap():
+    assert backoff_delay(0, base=1, cap=10, retry_after="3") == 3
+    assert backoff_delay(0, base=1, cap=10, retry_after="120") == 10
+    assert all(0 <= backoff_delay(5, base=1, cap=10) <= 10 for _ in range(50))
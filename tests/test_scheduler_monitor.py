@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_SUBMITTED, JobSubmissionEvent
+
+from scheduler import bootstrap
+from scheduler.monitor import SchedulerMonitor
+
+START = datetime(2025, 11, 11, 10, 0, 0)
+
+
+def run_at(minutes: int) -> datetime:
+    return START + timedelta(minutes=minutes)
+
+
+def submit(code: int, *run_times: datetime):
+    bootstrap._on_job_event(JobSubmissionEvent(code, "process_events", "default", list(run_times)))
+
+
+def test_coalesced_runs_are_recorded(monkeypatch):
+    monitor = SchedulerMonitor(max_events=10, max_reports=10)
+    monitor.interval = 60
+    monkeypatch.setattr(bootstrap, "scheduler_monitor", monitor)
+
+    submit(EVENT_JOB_SUBMITTED, run_at(0))
+    submit(EVENT_JOB_SUBMITTED, run_at(1))
+    # Las ejecuciones de los minutos 2 a 4 se agruparon en la del minuto 5
+    submit(EVENT_JOB_SUBMITTED, run_at(5))
+    submit(EVENT_JOB_MAX_INSTANCES, run_at(6))
+    submit(EVENT_JOB_SUBMITTED, run_at(7))
+
+    assert monitor.counts["coalesced"] == 3
+    assert monitor.counts["max_instances"] == 1
+    assert [event["type"] for event in monitor.events] == ["coalesced", "max_instances"]
+
+
+def test_interval_change_does_not_count_as_coalesced():
+    monitor = SchedulerMonitor(max_events=10, max_reports=10)
+    monitor.interval = 60
+    monitor.record_run_times([run_at(0)])
+    monitor.set_interval(30, "backlog")
+    monitor.record_run_times([run_at(10)])
+
+    assert monitor.counts["coalesced"] == 0
+
+
+def test_adaptive_interval_is_disabled_in_deadline_mode(monkeypatch):
+    import asyncio
+
+    from scheduler.monitor import scheduler_monitor
+    from settings import settings
+
+    monkeypatch.setattr(settings, "SCHEDULER_ADAPTIVE_ENABLED", True)
+    monkeypatch.setattr(settings, "SCHEDULER_DEADLINE_ENABLED", True)
+    monkeypatch.setattr(bootstrap.deadline_runner, "start", lambda loop: None)
+
+    async def main():
+        bootstrap.init_scheduler()
+        try:
+            return scheduler_monitor.adaptive, scheduler_monitor.interval
+        finally:
+            await bootstrap.shutdown_scheduler()
+
+    adaptive, interval = asyncio.run(main())
+    assert not adaptive
+    assert interval == settings.SCHEDULER_RECONCILE_INTERVAL_SECONDS
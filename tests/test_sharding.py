@@ -0,0 +1,45 @@
+from clients.models import Event
+from scheduler.sharding import HashRing, ShardAssignment
+
+
+def sharded(monkeypatch, index: int = 0, count: int = 3) -> ShardAssignment:
+    from settings import settings
+
+    monkeypatch.setattr(settings, "SHARDING_ENABLED", True)
+    monkeypatch.setattr(settings, "SHARD_MEMBERSHIP_FILE", "")
+    monkeypatch.setattr(settings, "SHARD_INDEX", index)
+    monkeypatch.setattr(settings, "SHARD_COUNT", count)
+    return ShardAssignment()
+
+
+def test_ring_moves_only_the_removed_members_keys():
+    before = HashRing(["a", "b", "c"], 64)
+    after = HashRing(["a", "b"], 64)
+    for key in range(1000):
+        if before.owner(key) != "c":
+            assert after.owner(key) == before.owner(key)
+
+
+def test_each_event_has_exactly_one_owner(monkeypatch):
+    events = [Event(event_id) for event_id in range(300)]
+    owned = [
+        {event.id for event in sharded(monkeypatch, index).filter(events)} for index in range(3)
+    ]
+    assert sum(len(ids) for ids in owned) == 300
+    assert set().union(*owned) == set(range(300))
+
+
+def test_only_ticks_count_towards_per_shard_events(monkeypatch):
+    assignment = sharded(monkeypatch)
+    events = [Event(event_id) for event_id in range(30)]
+
+    assignment.begin_tick()
+    assignment.filter(events)
+    assignment.filter(events, source="webhook")
+    assignment.end_tick()
+    assignment.filter(events, source="deadline")
+
+    stats = assignment.stats()
+    assert sum(stats["last_tick_events_per_shard"].values()) == 30
+    assert stats["owned_total"]["tick"] == stats["owned_total"]["webhook"]
+    assert set(stats["skipped_total"]) == {"tick", "webhook", "deadline"}
@@ -0,0 +1,19 @@
+import asyncio
+
+import pytest
+
+from settings import settings
+
+
+def test_sharding_and_leader_election_are_rejected(monkeypatch):
+    from main import app, lifespan
+
+    monkeypatch.setattr(settings, "SHARDING_ENABLED", True)
+    monkeypatch.setattr(settings, "LEADER_ELECTION_ENABLED", True)
+
+    async def start():
+        async with lifespan(app):
+            pass  # pragma: no cover
+
+    with pytest.raises(RuntimeError, match="SHARDING_ENABLED"):
+        asyncio.run(start())
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+from clients.models import Event
+from scheduler.timeline import FINISH, START, EventTimeline
+
+NOW = datetime(2025, 11, 11, 10, 0, tzinfo=timezone.utc)
+
+
+def at(minutes: int) -> datetime:
+    return NOW + timedelta(minutes=minutes)
+
+
+def test_due_transitions_come_out_in_deadline_order():
+    timeline = EventTimeline()
+    timeline.upsert_event(Event(1, "programado", at(10), at(60)))
+    timeline.upsert_event(Event(2, "en_progreso", at(-30), at(5)))
+
+    assert timeline.next_deadline() == at(5).timestamp()
+    due = timeline.pop_due(at(30).timestamp())
+    assert [(transition, event.id) for transition, event in due] == [(FINISH, 2), (START, 1)]
+    assert len(timeline) == 1
+
+
+def test_rescheduling_discards_the_stale_entry():
+    timeline = EventTimeline()
+    timeline.upsert_event(Event(1, "programado", at(10), at(60)))
+    timeline.upsert_event(Event(1, "programado", at(20), at(60)))
+
+    assert timeline.pop_due(at(15).timestamp()) == []
+    assert [t for t, _ in timeline.pop_due(at(20).timestamp())] == [START]
+
+
+def test_status_decides_which_transitions_are_scheduled():
+    timeline = EventTimeline()
+    timeline.upsert_event(Event(1, "programado", at(10), at(60)))
+    timeline.upsert_event(Event(1, "completado", at(10), at(60)))
+    assert len(timeline) == 0
+    assert timeline.stats()["tracked_events"] == 0
+
+
+def test_remove_and_retain_cancel_transitions():
+    timeline = EventTimeline()
+    for event_id in (1, 2, 3):
+        timeline.upsert_event(Event(event_id, "en_progreso", at(-10), at(event_id)))
+    timeline.remove_event(1)
+    # El evento 2 ya no viene en la ventana consultada al backend
+    timeline.retain({3}, at(10).timestamp())
+
+    assert [event.id for _, event in timeline.pop_due(at(10).timestamp())] == [3]
+
+
+def test_merge_keeps_known_fields():
+    timeline = EventTimeline()
+    timeline.upsert_event(Event(1, "programado", at(10), at(60)))
+
+    merged = timeline.merge_event(Event(1, "programado", end_date=at(90)), {"status", "end_date"})
+
+    assert (merged.start_date, merged.end_date) == (at(10), at(90))
@@ -0,0 +1,82 @@
+import hashlib
+import hmac
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from clients.models import Event
+from routers import webhooks
+from scheduler.jobs.deadline_events import DeadlineRunner
+from scheduler.push import push_ingestor
+from scheduler.timeline import EventTimeline
+from settings import settings
+
+START_DATE = datetime.now(timezone.utc) + timedelta(hours=1)
+END_DATE = START_DATE + timedelta(hours=2)
+
+
+@pytest.fixture
+def notify(monkeypatch):
+    """Envía notificaciones firmadas a una línea de tiempo vacía."""
+    monkeypatch.setattr(settings, "WEBHOOK_SECRET", "s3cret")
+    monkeypatch.setattr(DeadlineRunner, "is_running", property(lambda self: True))
+    monkeypatch.setattr(push_ingestor, "timeline", EventTimeline())
+    app = FastAPI()
+    app.include_router(webhooks.router)
+    client = TestClient(app)
+
+    def post(payload):
+        body = json.dumps(payload).encode()
+        signature = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+        return client.post(
+            "/webhooks/events", content=body, headers={"X-Webhook-Signature": f"sha256={signature}"}
+        )
+
+    return post
+
+
+def test_signature_required_without_secret(monkeypatch):
+    monkeypatch.setattr(settings, "WEBHOOK_SECRET", "")
+    with pytest.raises(HTTPException) as error:
+        webhooks._verify_signature(b"{}", None)
+    assert error.value.status_code == 503
+
+
+def test_invalid_signature_is_rejected(monkeypatch):
+    monkeypatch.setattr(settings, "WEBHOOK_SECRET", "s3cret")
+    app = FastAPI()
+    app.include_router(webhooks.router)
+    body = b'{"action": "deleted", "event": {"id": 1}}'
+
+    response = TestClient(app).post(
+        "/webhooks/events", content=body, headers={"X-Webhook-Signature": "sha256=bad"}
+    )
+    assert response.status_code == 401
+
+    signature = hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+    webhooks._verify_signature(body, f"sha256={signature}")
+
+
+def test_invalid_notifications_are_rejected(notify):
+    bad_date = {"id": 1, "status": "programado", "start_date": "mañana"}
+    assert notify({"action": "created", "event": bad_date}).status_code == 422
+    assert notify({"action": "rescheduled", "event": {"id": 1}}).status_code == 422
+    assert notify({"action": "deleted", "event": {"id": 1}}).status_code == 200
+
+
+def test_partial_notification_keeps_known_fields(notify):
+    timeline = push_ingestor.timeline
+    timeline.upsert_event(Event(1, "programado", START_DATE, END_DATE))
+    later = END_DATE + timedelta(hours=1)
+
+    response = notify(
+        {"action": "rescheduled", "event": {"id": 1, "status": "programado", "end_date": later.isoformat()}}
+    )
+
+    assert response.status_code == 200
+    assert len(timeline) == 2
+    assert timeline.next_deadline() == START_DATE.timestamp()
+    assert timeline._entries[(1, "finish")][0] == later.timestamp()